@@ -1,15 +1,26 @@
 """Configuration management for GOTS."""
+import json
 import os
 import re
-from dataclasses import dataclass
+from dataclasses import MISSING, dataclass, fields
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple, Union
 
 import yaml
 from dotenv import load_dotenv
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _YamlLoader  # type: ignore[assignment]
 
-@dataclass
+_SCHEME_RE = re.compile(r"^https?://")
+_ENV_VAR_RE = re.compile(r"\$\{([^}]+)\}")
+_VALID_LEVELS = frozenset({"DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"})
+_VALID_FORMATS = frozenset({"json", "text"})
+
+
+@dataclass(slots=True)
 class OktaOAuthConfig:
     """Okta OAuth 2.0 configuration."""
 
@@ -43,7 +54,7 @@ class OktaOAuthConfig:
                 raise ValueError("private_key_path is required for private_key_jwt")
 
 
-@dataclass
+@dataclass(slots=True)
 class OktaConfig:
     """Okta API configuration."""
 
@@ -58,7 +69,9 @@ class OktaConfig:
             raise ValueError("Okta domain is required")
 
         # Remove protocol if present
-        self.domain = self.domain.replace("https://", "").replace("http://", "")
+        scheme = _SCHEME_RE.match(self.domain)
+        if scheme:
+            self.domain = self.domain[scheme.end() :]
 
         # Validate auth method
         valid_auth_methods = ["api_token", "oauth"]
@@ -76,7 +89,7 @@ class OktaConfig:
                 raise ValueError("OAuth configuration is required when using oauth auth method")
 
 
-@dataclass
+@dataclass(slots=True)
 class GrafanaConfig:
     """Grafana API configuration."""
 
@@ -90,11 +103,11 @@ class GrafanaConfig:
         if not self.api_key:
             raise ValueError("Grafana API key is required")
         # Ensure URL has protocol
-        if not self.url.startswith(("http://", "https://")):
+        if not _SCHEME_RE.match(self.url):
             self.url = f"https://{self.url}"
 
 
-@dataclass
+@dataclass(slots=True)
 class GroupMapping:
     """Mapping between Okta group and Grafana team."""
 
@@ -115,7 +128,7 @@ class GroupMapping:
             raise ValueError(f"grafana_role must be one of {valid_roles}, got: {self.grafana_role}")
 
 
-@dataclass
+@dataclass(slots=True)
 class SyncConfig:
     """Synchronization configuration."""
 
@@ -123,6 +136,7 @@ class SyncConfig:
     dry_run: bool = False
     mappings: Optional[List[GroupMapping]] = None
     admin_groups: Optional[List[str]] = None  # Okta groups for Grafana admin privileges
+    max_workers: int = 8  # Concurrent API requests per sync step
 
     def __post_init__(self) -> None:
         """Validate sync configuration."""
@@ -132,11 +146,13 @@ class SyncConfig:
             self.admin_groups = []
         if self.interval_seconds < 60:
             raise ValueError("Sync interval must be at least 60 seconds")
+        if self.max_workers < 1:
+            raise ValueError("Sync max_workers must be at least 1")
         if not self.mappings:
             raise ValueError("At least one group mapping is required")
 
 
-@dataclass
+@dataclass(slots=True)
 class LoggingConfig:
     """Logging configuration."""
 
@@ -145,18 +161,16 @@ class LoggingConfig:
 
     def __post_init__(self) -> None:
         """Validate logging configuration."""
-        valid_levels = ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]
-        if self.level.upper() not in valid_levels:
-            raise ValueError(f"Log level must be one of: {valid_levels}")
+        if self.level.upper() not in _VALID_LEVELS:
+            raise ValueError(f"Log level must be one of: {sorted(_VALID_LEVELS)}")
         self.level = self.level.upper()
 
-        valid_formats = ["json", "text"]
-        if self.format.lower() not in valid_formats:
-            raise ValueError(f"Log format must be one of: {valid_formats}")
+        if self.format.lower() not in _VALID_FORMATS:
+            raise ValueError(f"Log format must be one of: {sorted(_VALID_FORMATS)}")
         self.format = self.format.lower()
 
 
-@dataclass
+@dataclass(slots=True)
 class MetricsConfig:
     """Metrics server configuration."""
 
@@ -170,7 +184,7 @@ class MetricsConfig:
             raise ValueError("Metrics port must be between 1 and 65535")
 
 
-@dataclass
+@dataclass(slots=True)
 class Config:
     """Main configuration class."""
 
@@ -188,32 +202,143 @@ class Config:
             self.metrics = MetricsConfig()
 
 
+def _load_document(content: Union[str, bytes]) -> Dict[str, Any]:
+    """
+    Parse a configuration document, using json.loads for JSON objects.
+
+    JSON is a subset of YAML, so documents that start with '{' are tried with the
+    C JSON parser first; anything it rejects (e.g. a YAML flow mapping) goes to YAML.
+
+    Args:
+        content: YAML or JSON configuration document
+
+    Returns:
+        Parsed configuration dictionary
+    """
+    if content.lstrip()[:1] in ("{", b"{"):
+        try:
+            return json.loads(content) or {}
+        except ValueError:
+            pass
+    return yaml.load(content, Loader=_YamlLoader) or {}
+
+
+def _env_bool(value: str) -> bool:
+    """
+    Parse a boolean flag from an environment variable or stringified YAML value.
+
+    Args:
+        value: Flag value such as "true", "False", "1" or "yes"
+
+    Returns:
+        True if the value is one of true/1/yes/on (case-insensitive), else False
+    """
+    return value.strip().lower() in ("true", "1", "yes", "on")
+
+
+def _dataclass_kwargs(cls: type, values: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Select the entries of a config section that are fields of a config dataclass.
+
+    Unknown keys are ignored, as they were when fields were read one by one.
+
+    Args:
+        cls: Config dataclass to build keyword arguments for
+        values: Config section as parsed from YAML
+
+    Returns:
+        Keyword arguments for constructing cls
+
+    Raises:
+        KeyError: If a field without a default is missing from values
+    """
+    kwargs: Dict[str, Any] = {}
+    for field in fields(cls):
+        if field.name in values:
+            kwargs[field.name] = values[field.name]
+        elif field.default is MISSING and field.default_factory is MISSING:
+            raise KeyError(field.name)
+    return kwargs
+
+
+def _parse_scopes(value: str) -> Optional[List[str]]:
+    """Parse a comma-separated scope list, ignoring an empty value."""
+    return [s.strip() for s in value.split(",")] if value else None
+
+
+# Environment variable overrides: (variable, path in the config dict, parser).
+# Values are stored as strings; type conversion happens when building the config.
+_ENV_OVERRIDES: Tuple[Tuple[str, Tuple[str, ...], Callable[[str], Any]], ...] = (
+    ("OKTA_DOMAIN", ("okta", "domain"), str),
+    ("OKTA_AUTH_METHOD", ("okta", "auth_method"), str),
+    ("OKTA_API_TOKEN", ("okta", "api_token"), str),
+    ("OKTA_CLIENT_ID", ("okta", "oauth", "client_id"), str),
+    ("OKTA_CLIENT_SECRET", ("okta", "oauth", "client_secret"), str),
+    ("OKTA_PRIVATE_KEY_PATH", ("okta", "oauth", "private_key_path"), str),
+    ("OKTA_TOKEN_ENDPOINT_AUTH_METHOD", ("okta", "oauth", "token_endpoint_auth_method"), str),
+    ("OKTA_JWT_KEY_ID", ("okta", "oauth", "jwt_key_id"), str),
+    ("OKTA_SCOPES", ("okta", "oauth", "scopes"), _parse_scopes),
+    ("GRAFANA_URL", ("grafana", "url"), str),
+    ("GRAFANA_API_KEY", ("grafana", "api_key"), str),
+    ("SYNC_INTERVAL_SECONDS", ("sync", "interval_seconds"), str),
+    ("SYNC_DRY_RUN", ("sync", "dry_run"), str),
+    ("SYNC_MAX_WORKERS", ("sync", "max_workers"), str),
+    ("LOG_LEVEL", ("logging", "level"), str),
+    ("LOG_FORMAT", ("logging", "format"), str),
+    ("METRICS_ENABLED", ("metrics", "enabled"), str),
+    ("METRICS_PORT", ("metrics", "port"), str),
+    ("METRICS_HOST", ("metrics", "host"), str),
+)
+
+
+def _apply_env_overrides(config_dict: Dict[str, Any], env: Mapping[str, str]) -> None:
+    """
+    Apply environment variable overrides to a configuration dictionary in place.
+
+    Args:
+        config_dict: Configuration dictionary to update (must not be shared)
+        env: Snapshot of the environment variables
+    """
+    for env_key, path, parse in _ENV_OVERRIDES:
+        if env_key not in env:
+            continue
+        value = parse(env[env_key])
+        if value is None:
+            continue
+        node = config_dict
+        for key in path[:-1]:
+            if not isinstance(node.get(key), dict):
+                node[key] = {}
+            node = node[key]
+        node[path[-1]] = value
+
+
 class ConfigLoader:
     """Load configuration from YAML file and environment variables."""
 
     @staticmethod
-    def _expand_env_vars(value: Any) -> Any:
+    def _expand_env_vars(value: Any, env: Optional[Mapping[str, str]] = None) -> Any:
         """
         Recursively expand environment variables in configuration values.
 
         Args:
             value: Configuration value to expand
+            env: Environment variables to expand from. Defaults to os.environ
 
         Returns:
             Value with environment variables expanded
         """
+        if env is None:
+            env = os.environ
         if isinstance(value, str):
             # Replace ${VAR_NAME} with environment variable value
-            pattern = r"\$\{([^}]+)\}"
-            matches = re.findall(pattern, value)
-            for match in matches:
-                env_value = os.getenv(match, "")
-                value = value.replace(f"${{{match}}}", env_value)
-            return value
+            if "${" not in value:
+                return value
+            return _ENV_VAR_RE.sub(lambda m: env.get(m.group(1), ""), value)
         if isinstance(value, dict):
-            return {k: ConfigLoader._expand_env_vars(v) for k, v in value.items()}
+            return {k: ConfigLoader._expand_env_vars(v, env) for k, v in value.items()}
         if isinstance(value, list):
-            return [ConfigLoader._expand_env_vars(item) for item in value]
+            return [ConfigLoader._expand_env_vars(item, env) for item in value]
         return value
 
     @staticmethod
@@ -237,111 +362,139 @@ class ConfigLoader:
         load_dotenv()
 
         # Load YAML config if path provided
-        config_dict: Dict[str, Any] = {}
+        parsed: Dict[str, Any] = {}
         if config_path:
             path = Path(config_path)
             if not path.exists():
                 raise FileNotFoundError(f"Configuration file not found: {config_path}")
 
-            with open(path, "r", encoding="utf-8") as f:
-                config_dict = yaml.safe_load(f) or {}
+            # json and both YAML loaders detect and decode the encoding of byte input themselves
+            parsed = _load_document(path.read_bytes())
+
+        return ConfigLoader._from_parsed(parsed, dict(os.environ))
+
+    @staticmethod
+    def load_from_string(content: Union[str, bytes]) -> Config:
+        """
+        Load configuration from YAML text and environment variables.
+
+        Environment variables take precedence over the YAML content.
+
+        Args:
+            content: YAML configuration document
+
+        Returns:
+            Config object
+
+        Raises:
+            yaml.YAMLError: If the content is not valid YAML
+            ValueError: If configuration is invalid
+        """
+        # Load .env file if present
+        load_dotenv()
+
+        return ConfigLoader._from_parsed(_load_document(content), dict(os.environ))
+
+    @staticmethod
+    def _from_parsed(parsed: Dict[str, Any], env: Mapping[str, str]) -> Config:
+        """
+        Build a Config from parsed YAML and a snapshot of the environment.
+
+        Args:
+            parsed: Parsed YAML document; left unmodified
+            env: Environment variables used for expansion and overrides
+
+        Returns:
+            Config object
 
-            # Expand environment variables in config
-            config_dict = ConfigLoader._expand_env_vars(config_dict)
+        Raises:
+            ValueError: If configuration is invalid
+        """
+        # Expand environment variables in config (builds new containers)
+        config_dict = ConfigLoader._expand_env_vars(parsed, env)
 
         # Override with environment variables
+        _apply_env_overrides(config_dict, env)
+        return ConfigLoader._build_config(config_dict)
+
+    @staticmethod
+    def _build_config(config_dict: Dict[str, Any]) -> Config:
+        """
+        Build a Config object from a fully expanded configuration dictionary.
+
+        Args:
+            config_dict: Configuration dictionary with environment overrides applied
+
+        Returns:
+            Config object
+
+        Raises:
+            ValueError: If configuration is invalid
+        """
         okta_dict = config_dict.get("okta", {})
-        auth_method = os.getenv("OKTA_AUTH_METHOD", okta_dict.get("auth_method", "api_token"))
+        auth_method = okta_dict.get("auth_method", "api_token")
 
         # Build OAuth config if using oauth auth method
         oauth_config = None
         if auth_method == "oauth":
             oauth_dict = okta_dict.get("oauth", {})
-            client_id = os.getenv("OKTA_CLIENT_ID", oauth_dict.get("client_id", ""))
-            client_secret = os.getenv("OKTA_CLIENT_SECRET", oauth_dict.get("client_secret", ""))
-            private_key_path = os.getenv(
-                "OKTA_PRIVATE_KEY_PATH", oauth_dict.get("private_key_path", "")
-            )
-            token_endpoint_auth_method = os.getenv(
-                "OKTA_TOKEN_ENDPOINT_AUTH_METHOD",
-                oauth_dict.get("token_endpoint_auth_method", "client_secret_basic"),
-            )
-            jwt_key_id = os.getenv("OKTA_JWT_KEY_ID", oauth_dict.get("jwt_key_id", ""))
-
-            # Parse scopes - can be comma-separated string from env or list from YAML
-            scopes_env = os.getenv("OKTA_SCOPES", "")
-            if scopes_env:
-                scopes = [s.strip() for s in scopes_env.split(",")]
-            else:
-                scopes = oauth_dict.get("scopes", [])
-
-            # Convert empty strings to None for optional fields
-            client_secret = client_secret if client_secret else None
-            private_key_path = private_key_path if private_key_path else None
-            jwt_key_id = jwt_key_id if jwt_key_id else None
-
             oauth_config = OktaOAuthConfig(
-                client_id=client_id,
-                client_secret=client_secret,
-                private_key_path=private_key_path,
-                token_endpoint_auth_method=token_endpoint_auth_method,
-                scopes=scopes,
-                jwt_key_id=jwt_key_id,
+                client_id=oauth_dict.get("client_id", ""),
+                # Convert empty strings to None for optional fields
+                client_secret=oauth_dict.get("client_secret") or None,
+                private_key_path=oauth_dict.get("private_key_path") or None,
+                token_endpoint_auth_method=oauth_dict.get(
+                    "token_endpoint_auth_method", "client_secret_basic"
+                ),
+                scopes=oauth_dict.get("scopes", []),
+                jwt_key_id=oauth_dict.get("jwt_key_id") or None,
             )
 
-        # Get api_token, convert empty string to None for optional field
-        api_token_value = os.getenv("OKTA_API_TOKEN", okta_dict.get("api_token", ""))
-        api_token = api_token_value if api_token_value else None
-
         okta_config = OktaConfig(
-            domain=os.getenv("OKTA_DOMAIN", okta_dict.get("domain", "")),
+            domain=okta_dict.get("domain", ""),
             auth_method=auth_method,
-            api_token=api_token,
+            # Convert empty string to None for optional field
+            api_token=okta_dict.get("api_token") or None,
             oauth=oauth_config,
         )
 
+        grafana_dict = config_dict.get("grafana", {})
         grafana_config = GrafanaConfig(
-            url=os.getenv("GRAFANA_URL", config_dict.get("grafana", {}).get("url", "")),
-            api_key=os.getenv("GRAFANA_API_KEY", config_dict.get("grafana", {}).get("api_key", "")),
+            url=grafana_dict.get("url", ""),
+            api_key=grafana_dict.get("api_key", ""),
         )
 
         # Sync config
         sync_dict = config_dict.get("sync", {})
-        interval = int(os.getenv("SYNC_INTERVAL_SECONDS", sync_dict.get("interval_seconds", 300)))
-        dry_run = os.getenv("SYNC_DRY_RUN", str(sync_dict.get("dry_run", False))).lower() == "true"
-
-        mappings = []
-        for mapping in sync_dict.get("mappings", []):
-            mappings.append(
-                GroupMapping(
-                    okta_group=mapping["okta_group"],
-                    grafana_team=mapping["grafana_team"],
-                    grafana_role=mapping.get("grafana_role", "Viewer"),
-                )
-            )
+        interval = int(sync_dict.get("interval_seconds", 300))
+        dry_run = _env_bool(str(sync_dict.get("dry_run", False)))
+        max_workers = int(sync_dict.get("max_workers", 8))
+
+        mappings = [
+            GroupMapping(**_dataclass_kwargs(GroupMapping, mapping))
+            for mapping in sync_dict.get("mappings", [])
+        ]
 
         admin_groups = sync_dict.get("admin_groups", [])
 
         sync_config = SyncConfig(
-            interval_seconds=interval, dry_run=dry_run, mappings=mappings, admin_groups=admin_groups
+            interval_seconds=interval,
+            dry_run=dry_run,
+            mappings=mappings,
+            admin_groups=admin_groups,
+            max_workers=max_workers,
         )
 
         # Logging config
         logging_dict = config_dict.get("logging", {})
-        logging_config = LoggingConfig(
-            level=os.getenv("LOG_LEVEL", logging_dict.get("level", "INFO")),
-            format=os.getenv("LOG_FORMAT", logging_dict.get("format", "json")),
-        )
+        logging_config = LoggingConfig(**_dataclass_kwargs(LoggingConfig, logging_dict))
 
         # Metrics config
         metrics_dict = config_dict.get("metrics", {})
-        metrics_enabled = (
-            os.getenv("METRICS_ENABLED", str(metrics_dict.get("enabled", False))).lower() == "true"
-        )
-        metrics_port = int(os.getenv("METRICS_PORT", metrics_dict.get("port", 8000)))
-        metrics_host = os.getenv("METRICS_HOST", metrics_dict.get("host", "0.0.0.0"))
         metrics_config = MetricsConfig(
-            enabled=metrics_enabled, port=metrics_port, host=metrics_host
+            enabled=_env_bool(str(metrics_dict.get("enabled", False))),
+            port=int(metrics_dict.get("port", 8000)),
+            host=metrics_dict.get("host", "0.0.0.0"),
         )
 
         return Config(
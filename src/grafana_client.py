@@ -4,6 +4,7 @@ import logging
 from typing import Any, Dict, List, Optional
 
 import requests
+from requests.adapters import HTTPAdapter
 from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_exponential
 
 logger = logging.getLogger(__name__)
@@ -28,17 +29,24 @@ class GrafanaConflictError(GrafanaAPIError):
 class GrafanaClient:
     """Client for interacting with Grafana API."""
 
-    def __init__(self, url: str, api_key: str) -> None:
+    def __init__(self, url: str, api_key: str, pool_maxsize: int = 10) -> None:
         """
         Initialize Grafana client.
 
         Args:
             url: Grafana URL (e.g., 'https://grafana.example.com')
             api_key: Grafana API key (service account token)
+            pool_maxsize: Number of keep-alive connections to hold open to Grafana
         """
         self.base_url = url.rstrip("/")
         self.api_key = api_key
         self.session = requests.Session()
+        # All requests go to a single host, so one pool sized for concurrent callers
+        # lets every call reuse an open keep-alive connection instead of a new handshake.
+        # Retries are handled by tenacity, not urllib3.
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_maxsize)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
         self.session.headers.update(
             {
                 "Authorization": f"Bearer {api_key}",
@@ -289,6 +297,20 @@ class GrafanaClient:
         logger.info("Found %d members in team %s", len(members), team_id)
         return members  # type: ignore[no-any-return]
 
+    def get_org_users(self) -> List[Dict[str, Any]]:
+        """
+        Get all users of the current organization.
+
+        Returns:
+            List of org user objects with 'userId', 'email', 'login', 'role',
+            'isGrafanaAdmin', etc.
+        """
+        response = self._get("/api/org/users")
+        users = response.json()
+
+        logger.debug("Found %d users in Grafana organization", len(users))
+        return users  # type: ignore[no-any-return]
+
     def get_user_by_email(self, email: str) -> Optional[Dict[str, Any]]:
         """
         Get Grafana user by email.
@@ -307,8 +329,7 @@ class GrafanaClient:
         try:
             # Use org/users endpoint which requires org.users:read permission
             # instead of /api/users/lookup which requires users:read
-            response = self._get("/api/org/users")
-            users = response.json()
+            users = self.get_org_users()
 
             # Search for user by email
             for user in users:
@@ -1,11 +1,11 @@
 """Main application entry point and scheduler."""
 
-import json
 import logging
 import signal
 import sys
 import time
-from typing import NoReturn, Optional
+from json.encoder import encode_basestring_ascii
+from typing import Dict, NoReturn, Optional
 
 import schedule
 
@@ -20,6 +20,74 @@ shutdown_requested = False
 # Global metrics server for graceful shutdown
 metrics_server: Optional[MetricsServer] = None
 
+# Startup banners, rendered once so print_banner issues a single write
+_BANNER_NORMAL = """
+╔═══════════════════════════════════════════════════════════╗
+║                                                           ║
+║   Grafana-Okta Team Sync (GOTS)                           ║
+║   Automated team synchronization service                  ║
+║                                                           ║
+╚═══════════════════════════════════════════════════════════╝
+
+"""
+_BANNER_DRYRUN = _BANNER_NORMAL + "⚠️  DRY RUN MODE - No changes will be made\n\n"
+
+
+class JsonFormatter(logging.Formatter):
+    """Custom JSON formatter for structured logging.
+
+    The fixed key fragments are serialized once and only the per-record values
+    are encoded, which avoids building and encoding a dict for every record.
+    Non-ASCII characters are escaped, so any text (even a lone surrogate) can
+    be written to any log stream.
+    """
+
+    _TIMESTAMP = '{"timestamp":'
+    _LEVEL = ',"level":'
+    _LOGGER = ',"logger":'
+    _MESSAGE = ',"message":'
+    _EXCEPTION = ',"exception":'
+
+    def __init__(self, fmt: Optional[str] = None, datefmt: Optional[str] = None) -> None:
+        """
+        Initialize JSON formatter.
+
+        Args:
+            fmt: Unused format string, accepted for logging.Formatter compatibility
+            datefmt: Date format passed to formatTime
+        """
+        super().__init__(fmt, datefmt)
+        # Level and logger names repeat on every record; encode each one once
+        self._encoded_names: Dict[str, str] = {}
+
+    def _encode_name(self, name: str) -> str:
+        """Return the JSON string literal for a level or logger name."""
+        encoded = self._encoded_names.get(name)
+        if encoded is None:
+            encoded = self._encoded_names[name] = encode_basestring_ascii(name)
+        return encoded
+
+    def format(self, record: logging.LogRecord) -> str:
+        """Format log record as JSON."""
+        timestamp = self.formatTime(record, self.datefmt)
+        message = record.getMessage()
+        exception = self.formatException(record.exc_info) if record.exc_info else None
+
+        parts = [
+            self._TIMESTAMP,
+            encode_basestring_ascii(timestamp),
+            self._LEVEL,
+            self._encode_name(record.levelname),
+            self._LOGGER,
+            self._encode_name(record.name),
+            self._MESSAGE,
+            encode_basestring_ascii(message),
+        ]
+        if exception is not None:
+            parts += (self._EXCEPTION, encode_basestring_ascii(exception))
+        parts.append("}")
+        return "".join(parts)
+
 
 def setup_logging(log_level: str, log_format: str) -> None:
     """
@@ -33,21 +101,6 @@ def setup_logging(log_level: str, log_format: str) -> None:
 
     if log_format == "json":
         # JSON format for structured logging
-        class JsonFormatter(logging.Formatter):
-            """Custom JSON formatter for structured logging."""
-
-            def format(self, record: logging.LogRecord) -> str:
-                """Format log record as JSON."""
-                log_data = {
-                    "timestamp": self.formatTime(record, self.datefmt),
-                    "level": record.levelname,
-                    "logger": record.name,
-                    "message": record.getMessage(),
-                }
-                if record.exc_info:
-                    log_data["exception"] = self.formatException(record.exc_info)
-                return json.dumps(log_data)
-
         handler = logging.StreamHandler()
         handler.setFormatter(JsonFormatter())
         logging.root.handlers = [handler]
@@ -92,18 +145,7 @@ def print_banner(dry_run: bool) -> None:
     Args:
         dry_run: Whether running in dry-run mode
     """
-    banner = """
-╔═══════════════════════════════════════════════════════════╗
-║                                                           ║
-║   Grafana-Okta Team Sync (GOTS)                           ║
-║   Automated team synchronization service                  ║
-║                                                           ║
-╚═══════════════════════════════════════════════════════════╝
-"""
-    print(banner)
-    if dry_run:
-        print("⚠️  DRY RUN MODE - No changes will be made")
-        print()
+    sys.stdout.write(_BANNER_DRYRUN if dry_run else _BANNER_NORMAL)
 
 
 def run_sync(
@@ -206,7 +248,9 @@ def main() -> NoReturn:
             assert config.okta.api_token is not None
             okta_client = OktaClient(domain=config.okta.domain, api_token=config.okta.api_token)
 
-        grafana_client = GrafanaClient(config.grafana.url, config.grafana.api_key)
+        grafana_client = GrafanaClient(
+            config.grafana.url, config.grafana.api_key, pool_maxsize=config.sync.max_workers
+        )
 
         # Initialize metrics if enabled
         metrics_collector = None
@@ -228,6 +272,7 @@ def main() -> NoReturn:
             grafana_client=grafana_client,
             dry_run=config.sync.dry_run,
             metrics_collector=metrics_collector,
+            max_workers=config.sync.max_workers,
         )
 
         # Setup signal handlers for graceful shutdown
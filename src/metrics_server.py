@@ -200,6 +200,8 @@ class MetricsServer:
         self.metrics_collector = metrics_collector
         self.server: Optional[HTTPServer] = None
         self.thread: Optional[threading.Thread] = None
+        # Set once the background thread is about to serve requests
+        self._ready = threading.Event()
 
     def start(self) -> None:
         """Start the metrics server in a background thread."""
@@ -217,6 +219,7 @@ class MetricsServer:
     def _run_server(self) -> None:
         """Run the HTTP server (runs in background thread)."""
         if self.server:
+            self._ready.set()
             try:
                 self.server.serve_forever()
             except Exception as e:
@@ -231,5 +234,6 @@ class MetricsServer:
 
         if self.thread:
             self.thread.join(timeout=5)
+        self._ready.clear()
 
         logger.info("Metrics server stopped")
@@ -13,6 +13,11 @@ from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_ex
 
 logger = logging.getLogger(__name__)
 
+# Seconds a group's member list is reused while its lastMembershipUpdated is unchanged.
+# Okta leaves that timestamp alone when a member's profile changes or a member is
+# deactivated, so cached lists must still be refetched periodically.
+MEMBERS_CACHE_MAX_AGE_SECONDS = 600.0
+
 
 class OktaAPIError(Exception):
     """Base exception for Okta API errors."""
@@ -270,6 +275,7 @@ class OktaClient:
         domain: str,
         api_token: Optional[str] = None,
         oauth_token_manager: Optional[OktaOAuthTokenManager] = None,
+        members_cache_max_age: float = MEMBERS_CACHE_MAX_AGE_SECONDS,
     ) -> None:
         """
         Initialize Okta client.
@@ -278,6 +284,7 @@ class OktaClient:
             domain: Okta domain (e.g., 'example.okta.com')
             api_token: Okta API token (for api_token auth method)
             oauth_token_manager: OAuth token manager (for oauth auth method)
+            members_cache_max_age: Seconds to reuse an unchanged group's members (0 disables)
 
         Raises:
             ValueError: If neither or both auth methods are provided
@@ -291,6 +298,9 @@ class OktaClient:
         self.base_url = f"https://{self.domain}"
         self.api_token = api_token
         self.oauth_token_manager = oauth_token_manager
+        self.members_cache_max_age = members_cache_max_age
+        # Group ID -> (lastMembershipUpdated, monotonic fetch time, members) from the last fetch
+        self._members_cache: Dict[str, Tuple[str, float, List[Dict[str, Any]]]] = {}
         self.session = requests.Session()
         self.session.headers.update(
             {
@@ -504,15 +514,40 @@ class OktaClient:
         Get all members of an Okta group by group name.
 
         Convenience method that combines get_group_by_name and get_group_members.
+        The group lookup is always made; the paginated member fetch is skipped
+        when the group's lastMembershipUpdated is unchanged since the last call
+        and the cached members are younger than members_cache_max_age.
 
         Args:
             group_name: Name of the Okta group
 
         Returns:
-            List of user objects
+            List of user objects; a new list on every call, so callers may modify it
 
         Raises:
             OktaNotFoundError: If group not found
         """
         group = self.get_group_by_name(group_name)
-        return self.get_group_members(group["id"])
+        group_id = group["id"]
+        last_updated = group.get("lastMembershipUpdated")
+
+        now = time.monotonic()
+        cached = self._members_cache.get(group_id)
+        if (
+            last_updated
+            and cached
+            and cached[0] == last_updated
+            and now - cached[1] < self.members_cache_max_age
+        ):
+            logger.info(
+                "Okta group %s unchanged since %s, reusing %d members",
+                group_name,
+                last_updated,
+                len(cached[2]),
+            )
+            return list(cached[2])
+
+        members = self.get_group_members(group_id)
+        if last_updated:
+            self._members_cache[group_id] = (last_updated, now, list(members))
+        return members
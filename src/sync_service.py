@@ -2,8 +2,9 @@
 
 import logging
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, Dict, List, Optional, Set
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
 
 from src.grafana_client import GrafanaClient
 from src.okta_client import OktaClient
@@ -16,6 +17,21 @@ logger = logging.getLogger(__name__)
 # Role hierarchy: Admin > Editor > Viewer
 ROLE_HIERARCHY = {"Admin": 3, "Editor": 2, "Viewer": 1}
 
+# Precomputed highest role for every pair of known roles
+_ROLE_MAX = {
+    (role1, role2): role1 if ROLE_HIERARCHY[role1] > ROLE_HIERARCHY[role2] else role2
+    for role1 in ROLE_HIERARCHY
+    for role2 in ROLE_HIERARCHY
+}
+
+# Maximum number of emails listed in a per-step summary log line
+LOG_SAMPLE_SIZE = 20
+
+# Seconds a fetched Grafana org user list is reused. Kept below the minimum sync
+# interval so team, role and admin updates in one cycle share a fetch but every cycle
+# starts fresh.
+ORG_USERS_TTL_SECONDS = 30.0
+
 
 def get_highest_role(role1: str, role2: str) -> str:
     """
@@ -28,10 +44,36 @@ def get_highest_role(role1: str, role2: str) -> str:
     Returns:
         The role with higher permission level
     """
+    highest = _ROLE_MAX.get((role1, role2))
+    if highest is not None:
+        return highest
+    # Unknown roles rank below all known ones
     return role1 if ROLE_HIERARCHY.get(role1, 0) > ROLE_HIERARCHY.get(role2, 0) else role2
 
 
-@dataclass
+def _log_user_summary(message: str, entries: List[str]) -> None:
+    """
+    Log a single summary line for a batch of per-user operations.
+
+    Args:
+        message: Description of the operation (e.g., 'Added users to team Engineers')
+        entries: One entry per user, such as an email or an 'email=role' pair
+    """
+    if not entries or not logger.isEnabledFor(logging.INFO):
+        return
+
+    sample = sorted(entries)[:LOG_SAMPLE_SIZE]
+    remaining = len(entries) - len(sample)
+    logger.info(
+        "%s (%d users): %s%s",
+        message,
+        len(entries),
+        ", ".join(sample),
+        f" and {remaining} more" if remaining else "",
+    )
+
+
+@dataclass(slots=True)
 class SyncMetrics:
     """Metrics for a sync operation."""
 
@@ -51,6 +93,8 @@ class SyncService:
         grafana_client: GrafanaClient,
         dry_run: bool = False,
         metrics_collector: Optional["MetricsCollector"] = None,
+        max_workers: int = 8,
+        org_users_ttl: float = ORG_USERS_TTL_SECONDS,
     ) -> None:
         """
         Initialize sync service.
@@ -60,11 +104,62 @@ class SyncService:
             grafana_client: Grafana API client
             dry_run: If True, log actions without executing them
             metrics_collector: Optional metrics collector for monitoring
+            max_workers: Maximum number of concurrent API requests per sync step
+            org_users_ttl: Seconds to reuse a fetched Grafana org user list (0 disables)
         """
         self.okta_client = okta_client
         self.grafana_client = grafana_client
         self.dry_run = dry_run
         self.metrics_collector = metrics_collector
+        self.max_workers = max(1, max_workers)
+        self.org_users_ttl = org_users_ttl
+        # (monotonic fetch time, users) from the last get_org_users call
+        self._org_users_cache: Optional[Tuple[float, List[Dict[str, Any]]]] = None
+
+    def _get_org_users(self) -> List[Dict[str, Any]]:
+        """
+        Get Grafana organization users, reusing a recent fetch.
+
+        Role and admin updates write their changes back into the cached user
+        dicts, so a reused list reflects what this service has applied.
+
+        Returns:
+            List of org user objects as returned by GrafanaClient.get_org_users
+        """
+        now = time.monotonic()
+        if self._org_users_cache is not None:
+            fetched_at, users = self._org_users_cache
+            if now - fetched_at < self.org_users_ttl:
+                logger.debug("Reusing %d cached Grafana org users", len(users))
+                return users
+
+        users = self.grafana_client.get_org_users()
+        self._org_users_cache = (now, users)
+        return users
+
+    def _map_concurrently(
+        self, func: Callable[[Any], Any], items: Iterable[Any], concurrent: bool = True
+    ) -> List[Any]:
+        """
+        Apply a function to each item using a bounded thread pool.
+
+        Falls back to a plain loop when concurrency is disabled or there is
+        at most one item, so small syncs don't pay for thread start-up.
+
+        Args:
+            func: Function to apply; it must handle its own exceptions
+            items: Items to process
+            concurrent: False to run inline, for steps that make no API calls
+
+        Returns:
+            List of results in the same order as items
+        """
+        items = list(items)
+        if not concurrent or self.max_workers == 1 or len(items) <= 1:
+            return [func(item) for item in items]
+
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(items))) as executor:
+            return list(executor.map(func, items))
 
     def sync_group_to_team(  # pylint: disable=too-many-locals
         self,
@@ -87,8 +182,12 @@ class SyncService:
         """
         if desired_roles is None:
             desired_roles = {}
-        start_time = time.time()
+        start_time = time.perf_counter()
         metrics = SyncMetrics()
+        # Counters are kept in locals inside the per-user loops and copied to metrics at the end
+        added = 0
+        removed = 0
+        errors = 0
 
         logger.info("Starting sync: %s -> %s", okta_group_name, grafana_team_name)
 
@@ -112,10 +211,13 @@ class SyncService:
 
             # Fetch Grafana team members
             grafana_members = self.grafana_client.get_team_members(team_id)
-            grafana_emails: Set[str] = {m["email"].lower() for m in grafana_members}
+            # Normalize each email once; removals look members up here instead of rescanning
+            grafana_by_email: Dict[str, Dict[str, Any]] = {
+                m["email"].lower(): m for m in grafana_members
+            }
             logger.info(
                 "Found %d members in Grafana team '%s'",
-                len(grafana_emails),
+                len(grafana_by_email),
                 grafana_team_name,
             )
 
@@ -126,67 +228,125 @@ class SyncService:
                 desired_roles[email] = get_highest_role(current_desired, grafana_role)
 
             # Calculate diff
-            to_add = okta_emails - grafana_emails
-            to_remove = grafana_emails - okta_emails
+            to_add = okta_emails - grafana_by_email.keys()
+            to_remove = grafana_by_email.keys() - okta_emails
 
             logger.info("Sync diff: %d to add, %d to remove", len(to_add), len(to_remove))
 
-            # Add users
-            for email in to_add:
+            # Resolve new members from the cached org user list instead of one full
+            # /api/org/users fetch per user. A user missing from that list has not been
+            # provisioned in Grafana yet; per-user lookups are only a fallback for a failed fetch.
+            org_users_by_email: Optional[Dict[str, Dict[str, Any]]] = None
+            if to_add:
+                try:
+                    org_users_by_email = {
+                        user.get("email", "").lower(): user for user in self._get_org_users()
+                    }
+                except Exception as e:  # pylint: disable=broad-except
+                    logger.warning(
+                        "Failed to fetch Grafana org users, looking up new members one by one: %s",
+                        e,
+                    )
+
+            def add_member(email: str) -> Optional[bool]:
+                """Add one user to the team; returns None on error, False if skipped."""
                 try:
                     # Get user (don't create - users should be auto-provisioned via Okta)
-                    user = self.grafana_client.get_user_by_email(email)
-                    if user is None:
+                    user_id: Optional[int] = None
+                    if org_users_by_email is not None:
+                        org_user = org_users_by_email.get(email)
+                        if org_user is not None:
+                            user_id = org_user["userId"]
+                    else:
+                        user = self.grafana_client.get_user_by_email(email)
+                        if user is not None:
+                            user_id = user["id"]
+                    if user_id is None:
                         logger.debug(
                             "Skipping user %s - not found in Grafana. "
                             "User must login via Okta first.",
                             email,
                         )
-                        continue
+                        return False
 
                     if self.dry_run:
-                        logger.info(
+                        logger.debug(
                             "[DRY RUN] Would add user %s to team %s",
                             email,
                             grafana_team_name,
                         )
                     else:
-                        user_id = user["id"]
                         # Add user to team (role will be updated later)
                         self.grafana_client.add_user_to_team(team_id, user_id)
-                        logger.info("Added user %s to team %s", email, grafana_team_name)
-                    metrics.users_added += 1
+                        logger.debug("Added user %s to team %s", email, grafana_team_name)
+                    return True
                 except Exception as e:  # pylint: disable=broad-except
                     logger.error("Failed to add user %s: %s", email, e)
-                    metrics.errors += 1
+                    return None
 
-            # Remove users
-            for email in to_remove:
+            def remove_member(email: str) -> Optional[bool]:
+                """Remove one user from the team; returns None on error."""
                 try:
-                    # Find user ID
-                    member = next(m for m in grafana_members if m["email"].lower() == email)
-                    user_id = member["userId"]
+                    user_id = grafana_by_email[email]["userId"]
 
                     if self.dry_run:
-                        logger.info(
+                        logger.debug(
                             "[DRY RUN] Would remove user %s from team %s",
                             email,
                             grafana_team_name,
                         )
                     else:
                         self.grafana_client.remove_user_from_team(team_id, user_id)
-                        logger.info("Removed user %s from team %s", email, grafana_team_name)
-                    metrics.users_removed += 1
+                        logger.debug("Removed user %s from team %s", email, grafana_team_name)
+                    return True
                 except Exception as e:  # pylint: disable=broad-except
                     logger.error("Failed to remove user %s: %s", email, e)
-                    metrics.errors += 1
+                    return None
+
+            # Add users
+            add_list = list(to_add)
+            added_emails: List[str] = []
+            for email, outcome in zip(add_list, self._map_concurrently(add_member, add_list)):
+                if outcome is None:
+                    errors += 1
+                elif outcome:
+                    added_emails.append(email)
+            added = len(added_emails)
+
+            # Remove users
+            remove_list = list(to_remove)
+            removed_emails: List[str] = []
+            # Dry-run removals only log, so they need no worker threads
+            for email, outcome in zip(
+                remove_list,
+                self._map_concurrently(remove_member, remove_list, concurrent=not self.dry_run),
+            ):
+                if outcome is None:
+                    errors += 1
+                else:
+                    removed_emails.append(email)
+            removed = len(removed_emails)
+
+            if self.dry_run:
+                _log_user_summary(
+                    f"[DRY RUN] Would add users to team {grafana_team_name}", added_emails
+                )
+                _log_user_summary(
+                    f"[DRY RUN] Would remove users from team {grafana_team_name}", removed_emails
+                )
+            else:
+                _log_user_summary(f"Added users to team {grafana_team_name}", added_emails)
+                _log_user_summary(f"Removed users from team {grafana_team_name}", removed_emails)
 
         except Exception as e:
             logger.error("Sync failed for %s -> %s: %s", okta_group_name, grafana_team_name, e)
-            metrics.errors += 1
+            errors += 1
             raise
         finally:
-            metrics.duration_seconds = time.time() - start_time
+            metrics.users_added = added
+            metrics.users_removed = removed
+            metrics.errors = errors
+            metrics.duration_seconds = time.perf_counter() - start_time
             logger.info(
                 "Sync completed in %.2fs: +%d, -%d, errors=%d",
                 metrics.duration_seconds,
@@ -213,6 +373,8 @@ class SyncService:
         Update user roles based on desired roles collected from all group mappings.
 
         Ensures users get the highest role they're entitled to across all groups.
+        Grafana has no bulk role endpoint, so the organization users are fetched
+        once and only the changed roles are sent, over the pooled client session.
 
         Args:
             desired_roles: Dict mapping email to desired role
@@ -220,40 +382,53 @@ class SyncService:
         Returns:
             Number of roles updated
         """
-        roles_updated = 0
-
         logger.info("Checking roles for %d users", len(desired_roles))
 
-        for email, desired_role in desired_roles.items():
-            try:
-                user = self.grafana_client.get_user_by_email(email)
-                if user is None:
-                    logger.debug("Skipping role update for %s - user not found", email)
-                    continue
+        try:
+            users_by_email = {user.get("email", "").lower(): user for user in self._get_org_users()}
+        except Exception as e:  # pylint: disable=broad-except
+            logger.error("Failed to fetch Grafana users for role update: %s", e)
+            return 0
 
-                current_role = user.get("role", "Viewer")
-                user_id = user["id"]
+        def update_role(item: Tuple[str, str]) -> bool:
+            """Update one user's role; returns True if the role changed."""
+            email, desired_role = item
+            user = users_by_email.get(email.lower())
+            if user is None:
+                logger.debug("Skipping role update for %s - user not found", email)
+                return False
 
-                # Only update if roles differ
-                if current_role != desired_role:
-                    if self.dry_run:
-                        logger.info(
-                            "[DRY RUN] Would update role for %s: %s -> %s",
-                            email,
-                            current_role,
-                            desired_role,
-                        )
-                    else:
-                        self.grafana_client.update_user_role(user_id, desired_role)
-                        logger.info(
-                            "Updated role for %s: %s -> %s", email, current_role, desired_role
-                        )
-                    roles_updated += 1
-                else:
-                    logger.debug("User %s already has correct role: %s", email, current_role)
+            current_role = user.get("role", "Viewer")
+            if current_role == desired_role:
+                logger.debug("User %s already has correct role: %s", email, current_role)
+                return False
 
+            try:
+                if self.dry_run:
+                    logger.debug(
+                        "[DRY RUN] Would update role for %s: %s -> %s",
+                        email,
+                        current_role,
+                        desired_role,
+                    )
+                else:
+                    self.grafana_client.update_user_role(user["userId"], desired_role)
+                    user["role"] = desired_role
+                    logger.debug("Updated role for %s: %s -> %s", email, current_role, desired_role)
+                return True
             except Exception as e:  # pylint: disable=broad-except
                 logger.error("Failed to update role for %s: %s", email, e)
+                return False
+
+        items = list(desired_roles.items())
+        outcomes = self._map_concurrently(update_role, items, concurrent=not self.dry_run)
+        updated_roles = [
+            f"{email}={role}" for (email, role), changed in zip(items, outcomes) if changed
+        ]
+        roles_updated = len(updated_roles)
+        _log_user_summary(
+            "[DRY RUN] Would update roles" if self.dry_run else "Updated roles", updated_roles
+        )
 
         logger.info("Role updates completed: %d roles updated", roles_updated)
         return roles_updated
@@ -264,6 +439,7 @@ class SyncService:
 
         Users who are members of any admin group will be granted Grafana admin privileges.
         Users who are not members of any admin group will have admin privileges revoked.
+        If none of the admin groups can be fetched from Okta, nothing is changed.
 
         Args:
             admin_groups: List of Okta group names whose members should be Grafana admins
@@ -280,63 +456,91 @@ class SyncService:
 
         logger.info("Syncing Grafana admin privileges from %d Okta groups", len(admin_groups))
 
-        # Collect all users who should be admins from Okta groups
-        for group_name in admin_groups:
+        def fetch_group_emails(group_name: str) -> Optional[Set[str]]:
+            """Fetch one admin group's member emails; returns None on error."""
             try:
                 members = self.okta_client.get_group_members_by_name(group_name)
                 group_emails = {m["profile"]["email"].lower() for m in members}
-                admin_emails.update(group_emails)
                 logger.info(
                     "Found %d members in Okta admin group '%s'", len(group_emails), group_name
                 )
+                return group_emails
             except Exception as e:  # pylint: disable=broad-except
                 logger.error("Failed to fetch members from Okta group %s: %s", group_name, e)
+                return None
+
+        # Collect all users who should be admins, fetching the Okta groups concurrently
+        group_results = self._map_concurrently(fetch_group_emails, admin_groups)
+        if all(group_emails is None for group_emails in group_results):
+            # Without any Okta data every current admin would look revocable; skip the scan
+            logger.warning("No Okta admin group could be fetched, skipping admin privilege sync")
+            return 0
+        for group_emails in group_results:
+            if group_emails is not None:
+                admin_emails.update(group_emails)
 
         logger.info("Total unique admin emails from Okta: %d", len(admin_emails))
 
         # Get all Grafana users and update admin privileges
         try:
-            # Fetch all organization users
-            response = self.grafana_client._get(
-                "/api/org/users"
-            )  # pylint: disable=protected-access
-            all_users = response.json()
+            # Fetch all organization users (shared with update_user_roles in the same cycle)
+            all_users = self._get_org_users()
 
             logger.info("Checking admin privileges for %d Grafana users", len(all_users))
 
+            # Collect the users whose admin status needs to change in one pass
+            changes: List[Tuple[Dict[str, Any], str, bool]] = []
             for user in all_users:
                 email = user.get("email", "").lower()
-                user_id = user.get("userId")
-                current_is_admin = user.get("isGrafanaAdmin", False)
-
-                # Determine desired admin status
                 should_be_admin = email in admin_emails
+                if user.get("isGrafanaAdmin", False) != should_be_admin:
+                    changes.append((user, email, should_be_admin))
+            logger.debug(
+                "%d users already have correct admin status", len(all_users) - len(changes)
+            )
 
-                # Only update if status needs to change
-                if current_is_admin != should_be_admin:
-                    try:
-                        if self.dry_run:
-                            logger.info(
-                                "[DRY RUN] Would update Grafana admin for %s: %s -> %s",
-                                email,
-                                current_is_admin,
-                                should_be_admin,
-                            )
-                        else:
-                            self.grafana_client.set_user_admin_permission(user_id, should_be_admin)
-                            logger.info(
-                                "Updated Grafana admin for %s: %s -> %s",
-                                email,
-                                current_is_admin,
-                                should_be_admin,
-                            )
-                        admins_updated += 1
-                    except Exception as e:  # pylint: disable=broad-except
-                        logger.error("Failed to update admin privilege for %s: %s", email, e)
-                else:
-                    logger.debug(
-                        "User %s already has correct admin status: %s", email, current_is_admin
-                    )
+            def update_admin(change: Tuple[Dict[str, Any], str, bool]) -> bool:
+                """Apply one admin status change; returns True on success."""
+                user, email, should_be_admin = change
+                try:
+                    if self.dry_run:
+                        logger.debug(
+                            "[DRY RUN] Would update Grafana admin for %s: %s -> %s",
+                            email,
+                            not should_be_admin,
+                            should_be_admin,
+                        )
+                    else:
+                        self.grafana_client.set_user_admin_permission(
+                            user.get("userId"), should_be_admin
+                        )
+                        user["isGrafanaAdmin"] = should_be_admin
+                        logger.debug(
+                            "Updated Grafana admin for %s: %s -> %s",
+                            email,
+                            not should_be_admin,
+                            should_be_admin,
+                        )
+                    return True
+                except Exception as e:  # pylint: disable=broad-except
+                    logger.error("Failed to update admin privilege for %s: %s", email, e)
+                    return False
+
+            granted_emails: List[str] = []
+            revoked_emails: List[str] = []
+            for (_, email, should_be_admin), changed in zip(
+                changes, self._map_concurrently(update_admin, changes, concurrent=not self.dry_run)
+            ):
+                if changed:
+                    (granted_emails if should_be_admin else revoked_emails).append(email)
+            admins_updated = len(granted_emails) + len(revoked_emails)
+
+            if self.dry_run:
+                _log_user_summary("[DRY RUN] Would grant Grafana admin", granted_emails)
+                _log_user_summary("[DRY RUN] Would revoke Grafana admin", revoked_emails)
+            else:
+                _log_user_summary("Granted Grafana admin", granted_emails)
+                _log_user_summary("Revoked Grafana admin", revoked_emails)
 
         except Exception as e:  # pylint: disable=broad-except
             logger.error("Failed to fetch Grafana users for admin sync: %s", e)
@@ -1,9 +1,45 @@
 #!/usr/bin/env python3
 """Test script to verify Grafana API permissions."""
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Tuple
+
 import requests
 
 
+def run_probe(
+    session: requests.Session, base_url: str, test: Dict[str, Any]
+) -> Tuple[str, str, bool]:
+    """Probe one Grafana API endpoint and return (status, color, passed)."""
+    url = f"{base_url}{test['endpoint']}"
+
+    try:
+        if test["method"] == "GET":
+            response = session.get(url, timeout=10, verify=True)
+        else:
+            response = session.post(url, timeout=10, verify=True)
+
+        if response.status_code in (200, 201):
+            return "✓ PASS", "\033[92m", True  # Green
+        if response.status_code == 404:
+            return "⚠ WARN (404 - endpoint or resource not found)", "\033[93m", False  # Yellow
+        if response.status_code in (401, 403):
+            status = "✗ FAIL (Permission Denied)"
+            try:
+                error_msg = response.json().get("message", "")
+                if error_msg:
+                    status += f"\n      Message: {error_msg}"
+            except Exception:
+                pass
+            return status, "\033[91m", False  # Red
+        return f"? UNKNOWN (HTTP {response.status_code})", "\033[93m", False  # Yellow
+
+    except requests.exceptions.SSLError as e:
+        return f"✗ SSL ERROR: {e}", "\033[91m", False  # Red
+    except Exception as e:
+        return f"✗ ERROR: {e}", "\033[91m", False  # Red
+
+
 def test_grafana_permissions(base_url: str, api_key: str) -> None:
     """Test all required Grafana API endpoints."""
 
@@ -55,62 +91,27 @@ def test_grafana_permissions(base_url: str, api_key: str) -> None:
     print(f"URL: {base_url}")
     print(f"{'='*80}\n")
 
+    with requests.Session() as session:
+        session.headers.update(headers)
+        # Probes run concurrently, so wall time is bounded by the slowest endpoint
+        with ThreadPoolExecutor(max_workers=len(tests)) as executor:
+            results = list(executor.map(lambda test: run_probe(session, base_url, test), tests))
+
     passed = 0
     failed = 0
+    reset = "\033[0m"
+
+    for test, (status, color, ok) in zip(tests, results):
+        if ok:
+            passed += 1
+        elif test["required"]:
+            failed += 1
 
-    for test in tests:
-        endpoint = test["endpoint"]
-        url = f"{base_url}{endpoint}"
-
-        try:
-            if test["method"] == "GET":
-                response = requests.get(url, headers=headers, timeout=10, verify=True)
-            else:
-                response = requests.post(url, headers=headers, timeout=10, verify=True)
-
-            if response.status_code in (200, 201):
-                status = "✓ PASS"
-                passed += 1
-                color = "\033[92m"  # Green
-            elif response.status_code == 404:
-                status = "⚠ WARN (404 - endpoint or resource not found)"
-                if test["required"]:
-                    failed += 1
-                color = "\033[93m"  # Yellow
-            elif response.status_code in (401, 403):
-                status = "✗ FAIL (Permission Denied)"
-                if test["required"]:
-                    failed += 1
-                color = "\033[91m"  # Red
-                try:
-                    error_msg = response.json().get("message", "")
-                    if error_msg:
-                        status += f"\n      Message: {error_msg}"
-                except Exception:
-                    pass
-            else:
-                status = f"? UNKNOWN (HTTP {response.status_code})"
-                if test["required"]:
-                    failed += 1
-                color = "\033[93m"  # Yellow
-
-        except requests.exceptions.SSLError as e:
-            status = f"✗ SSL ERROR: {e}"
-            if test["required"]:
-                failed += 1
-            color = "\033[91m"  # Red
-        except Exception as e:
-            status = f"✗ ERROR: {e}"
-            if test["required"]:
-                failed += 1
-            color = "\033[91m"  # Red
-
-        reset = "\033[0m"
         required_marker = "[REQUIRED]" if test["required"] else "[OPTIONAL]"
 
         print(f"{color}{status}{reset}")
         print(f"  Test: {test['name']} {required_marker}")
-        print(f"  Endpoint: {endpoint}")
+        print(f"  Endpoint: {test['endpoint']}")
         print(f"  Permission: {test['permission']}")
         print()
 
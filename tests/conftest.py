@@ -0,0 +1,88 @@
+"""Shared pytest fixtures."""
+import logging
+import socket
+from typing import Any, Callable, Iterator, List
+
+import pytest
+import responses
+
+from src.main import setup_logging
+
+# Hosts tests may still reach, e.g. the metrics server bound to loopback
+_LOOPBACK_HOSTS = frozenset({"127.0.0.1", "::1", "localhost"})
+
+
+@pytest.fixture(scope="session")
+def _requests_mock() -> Iterator[responses.RequestsMock]:
+    """Patch requests once per session; tests see it through mocked_responses."""
+    with responses.RequestsMock(assert_all_requests_are_fired=False) as rsps:
+        yield rsps
+
+
+@pytest.fixture(autouse=True)
+def mocked_responses(
+    _requests_mock: responses.RequestsMock,
+) -> Iterator[responses.RequestsMock]:
+    """Intercept HTTP requests made through requests with a per-test responses registry.
+
+    Register mocks on this fixture rather than through the module-level
+    responses.add/responses.activate API. The registry and recorded calls are
+    reset after every test, so tests stay isolated from each other while the
+    adapter patch itself is only installed once per session. Any request
+    without a registered mock fails instead of reaching the network.
+    """
+    yield _requests_mock
+    _requests_mock.reset()
+
+
+@pytest.fixture(autouse=True)
+def _no_network(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Fail fast on name lookups and connections to anything but loopback.
+
+    A test that slips past the HTTP mocks would otherwise wait on DNS and
+    connect timeouts for hosts such as test.okta.com.
+    """
+    real_getaddrinfo = socket.getaddrinfo
+    real_connect = socket.socket.connect
+
+    def guarded_getaddrinfo(host: Any, *args: Any, **kwargs: Any) -> Any:
+        if host is not None and host not in _LOOPBACK_HOSTS:
+            raise RuntimeError(f"Network access is disabled in tests (lookup of {host!r})")
+        return real_getaddrinfo(host, *args, **kwargs)
+
+    def guarded_connect(sock: socket.socket, address: Any) -> None:
+        if isinstance(address, tuple) and address[0] not in _LOOPBACK_HOSTS:
+            raise RuntimeError(f"Network access is disabled in tests (connect to {address!r})")
+        real_connect(sock, address)
+
+    monkeypatch.setattr(socket, "getaddrinfo", guarded_getaddrinfo)
+    monkeypatch.setattr(socket.socket, "connect", guarded_connect)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _logging_snapshot() -> Iterator[int]:
+    """Record the root logger level at session start and restore it at session end."""
+    level = logging.root.level
+    yield level
+    logging.root.setLevel(level)
+
+
+@pytest.fixture
+def logging_setup(_logging_snapshot: int) -> Iterator[Callable[[str, str], None]]:
+    """Call setup_logging and undo its root logger changes after the test.
+
+    The handlers installed by setup_logging are removed on teardown and the
+    root level is reset, so a JSON stderr handler never leaks into later tests.
+    """
+    installed: List[logging.Handler] = []
+
+    def _setup(level: str, fmt: str) -> None:
+        before = logging.root.handlers[:]
+        setup_logging(level, fmt)
+        installed.extend(h for h in logging.root.handlers if h not in before)
+
+    yield _setup
+
+    for handler in installed:
+        logging.root.removeHandler(handler)
+    logging.root.setLevel(_logging_snapshot)
@@ -1,9 +1,12 @@
 """Tests for configuration module."""
-import os
-import tempfile
+import itertools
+import json
 from pathlib import Path
+from typing import Any, Callable, Dict
+from unittest.mock import patch
 
 import pytest
+import yaml
 
 from src.config import (
     Config,
@@ -15,8 +18,85 @@ from src.config import (
     OktaConfig,
     OktaOAuthConfig,
     SyncConfig,
+    _env_bool,
+    _YamlLoader,
 )
 
+# Config skeleton shared by the loader tests; %(okta)s is the body of the okta section
+CONFIG_YAML_TEMPLATE = """
+okta:
+%(okta)s
+grafana:
+  url: https://grafana.example.com
+  api_key: test-key
+
+sync:
+  interval_seconds: 300
+  dry_run: false
+  mappings:
+    - okta_group: "Group1"
+      grafana_team: "Team1"
+"""
+
+# Minimal valid config; variants append further YAML to it
+BASE_YAML = CONFIG_YAML_TEMPLATE % {"okta": "  domain: example.okta.com\n  api_token: test-token\n"}
+
+MULTIPLE_MAPPINGS_YAML = """\
+    - okta_group: "Group2"
+      grafana_team: "Team2"
+    - okta_group: "Group3"
+      grafana_team: "Team3"
+"""
+
+ADMIN_GROUPS_YAML = """\
+  admin_groups:
+    - "Grafana-Admins"
+    - "Platform-Team"
+    - "SRE"
+"""
+
+METRICS_YAML = """
+metrics:
+  enabled: true
+  port: 9090
+  host: 127.0.0.1
+"""
+
+# Unique suffix for config files written into the shared session directory
+_config_file_ids = itertools.count()
+
+
+@pytest.fixture(autouse=True)
+def no_dotenv(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Keep a developer's .env file from leaking variables into os.environ during tests."""
+    monkeypatch.setattr("src.config.load_dotenv", lambda *args, **kwargs: False)
+
+
+@pytest.fixture(scope="session")
+def config_dir(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Create one directory shared by all config files written during the session."""
+    return tmp_path_factory.mktemp("config")
+
+
+@pytest.fixture
+def yaml_config(config_dir: Path) -> Callable[[str], str]:
+    """Return a factory that writes YAML content to a fresh file and returns its path."""
+
+    def write(content: str) -> str:
+        path = config_dir / f"config-{next(_config_file_ids)}.yaml"
+        path.write_text(content, encoding="utf-8")
+        return str(path)
+
+    return write
+
+
+@pytest.fixture(scope="session")
+def base_config(config_dir: Path) -> Config:
+    """Load BASE_YAML from disk once for tests that only read the resulting config."""
+    path = config_dir / "base.yaml"
+    path.write_text(BASE_YAML, encoding="utf-8")
+    return ConfigLoader.load(str(path))
+
 
 class TestOktaOAuthConfig:
     """Test OktaOAuthConfig dataclass."""
@@ -32,21 +112,6 @@ class TestOktaOAuthConfig:
         assert config.client_secret == "test-secret"
         assert config.scopes == ["okta.groups.read", "okta.users.read"]
 
-    def test_missing_client_id(self) -> None:
-        """Test error when client_id is missing."""
-        with pytest.raises(ValueError, match="OAuth client_id is required"):
-            OktaOAuthConfig(client_id="", client_secret="secret", scopes=["okta.groups.read"])
-
-    def test_missing_client_secret(self) -> None:
-        """Test error when client_secret is missing."""
-        with pytest.raises(ValueError, match="client_secret is required for client_secret_basic"):
-            OktaOAuthConfig(client_id="id", client_secret="", scopes=["okta.groups.read"])
-
-    def test_missing_scopes(self) -> None:
-        """Test error when scopes list is empty."""
-        with pytest.raises(ValueError, match="At least one OAuth scope is required"):
-            OktaOAuthConfig(client_id="id", client_secret="secret", scopes=[])
-
 
 class TestOktaConfig:
     """Test OktaConfig dataclass."""
@@ -68,39 +133,18 @@ class TestOktaConfig:
         assert config.oauth == oauth
         assert config.api_token is None
 
-    def test_removes_https_from_domain(self) -> None:
-        """Test that https:// is stripped from domain."""
-        config = OktaConfig(domain="https://example.okta.com", api_token="token")
-        assert config.domain == "example.okta.com"
-
-    def test_removes_http_from_domain(self) -> None:
-        """Test that http:// is stripped from domain."""
-        config = OktaConfig(domain="http://example.okta.com", api_token="token")
-        assert config.domain == "example.okta.com"
-
-    def test_missing_domain(self) -> None:
-        """Test error when domain is missing."""
-        with pytest.raises(ValueError, match="Okta domain is required"):
-            OktaConfig(domain="", api_token="token")
-
-    def test_invalid_auth_method(self) -> None:
-        """Test error when auth_method is invalid."""
-        with pytest.raises(ValueError, match="auth_method must be one of"):
-            OktaConfig(domain="example.okta.com", auth_method="invalid", api_token="token")
-
-    def test_missing_api_token_when_using_api_token_method(self) -> None:
-        """Test error when API token is missing for api_token auth method."""
-        with pytest.raises(
-            ValueError, match="Okta API token is required when using api_token auth method"
-        ):
-            OktaConfig(domain="example.okta.com", auth_method="api_token")
-
-    def test_missing_oauth_when_using_oauth_method(self) -> None:
-        """Test error when OAuth config is missing for oauth auth method."""
-        with pytest.raises(
-            ValueError, match="OAuth configuration is required when using oauth auth method"
-        ):
-            OktaConfig(domain="example.okta.com", auth_method="oauth")
+    @pytest.mark.parametrize(
+        "domain, expected",
+        [
+            ("https://example.okta.com", "example.okta.com"),
+            ("http://example.okta.com", "example.okta.com"),
+            ("example.okta.com", "example.okta.com"),
+        ],
+        ids=["strips_https", "strips_http", "bare_domain"],
+    )
+    def test_domain_normalization(self, domain: str, expected: str) -> None:
+        """Test that the protocol is removed from the domain."""
+        assert OktaConfig(domain=domain, api_token="token").domain == expected
 
 
 class TestGrafanaConfig:
@@ -112,30 +156,18 @@ class TestGrafanaConfig:
         assert config.url == "https://grafana.example.com"
         assert config.api_key == "test-key"
 
-    def test_adds_https_to_url(self) -> None:
-        """Test that https:// is added if missing."""
-        config = GrafanaConfig(url="grafana.example.com", api_key="key")
-        assert config.url == "https://grafana.example.com"
-
-    def test_preserves_http_url(self) -> None:
-        """Test that http:// URLs are preserved."""
-        config = GrafanaConfig(url="http://localhost:3000", api_key="key")
-        assert config.url == "http://localhost:3000"
-
-    def test_preserves_https_url(self) -> None:
-        """Test that https:// URLs are preserved."""
-        config = GrafanaConfig(url="https://grafana.example.com", api_key="key")
-        assert config.url == "https://grafana.example.com"
-
-    def test_missing_url(self) -> None:
-        """Test error when URL is missing."""
-        with pytest.raises(ValueError, match="Grafana URL is required"):
-            GrafanaConfig(url="", api_key="key")
-
-    def test_missing_api_key(self) -> None:
-        """Test error when API key is missing."""
-        with pytest.raises(ValueError, match="Grafana API key is required"):
-            GrafanaConfig(url="https://grafana.example.com", api_key="")
+    @pytest.mark.parametrize(
+        "url, expected",
+        [
+            ("grafana.example.com", "https://grafana.example.com"),
+            ("http://localhost:3000", "http://localhost:3000"),
+            ("https://grafana.example.com", "https://grafana.example.com"),
+        ],
+        ids=["adds_https", "preserves_http", "preserves_https"],
+    )
+    def test_url_normalization(self, url: str, expected: str) -> None:
+        """Test that https is added only when the URL has no protocol."""
+        assert GrafanaConfig(url=url, api_key="key").url == expected
 
 
 class TestGroupMapping:
@@ -147,16 +179,6 @@ class TestGroupMapping:
         assert mapping.okta_group == "Engineering"
         assert mapping.grafana_team == "Engineers"
 
-    def test_missing_okta_group(self) -> None:
-        """Test error when Okta group is missing."""
-        with pytest.raises(ValueError, match="Okta group name is required"):
-            GroupMapping(okta_group="", grafana_team="Team")
-
-    def test_missing_grafana_team(self) -> None:
-        """Test error when Grafana team is missing."""
-        with pytest.raises(ValueError, match="Grafana team name is required"):
-            GroupMapping(okta_group="Group", grafana_team="")
-
 
 class TestSyncConfig:
     """Test SyncConfig dataclass."""
@@ -175,22 +197,7 @@ class TestSyncConfig:
         config = SyncConfig(mappings=mappings)
         assert config.interval_seconds == 300
         assert config.dry_run is False
-
-    def test_interval_too_short(self) -> None:
-        """Test error when interval is less than 60 seconds."""
-        mappings = [GroupMapping(okta_group="Group1", grafana_team="Team1")]
-        with pytest.raises(ValueError, match="at least 60 seconds"):
-            SyncConfig(interval_seconds=30, mappings=mappings)
-
-    def test_no_mappings(self) -> None:
-        """Test error when no mappings provided."""
-        with pytest.raises(ValueError, match="At least one group mapping is required"):
-            SyncConfig(interval_seconds=300, mappings=[])
-
-    def test_none_mappings(self) -> None:
-        """Test error when mappings is None."""
-        with pytest.raises(ValueError, match="At least one group mapping is required"):
-            SyncConfig(interval_seconds=300)
+        assert config.max_workers == 8
 
     def test_admin_groups(self) -> None:
         """Test admin groups configuration."""
@@ -232,21 +239,15 @@ class TestLoggingConfig:
         config = LoggingConfig(format="JSON")
         assert config.format == "json"
 
-    def test_invalid_level(self) -> None:
-        """Test error with invalid log level."""
-        with pytest.raises(ValueError, match="Log level must be one of"):
-            LoggingConfig(level="INVALID")
-
-    def test_invalid_format(self) -> None:
-        """Test error with invalid log format."""
-        with pytest.raises(ValueError, match="Log format must be one of"):
-            LoggingConfig(format="xml")
+    @pytest.mark.parametrize("level", ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"])
+    def test_valid_level(self, level: str) -> None:
+        """Test each valid log level."""
+        assert LoggingConfig(level=level).level == level
 
-    def test_all_valid_levels(self) -> None:
-        """Test all valid log levels."""
-        for level in ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]:
-            config = LoggingConfig(level=level)
-            assert config.level == level
+    @pytest.mark.parametrize("log_format", ["json", "text"])
+    def test_valid_format(self, log_format: str) -> None:
+        """Test each valid log format."""
+        assert LoggingConfig(format=log_format).format == log_format
 
 
 class TestMetricsConfig:
@@ -266,16 +267,6 @@ class TestMetricsConfig:
         assert config.port == 9090
         assert config.host == "127.0.0.1"
 
-    def test_invalid_port_too_low(self) -> None:
-        """Test error with port number too low."""
-        with pytest.raises(ValueError, match="Metrics port must be between 1 and 65535"):
-            MetricsConfig(port=0)
-
-    def test_invalid_port_too_high(self) -> None:
-        """Test error with port number too high."""
-        with pytest.raises(ValueError, match="Metrics port must be between 1 and 65535"):
-            MetricsConfig(port=65536)
-
     def test_valid_port_boundaries(self) -> None:
         """Test valid port boundaries."""
         config1 = MetricsConfig(port=1)
@@ -284,425 +275,428 @@ class TestMetricsConfig:
         assert config2.port == 65535
 
 
+class TestValidationErrors:
+    """Test the ValueError contract of every config dataclass."""
+
+    @pytest.mark.parametrize(
+        "ctor, kwargs, message",
+        [
+            pytest.param(
+                OktaOAuthConfig,
+                {"client_id": "", "client_secret": "secret", "scopes": ["okta.groups.read"]},
+                "OAuth client_id is required",
+                id="oauth_missing_client_id",
+            ),
+            pytest.param(
+                OktaOAuthConfig,
+                {"client_id": "id", "client_secret": "", "scopes": ["okta.groups.read"]},
+                "client_secret is required for client_secret_basic",
+                id="oauth_missing_client_secret",
+            ),
+            pytest.param(
+                OktaOAuthConfig,
+                {"client_id": "id", "client_secret": "secret", "scopes": []},
+                "At least one OAuth scope is required",
+                id="oauth_missing_scopes",
+            ),
+            pytest.param(
+                OktaConfig,
+                {"domain": "", "api_token": "token"},
+                "Okta domain is required",
+                id="okta_missing_domain",
+            ),
+            pytest.param(
+                OktaConfig,
+                {"domain": "example.okta.com", "auth_method": "invalid", "api_token": "token"},
+                "auth_method must be one of",
+                id="okta_invalid_auth_method",
+            ),
+            pytest.param(
+                OktaConfig,
+                {"domain": "example.okta.com", "auth_method": "api_token"},
+                "Okta API token is required when using api_token auth method",
+                id="okta_missing_api_token",
+            ),
+            pytest.param(
+                OktaConfig,
+                {"domain": "example.okta.com", "auth_method": "oauth"},
+                "OAuth configuration is required when using oauth auth method",
+                id="okta_missing_oauth",
+            ),
+            pytest.param(
+                GrafanaConfig,
+                {"url": "", "api_key": "key"},
+                "Grafana URL is required",
+                id="grafana_missing_url",
+            ),
+            pytest.param(
+                GrafanaConfig,
+                {"url": "https://grafana.example.com", "api_key": ""},
+                "Grafana API key is required",
+                id="grafana_missing_api_key",
+            ),
+            pytest.param(
+                GroupMapping,
+                {"okta_group": "", "grafana_team": "Team"},
+                "Okta group name is required",
+                id="mapping_missing_okta_group",
+            ),
+            pytest.param(
+                GroupMapping,
+                {"okta_group": "Group", "grafana_team": ""},
+                "Grafana team name is required",
+                id="mapping_missing_grafana_team",
+            ),
+            pytest.param(
+                GroupMapping,
+                {"okta_group": "Group", "grafana_team": "Team", "grafana_role": "Owner"},
+                "grafana_role must be one of",
+                id="mapping_invalid_role",
+            ),
+            pytest.param(
+                SyncConfig,
+                {"interval_seconds": 30, "mappings": [GroupMapping("Group1", "Team1")]},
+                "at least 60 seconds",
+                id="sync_interval_too_short",
+            ),
+            pytest.param(
+                SyncConfig,
+                {"max_workers": 0, "mappings": [GroupMapping("Group1", "Team1")]},
+                "max_workers must be at least 1",
+                id="sync_max_workers_too_small",
+            ),
+            pytest.param(
+                SyncConfig,
+                {"interval_seconds": 300, "mappings": []},
+                "At least one group mapping is required",
+                id="sync_no_mappings",
+            ),
+            pytest.param(
+                SyncConfig,
+                {"interval_seconds": 300},
+                "At least one group mapping is required",
+                id="sync_none_mappings",
+            ),
+            pytest.param(
+                LoggingConfig, {"level": "INVALID"}, "Log level must be one of", id="invalid_level"
+            ),
+            pytest.param(
+                LoggingConfig, {"format": "xml"}, "Log format must be one of", id="invalid_format"
+            ),
+            pytest.param(
+                MetricsConfig,
+                {"port": 0},
+                "Metrics port must be between 1 and 65535",
+                id="metrics_port_too_low",
+            ),
+            pytest.param(
+                MetricsConfig,
+                {"port": 65536},
+                "Metrics port must be between 1 and 65535",
+                id="metrics_port_too_high",
+            ),
+        ],
+    )
+    def test_validation_errors(
+        self, ctor: Callable[..., Any], kwargs: Dict[str, Any], message: str
+    ) -> None:
+        """Test that invalid arguments raise ValueError with a descriptive message."""
+        with pytest.raises(ValueError) as exc_info:
+            ctor(**kwargs)
+        assert message in str(exc_info.value)
+
+
+@pytest.fixture(scope="class")
+def config() -> Config:
+    """Create a minimal Config shared read-only by the tests of one class."""
+    okta = OktaConfig(domain="example.okta.com", api_token="token")
+    grafana = GrafanaConfig(url="https://grafana.example.com", api_key="key")
+    mappings = [GroupMapping(okta_group="Group1", grafana_team="Team1")]
+    sync = SyncConfig(mappings=mappings)
+    return Config(okta=okta, grafana=grafana, sync=sync)
+
+
 class TestConfig:
     """Test Config dataclass."""
 
-    def test_valid_config(self) -> None:
+    def test_valid_config(self, config: Config) -> None:
         """Test valid configuration."""
-        okta = OktaConfig(domain="example.okta.com", api_token="token")
-        grafana = GrafanaConfig(url="https://grafana.example.com", api_key="key")
-        mappings = [GroupMapping(okta_group="Group1", grafana_team="Team1")]
-        sync = SyncConfig(mappings=mappings)
-
-        config = Config(okta=okta, grafana=grafana, sync=sync)
         assert config.okta.domain == "example.okta.com"
         assert config.grafana.url == "https://grafana.example.com"
         assert len(config.sync.mappings) == 1
 
-    def test_default_logging_config(self) -> None:
+    def test_default_logging_config(self, config: Config) -> None:
         """Test that logging config is set to default if not provided."""
-        okta = OktaConfig(domain="example.okta.com", api_token="token")
-        grafana = GrafanaConfig(url="https://grafana.example.com", api_key="key")
-        mappings = [GroupMapping(okta_group="Group1", grafana_team="Team1")]
-        sync = SyncConfig(mappings=mappings)
-
-        config = Config(okta=okta, grafana=grafana, sync=sync)
         assert config.logging is not None
         assert config.logging.level == "INFO"
         assert config.logging.format == "json"
 
-    def test_default_metrics_config(self) -> None:
+    def test_default_metrics_config(self, config: Config) -> None:
         """Test that metrics config is set to default if not provided."""
-        okta = OktaConfig(domain="example.okta.com", api_token="token")
-        grafana = GrafanaConfig(url="https://grafana.example.com", api_key="key")
-        mappings = [GroupMapping(okta_group="Group1", grafana_team="Team1")]
-        sync = SyncConfig(mappings=mappings)
-
-        config = Config(okta=okta, grafana=grafana, sync=sync)
         assert config.metrics is not None
         assert config.metrics.enabled is False
         assert config.metrics.port == 8000
         assert config.metrics.host == "0.0.0.0"
 
+    def test_config_classes_use_slots(self, config: Config) -> None:
+        """Test that config instances have no per-instance __dict__."""
+        sections = (config.okta, config.grafana, config.sync, config.logging, config.metrics)
+        for instance in (config, config.sync.mappings[0], *sections):
+            assert not hasattr(instance, "__dict__")
+        with pytest.raises(AttributeError):
+            config.unknown_section = {}  # type: ignore[attr-defined]
+
+
+class TestEnvBool:
+    """Test boolean flag parsing."""
+
+    @pytest.mark.parametrize(
+        "value, expected",
+        [
+            ("true", True),
+            ("True", True),
+            (" 1 ", True),
+            ("yes", True),
+            ("ON", True),
+            ("false", False),
+            ("0", False),
+            ("", False),
+            ("enabled", False),
+        ],
+    )
+    def test_env_bool(self, value: str, expected: bool) -> None:
+        """Test that truthy spellings parse as True and everything else as False."""
+        assert _env_bool(value) is expected
+
 
 class TestConfigLoader:
     """Test ConfigLoader class."""
 
-    def test_load_from_yaml(self) -> None:
+    def test_load_from_yaml(self, base_config: Config) -> None:
         """Test loading configuration from YAML file."""
-        yaml_content = """
-okta:
-  domain: example.okta.com
-  api_token: test-token
-
-grafana:
-  url: https://grafana.example.com
-  api_key: test-key
-
-sync:
-  interval_seconds: 300
-  dry_run: false
-  mappings:
-    - okta_group: "Group1"
-      grafana_team: "Team1"
-
-logging:
-  level: DEBUG
-  format: text
-"""
-
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            f.write(yaml_content)
-            config_path = f.name
-
-        try:
-            config = ConfigLoader.load(config_path)
-            assert config.okta.domain == "example.okta.com"
-            assert config.okta.api_token == "test-token"
-            assert config.grafana.url == "https://grafana.example.com"
-            assert config.grafana.api_key == "test-key"
-            assert config.sync.interval_seconds == 300
-            assert config.sync.dry_run is False
-            assert len(config.sync.mappings) == 1
-            assert config.sync.mappings[0].okta_group == "Group1"
-            assert config.sync.mappings[0].grafana_team == "Team1"
-            assert config.logging.level == "DEBUG"
-            assert config.logging.format == "text"
-        finally:
-            Path(config_path).unlink()
-
-    def test_expand_env_vars(self) -> None:
+        assert base_config.okta.domain == "example.okta.com"
+        assert base_config.okta.api_token == "test-token"
+        assert base_config.grafana.url == "https://grafana.example.com"
+        assert base_config.grafana.api_key == "test-key"
+        assert base_config.sync.interval_seconds == 300
+        assert base_config.sync.dry_run is False
+        assert len(base_config.sync.mappings) == 1
+        assert base_config.sync.mappings[0].okta_group == "Group1"
+        assert base_config.sync.mappings[0].grafana_team == "Team1"
+        assert base_config.sync.admin_groups == []
+        assert base_config.logging.level == "INFO"
+        assert base_config.logging.format == "json"
+
+    def test_expand_env_vars(self, monkeypatch: pytest.MonkeyPatch) -> None:
         """Test environment variable expansion."""
-        os.environ["TEST_OKTA_DOMAIN"] = "env.okta.com"
-        os.environ["TEST_OKTA_TOKEN"] = "env-token"
-
-        yaml_content = """
-okta:
-  domain: ${TEST_OKTA_DOMAIN}
-  api_token: ${TEST_OKTA_TOKEN}
-
-grafana:
-  url: https://grafana.example.com
-  api_key: test-key
-
-sync:
-  interval_seconds: 300
-  dry_run: false
-  mappings:
-    - okta_group: "Group1"
-      grafana_team: "Team1"
-"""
-
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            f.write(yaml_content)
-            config_path = f.name
-
-        try:
-            config = ConfigLoader.load(config_path)
-            assert config.okta.domain == "env.okta.com"
-            assert config.okta.api_token == "env-token"
-        finally:
-            Path(config_path).unlink()
-            del os.environ["TEST_OKTA_DOMAIN"]
-            del os.environ["TEST_OKTA_TOKEN"]
-
-    def test_env_vars_override_yaml(self) -> None:
-        """Test that environment variables override YAML config."""
-        os.environ["OKTA_DOMAIN"] = "override.okta.com"
-        os.environ["GRAFANA_API_KEY"] = "override-key"
-
-        yaml_content = """
-okta:
-  domain: original.okta.com
-  api_token: test-token
-
-grafana:
-  url: https://grafana.example.com
-  api_key: original-key
-
-sync:
-  interval_seconds: 300
-  dry_run: false
-  mappings:
-    - okta_group: "Group1"
-      grafana_team: "Team1"
-"""
-
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            f.write(yaml_content)
-            config_path = f.name
-
-        try:
-            config = ConfigLoader.load(config_path)
-            assert config.okta.domain == "override.okta.com"
-            assert config.grafana.api_key == "override-key"
-        finally:
-            Path(config_path).unlink()
-            del os.environ["OKTA_DOMAIN"]
-            del os.environ["GRAFANA_API_KEY"]
+        monkeypatch.setenv("TEST_OKTA_DOMAIN", "env.okta.com")
+        monkeypatch.setenv("TEST_OKTA_TOKEN", "env-token")
+
+        yaml_content = CONFIG_YAML_TEMPLATE % {
+            "okta": "  domain: ${TEST_OKTA_DOMAIN}\n  api_token: ${TEST_OKTA_TOKEN}\n"
+        }
+
+        config = ConfigLoader.load_from_string(yaml_content)
+        assert config.okta.domain == "env.okta.com"
+        assert config.okta.api_token == "env-token"
+
+    def test_expand_env_vars_in_nested_values(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test expansion of several variables per string, with unset ones left empty."""
+        monkeypatch.setenv("TEST_HOST", "grafana")
+        monkeypatch.setenv("TEST_PORT", "3000")
+        monkeypatch.delenv("TEST_UNSET", raising=False)
+
+        value = {"urls": ["https://${TEST_HOST}:${TEST_PORT}/${TEST_UNSET}"], "port": 3000}
+        assert ConfigLoader._expand_env_vars(value) == {
+            "urls": ["https://grafana:3000/"],
+            "port": 3000,
+        }
+
+    @pytest.mark.parametrize(
+        "extra_yaml, env, check",
+        [
+            pytest.param(
+                "",
+                {"OKTA_DOMAIN": "override.okta.com", "GRAFANA_API_KEY": "override-key"},
+                lambda c: c.okta.domain == "override.okta.com"
+                and c.grafana.api_key == "override-key",
+                id="env_vars_override_yaml",
+            ),
+            pytest.param(
+                MULTIPLE_MAPPINGS_YAML,
+                {},
+                lambda c: [m.okta_group for m in c.sync.mappings] == ["Group1", "Group2", "Group3"],
+                id="multiple_mappings",
+            ),
+            pytest.param(
+                '    - okta_group: "Équipe Données"\n      grafana_team: "Données"\n',
+                {},
+                lambda c: c.sync.mappings[1].okta_group == "Équipe Données",
+                id="utf8_mapping",
+            ),
+            pytest.param(
+                '    - okta_group: "Group2"\n      grafana_team: "Team2"\n'
+                "      grafana_role: Editor\n      description: ignored\n",
+                {},
+                lambda c: c.sync.mappings[1].grafana_role == "Editor",
+                id="mapping_unknown_keys_ignored",
+            ),
+            pytest.param(
+                "",
+                {"SYNC_DRY_RUN": "true"},
+                lambda c: c.sync.dry_run is True,
+                id="dry_run_from_env",
+            ),
+            pytest.param(
+                "",
+                {"SYNC_INTERVAL_SECONDS": "600"},
+                lambda c: c.sync.interval_seconds == 600,
+                id="interval_from_env",
+            ),
+            pytest.param(
+                "  max_workers: 4\n",
+                {},
+                lambda c: c.sync.max_workers == 4,
+                id="max_workers_from_yaml",
+            ),
+            pytest.param(
+                "  max_workers: 4\n",
+                {"SYNC_MAX_WORKERS": "16"},
+                lambda c: c.sync.max_workers == 16,
+                id="max_workers_from_env",
+            ),
+            pytest.param(
+                METRICS_YAML,
+                {},
+                lambda c: c.metrics.enabled is True
+                and c.metrics.port == 9090
+                and c.metrics.host == "127.0.0.1",
+                id="metrics_from_yaml",
+            ),
+            pytest.param(
+                "",
+                {"METRICS_ENABLED": "true", "METRICS_PORT": "9999", "METRICS_HOST": "localhost"},
+                lambda c: c.metrics.enabled is True
+                and c.metrics.port == 9999
+                and c.metrics.host == "localhost",
+                id="metrics_from_env",
+            ),
+            pytest.param(
+                ADMIN_GROUPS_YAML,
+                {},
+                lambda c: c.sync.admin_groups == ["Grafana-Admins", "Platform-Team", "SRE"],
+                id="admin_groups_from_yaml",
+            ),
+            pytest.param(
+                "\nlogging:\n  level: DEBUG\n  format: text\n",
+                {},
+                lambda c: c.logging.level == "DEBUG" and c.logging.format == "text",
+                id="logging_from_yaml",
+            ),
+        ],
+    )
+    def test_loader_variants(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+        extra_yaml: str,
+        env: Dict[str, str],
+        check: Callable[[Config], bool],
+    ) -> None:
+        """Test ConfigLoader against variations of the base YAML and environment."""
+        for name, value in env.items():
+            monkeypatch.setenv(name, value)
+
+        config = ConfigLoader.load_from_string(BASE_YAML + extra_yaml)
+        assert check(config)
+
+    def test_load_reparses_modified_file(self, yaml_config: Callable[[str], str]) -> None:
+        """Test that a changed file is read again on the next load."""
+        config_path = yaml_config(BASE_YAML)
+        assert ConfigLoader.load(config_path).sync.admin_groups == []
+
+        Path(config_path).write_text(BASE_YAML + ADMIN_GROUPS_YAML, encoding="utf-8")
+        config = ConfigLoader.load(config_path)
+        assert config.sync.admin_groups == ["Grafana-Admins", "Platform-Team", "SRE"]
+
+    def test_env_overrides_apply_per_load(
+        self, monkeypatch: pytest.MonkeyPatch, yaml_config: Callable[[str], str]
+    ) -> None:
+        """Test that environment overrides only affect the load they were set for."""
+        config_path = yaml_config(BASE_YAML)
+        monkeypatch.setenv("OKTA_DOMAIN", "env.okta.com")
+        assert ConfigLoader.load(config_path).okta.domain == "env.okta.com"
+
+        monkeypatch.delenv("OKTA_DOMAIN")
+        assert ConfigLoader.load(config_path).okta.domain == "example.okta.com"
+
+    def test_uses_libyaml_loader_when_available(self) -> None:
+        """Test that the C YAML loader is selected whenever PyYAML ships with libyaml."""
+        if not yaml.__with_libyaml__:
+            pytest.skip("PyYAML built without libyaml")
+        assert _YamlLoader is yaml.CSafeLoader
 
     def test_missing_config_file(self) -> None:
         """Test error when config file doesn't exist."""
         with pytest.raises(FileNotFoundError):
             ConfigLoader.load("/nonexistent/config.yaml")
 
-    def test_invalid_yaml(self) -> None:
+    def test_invalid_yaml(self, yaml_config: Callable[[str], str]) -> None:
         """Test error with invalid YAML."""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            f.write("invalid: yaml: content: [")
-            config_path = f.name
-
-        try:
-            with pytest.raises(Exception):  # yaml.YAMLError
-                ConfigLoader.load(config_path)
-        finally:
-            Path(config_path).unlink()
-
-    def test_multiple_mappings(self) -> None:
-        """Test loading multiple group mappings."""
-        yaml_content = """
-okta:
-  domain: example.okta.com
-  api_token: test-token
+        config_path = yaml_config("invalid: yaml: content: [")
 
-grafana:
-  url: https://grafana.example.com
-  api_key: test-key
-
-sync:
-  interval_seconds: 300
-  dry_run: false
-  mappings:
-    - okta_group: "Group1"
-      grafana_team: "Team1"
-    - okta_group: "Group2"
-      grafana_team: "Team2"
-    - okta_group: "Group3"
-      grafana_team: "Team3"
-"""
+        with pytest.raises(yaml.YAMLError):
+            ConfigLoader.load(config_path)
 
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            f.write(yaml_content)
-            config_path = f.name
-
-        try:
-            config = ConfigLoader.load(config_path)
-            assert len(config.sync.mappings) == 3
-            assert config.sync.mappings[0].okta_group == "Group1"
-            assert config.sync.mappings[1].okta_group == "Group2"
-            assert config.sync.mappings[2].okta_group == "Group3"
-        finally:
-            Path(config_path).unlink()
-
-    def test_dry_run_from_env(self) -> None:
-        """Test dry_run configuration from environment variable."""
-        os.environ["SYNC_DRY_RUN"] = "true"
-
-        yaml_content = """
-okta:
-  domain: example.okta.com
-  api_token: test-token
-
-grafana:
-  url: https://grafana.example.com
-  api_key: test-key
-
-sync:
-  interval_seconds: 300
-  dry_run: false
-  mappings:
-    - okta_group: "Group1"
-      grafana_team: "Team1"
-"""
-
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            f.write(yaml_content)
-            config_path = f.name
-
-        try:
-            config = ConfigLoader.load(config_path)
-            assert config.sync.dry_run is True
-        finally:
-            Path(config_path).unlink()
-            del os.environ["SYNC_DRY_RUN"]
-
-    def test_interval_from_env(self) -> None:
-        """Test interval configuration from environment variable."""
-        os.environ["SYNC_INTERVAL_SECONDS"] = "600"
-
-        yaml_content = """
-okta:
-  domain: example.okta.com
-  api_token: test-token
-
-grafana:
-  url: https://grafana.example.com
-  api_key: test-key
-
-sync:
-  interval_seconds: 300
-  dry_run: false
-  mappings:
-    - okta_group: "Group1"
-      grafana_team: "Team1"
-"""
-
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            f.write(yaml_content)
-            config_path = f.name
-
-        try:
-            config = ConfigLoader.load(config_path)
-            assert config.sync.interval_seconds == 600
-        finally:
-            Path(config_path).unlink()
-            del os.environ["SYNC_INTERVAL_SECONDS"]
-
-    def test_metrics_from_yaml(self) -> None:
-        """Test loading metrics configuration from YAML."""
-        yaml_content = """
-okta:
-  domain: example.okta.com
-  api_token: test-token
-
-grafana:
-  url: https://grafana.example.com
-  api_key: test-key
-
-sync:
-  interval_seconds: 300
-  dry_run: false
-  mappings:
-    - okta_group: "Group1"
-      grafana_team: "Team1"
-
-metrics:
-  enabled: true
-  port: 9090
-  host: 127.0.0.1
-"""
-
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            f.write(yaml_content)
-            config_path = f.name
-
-        try:
-            config = ConfigLoader.load(config_path)
-            assert config.metrics is not None
-            assert config.metrics.enabled is True
-            assert config.metrics.port == 9090
-            assert config.metrics.host == "127.0.0.1"
-        finally:
-            Path(config_path).unlink()
-
-    def test_metrics_from_env(self) -> None:
-        """Test loading metrics configuration from environment variables."""
-        os.environ["METRICS_ENABLED"] = "true"
-        os.environ["METRICS_PORT"] = "9999"
-        os.environ["METRICS_HOST"] = "localhost"
-
-        yaml_content = """
-okta:
-  domain: example.okta.com
-  api_token: test-token
-
-grafana:
-  url: https://grafana.example.com
-  api_key: test-key
-
-sync:
-  interval_seconds: 300
-  dry_run: false
-  mappings:
-    - okta_group: "Group1"
-      grafana_team: "Team1"
-"""
-
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            f.write(yaml_content)
-            config_path = f.name
-
-        try:
-            config = ConfigLoader.load(config_path)
-            assert config.metrics.enabled is True
-            assert config.metrics.port == 9999
-            assert config.metrics.host == "localhost"
-        finally:
-            Path(config_path).unlink()
-            del os.environ["METRICS_ENABLED"]
-            del os.environ["METRICS_PORT"]
-            del os.environ["METRICS_HOST"]
-
-    def test_admin_groups_from_yaml(self) -> None:
-        """Test loading admin groups from YAML."""
-        yaml_content = """
-okta:
-  domain: example.okta.com
-  api_token: test-token
-
-grafana:
-  url: https://grafana.example.com
-  api_key: test-key
-
-sync:
-  interval_seconds: 300
-  dry_run: false
-  mappings:
-    - okta_group: "Group1"
-      grafana_team: "Team1"
-  admin_groups:
-    - "Grafana-Admins"
-    - "Platform-Team"
-    - "SRE"
-"""
+    def test_load_from_string_mapping_missing_required_key(self) -> None:
+        """Test that a mapping without okta_group fails with a KeyError naming the key."""
+        yaml_content = BASE_YAML.replace(
+            '    - okta_group: "Group1"\n      grafana_team', "    - grafana_team"
+        )
+        with pytest.raises(KeyError, match="okta_group"):
+            ConfigLoader.load_from_string(yaml_content)
 
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            f.write(yaml_content)
-            config_path = f.name
-
-        try:
-            config = ConfigLoader.load(config_path)
-            assert config.sync.admin_groups is not None
-            assert len(config.sync.admin_groups) == 3
-            assert "Grafana-Admins" in config.sync.admin_groups
-            assert "Platform-Team" in config.sync.admin_groups
-            assert "SRE" in config.sync.admin_groups
-        finally:
-            Path(config_path).unlink()
-
-    def test_admin_groups_empty_when_not_specified(self) -> None:
-        """Test that admin_groups defaults to empty list when not in YAML."""
-        yaml_content = """
-okta:
-  domain: example.okta.com
-  api_token: test-token
+    def test_load_from_string_invalid_yaml(self) -> None:
+        """Test error with invalid in-memory YAML."""
+        with pytest.raises(yaml.YAMLError):
+            ConfigLoader.load_from_string("invalid: yaml: content: [")
 
-grafana:
-  url: https://grafana.example.com
-  api_key: test-key
-
-sync:
-  interval_seconds: 300
-  dry_run: false
-  mappings:
-    - okta_group: "Group1"
-      grafana_team: "Team1"
-"""
-
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            f.write(yaml_content)
-            config_path = f.name
+    def test_load_from_string_accepts_bytes(self) -> None:
+        """Test loading configuration from UTF-8 encoded YAML."""
+        config = ConfigLoader.load_from_string(BASE_YAML.encode("utf-8"))
+        assert config.okta.domain == "example.okta.com"
 
-        try:
-            config = ConfigLoader.load(config_path)
-            assert config.sync.admin_groups == []
-        finally:
-            Path(config_path).unlink()
+    @pytest.mark.parametrize(
+        "content",
+        [
+            json.dumps(yaml.safe_load(BASE_YAML)),
+            json.dumps(yaml.safe_load(BASE_YAML)).encode("utf-8"),
+        ],
+        ids=["str", "bytes"],
+    )
+    def test_load_from_string_json_fast_path(self, content: Any) -> None:
+        """Test that JSON configuration is parsed without going through YAML."""
+        with patch("src.config.yaml.load", wraps=yaml.load) as yaml_load:
+            config = ConfigLoader.load_from_string(content)
+
+        yaml_load.assert_not_called()
+        assert config.okta.domain == "example.okta.com"
+        assert config.sync.mappings is not None
+        assert config.sync.mappings[0].grafana_team == "Team1"
+
+    def test_load_from_string_yaml_flow_mapping(self) -> None:
+        """Test that a YAML flow mapping rejected by json.loads still parses as YAML."""
+        flow_yaml = (
+            "{okta: {domain: example.okta.com, api_token: test-token}, "
+            "grafana: {url: https://grafana.example.com, api_key: test-key}, "
+            "sync: {mappings: [{okta_group: Group1, grafana_team: Team1}]}}"
+        )
+        config = ConfigLoader.load_from_string(flow_yaml)
+        assert config.okta.domain == "example.okta.com"
 
     def test_load_oauth_config_from_yaml(self) -> None:
         """Test loading OAuth configuration from YAML."""
-        yaml_content = """
-okta:
+        yaml_content = CONFIG_YAML_TEMPLATE % {
+            "okta": """\
   domain: example.okta.com
   auth_method: oauth
   oauth:
@@ -711,71 +705,29 @@ okta:
     scopes:
       - okta.groups.read
       - okta.users.read
-
-grafana:
-  url: https://grafana.example.com
-  api_key: test-key
-
-sync:
-  interval_seconds: 300
-  dry_run: false
-  mappings:
-    - okta_group: "Group1"
-      grafana_team: "Team1"
 """
+        }
 
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            f.write(yaml_content)
-            config_path = f.name
-
-        try:
-            config = ConfigLoader.load(config_path)
-            assert config.okta.auth_method == "oauth"
-            assert config.okta.oauth is not None
-            assert config.okta.oauth.client_id == "test-client-id"
-            assert config.okta.oauth.client_secret == "test-secret"
-            assert config.okta.oauth.scopes == ["okta.groups.read", "okta.users.read"]
-            assert config.okta.api_token is None
-        finally:
-            Path(config_path).unlink()
-
-    def test_load_oauth_config_from_env(self) -> None:
-        """Test loading OAuth configuration from environment variables."""
-        os.environ["OKTA_AUTH_METHOD"] = "oauth"
-        os.environ["OKTA_CLIENT_ID"] = "env-client-id"
-        os.environ["OKTA_CLIENT_SECRET"] = "env-secret"
-        os.environ["OKTA_SCOPES"] = "okta.groups.read,okta.users.read"
+        config = ConfigLoader.load_from_string(yaml_content)
+        assert config.okta.auth_method == "oauth"
+        assert config.okta.oauth is not None
+        assert config.okta.oauth.client_id == "test-client-id"
+        assert config.okta.oauth.client_secret == "test-secret"
+        assert config.okta.oauth.scopes == ["okta.groups.read", "okta.users.read"]
+        assert config.okta.api_token is None
 
-        yaml_content = """
-okta:
-  domain: example.okta.com
-
-grafana:
-  url: https://grafana.example.com
-  api_key: test-key
-
-sync:
-  interval_seconds: 300
-  dry_run: false
-  mappings:
-    - okta_group: "Group1"
-      grafana_team: "Team1"
-"""
-
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            f.write(yaml_content)
-            config_path = f.name
-
-        try:
-            config = ConfigLoader.load(config_path)
-            assert config.okta.auth_method == "oauth"
-            assert config.okta.oauth is not None
-            assert config.okta.oauth.client_id == "env-client-id"
-            assert config.okta.oauth.client_secret == "env-secret"
-            assert config.okta.oauth.scopes == ["okta.groups.read", "okta.users.read"]
-        finally:
-            Path(config_path).unlink()
-            del os.environ["OKTA_AUTH_METHOD"]
-            del os.environ["OKTA_CLIENT_ID"]
-            del os.environ["OKTA_CLIENT_SECRET"]
-            del os.environ["OKTA_SCOPES"]
+    def test_load_oauth_config_from_env(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test loading OAuth configuration from environment variables."""
+        monkeypatch.setenv("OKTA_AUTH_METHOD", "oauth")
+        monkeypatch.setenv("OKTA_CLIENT_ID", "env-client-id")
+        monkeypatch.setenv("OKTA_CLIENT_SECRET", "env-secret")
+        monkeypatch.setenv("OKTA_SCOPES", "okta.groups.read,okta.users.read")
+
+        yaml_content = CONFIG_YAML_TEMPLATE % {"okta": "  domain: example.okta.com\n"}
+
+        config = ConfigLoader.load_from_string(yaml_content)
+        assert config.okta.auth_method == "oauth"
+        assert config.okta.oauth is not None
+        assert config.okta.oauth.client_id == "env-client-id"
+        assert config.okta.oauth.client_secret == "env-secret"
+        assert config.okta.oauth.scopes == ["okta.groups.read", "okta.users.read"]
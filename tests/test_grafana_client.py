@@ -1,5 +1,9 @@
 """Tests for Grafana API client."""
+import json
+from typing import Any, Dict, List, Optional, Tuple, Type
+
 import pytest
+import requests
 import responses
 
 from src.grafana_client import (
@@ -10,20 +14,56 @@ from src.grafana_client import (
     GrafanaNotFoundError,
 )
 
+GRAFANA_URL = "https://grafana.example.com"
+TEAMS_URL = f"{GRAFANA_URL}/api/teams"
+TEAM_SEARCH_URL = f"{TEAMS_URL}/search"
+ORG_USERS_URL = f"{GRAFANA_URL}/api/org/users"
+ADMIN_USERS_URL = f"{GRAFANA_URL}/api/admin/users"
+
+# Response bodies shared by several tests
+TEAM_CREATED = {"teamId": 42, "message": "Team created"}
+USER_CREATED = {"id": 456, "message": "User created"}
+PERMISSIONS_UPDATED = {"message": "User permissions updated"}
+
+
+def _team(team_id: int, name: str, **extra: Any) -> Dict[str, Any]:
+    """Build a team search result entry."""
+    return {"id": team_id, "name": name, **extra}
+
+
+def _add_team_search(rsps: responses.RequestsMock, body: Any, status: int = 200) -> None:
+    """Register a response for the team search endpoint."""
+    rsps.add(responses.GET, TEAM_SEARCH_URL, json=body, status=status)
+
+
+def _add_org_users(rsps: responses.RequestsMock, body: Any, status: int = 200) -> None:
+    """Register a response for the organization users endpoint."""
+    rsps.add(responses.GET, ORG_USERS_URL, json=body, status=status)
+
+
+def _add_json_sequence(rsps: responses.RequestsMock, url: str, bodies: List[Any]) -> None:
+    """Register one GET route that serves the given JSON bodies in order, one per call."""
+    remaining = iter(bodies)
+
+    def callback(_request: requests.PreparedRequest) -> Tuple[int, Dict[str, str], str]:
+        return 200, {}, json.dumps(next(remaining))
+
+    rsps.add_callback(responses.GET, url, callback=callback, content_type="application/json")
+
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def grafana_client() -> GrafanaClient:
-    """Create Grafana client fixture."""
-    return GrafanaClient(url="https://grafana.example.com", api_key="test-api-key")
+    """Create a Grafana client shared by all tests in this module."""
+    return GrafanaClient(url=GRAFANA_URL, api_key="test-api-key")
 
 
-class TestGrafanaClient:
-    """Test GrafanaClient class."""
+class TestClientInit:
+    """Test GrafanaClient construction and session setup."""
 
     def test_init_strips_trailing_slash(self) -> None:
         """Test that trailing slash is stripped from URL."""
-        client = GrafanaClient(url="https://grafana.example.com/", api_key="key")
-        assert client.base_url == "https://grafana.example.com"
+        client = GrafanaClient(url=f"{GRAFANA_URL}/", api_key="key")
+        assert client.base_url == GRAFANA_URL
 
     def test_session_headers(self, grafana_client: GrafanaClient) -> None:
         """Test that session has correct headers."""
@@ -31,95 +71,71 @@ class TestGrafanaClient:
         assert grafana_client.session.headers["Content-Type"] == "application/json"
         assert grafana_client.session.headers["Accept"] == "application/json"
 
-    @responses.activate
-    def test_get_team_by_name_success(self, grafana_client: GrafanaClient) -> None:
+    def test_session_connection_pool(self) -> None:
+        """Test that the session uses a single keep-alive pool of the requested size."""
+        client = GrafanaClient(url=GRAFANA_URL, api_key="key", pool_maxsize=4)
+        adapter = client.session.get_adapter(ORG_USERS_URL)
+        assert adapter._pool_connections == 1
+        assert adapter._pool_maxsize == 4
+
+
+class TestTeams:
+    """Test team lookup and creation."""
+
+    def test_get_team_by_name_success(
+        self, grafana_client: GrafanaClient, mocked_responses: responses.RequestsMock
+    ) -> None:
         """Test successful team lookup."""
-        mock_response = {
-            "teams": [
-                {
-                    "id": 1,
-                    "name": "Engineering",
-                    "email": "eng@example.com",
-                    "avatarUrl": "/avatar/abc",
-                }
-            ]
-        }
-
-        responses.add(
-            responses.GET,
-            "https://grafana.example.com/api/teams/search",
-            json=mock_response,
-            status=200,
-        )
+        engineering = _team(1, "Engineering", email="eng@example.com", avatarUrl="/avatar/abc")
+        _add_team_search(mocked_responses, {"teams": [engineering]})
 
         team = grafana_client.get_team_by_name("Engineering")
         assert team is not None
         assert team["id"] == 1
         assert team["name"] == "Engineering"
 
-    @responses.activate
-    def test_get_team_by_name_not_found(self, grafana_client: GrafanaClient) -> None:
+    def test_get_team_by_name_not_found(
+        self, grafana_client: GrafanaClient, mocked_responses: responses.RequestsMock
+    ) -> None:
         """Test team not found."""
-        responses.add(
-            responses.GET,
-            "https://grafana.example.com/api/teams/search",
-            json={"teams": []},
-            status=200,
-        )
+        _add_team_search(mocked_responses, {"teams": []})
 
         team = grafana_client.get_team_by_name("NonExistent")
         assert team is None
 
-    @responses.activate
-    def test_get_team_by_name_exact_match(self, grafana_client: GrafanaClient) -> None:
+    def test_get_team_by_name_exact_match(
+        self, grafana_client: GrafanaClient, mocked_responses: responses.RequestsMock
+    ) -> None:
         """Test that exact match is returned when multiple partial matches exist."""
-        mock_response = {
-            "teams": [
-                {"id": 1, "name": "Engineering"},
-                {"id": 2, "name": "Engineering-DevOps"},
-                {"id": 3, "name": "Engineering-QA"},
-            ]
-        }
-
-        responses.add(
-            responses.GET,
-            "https://grafana.example.com/api/teams/search",
-            json=mock_response,
-            status=200,
-        )
+        teams = [
+            _team(1, "Engineering"),
+            _team(2, "Engineering-DevOps"),
+            _team(3, "Engineering-QA"),
+        ]
+        _add_team_search(mocked_responses, {"teams": teams})
 
         team = grafana_client.get_team_by_name("Engineering")
         assert team is not None
         assert team["id"] == 1
 
-    @responses.activate
-    def test_get_team_by_name_list_response(self, grafana_client: GrafanaClient) -> None:
+    def test_get_team_by_name_list_response(
+        self, grafana_client: GrafanaClient, mocked_responses: responses.RequestsMock
+    ) -> None:
         """Test team lookup when API returns a list instead of dict with teams key."""
-        mock_response = [
-            {"id": 1, "name": "Engineering"},
-            {"id": 2, "name": "DevOps"},
-        ]
-
-        responses.add(
-            responses.GET,
-            "https://grafana.example.com/api/teams/search",
-            json=mock_response,
-            status=200,
-        )
+        _add_team_search(mocked_responses, [_team(1, "Engineering"), _team(2, "DevOps")])
 
         team = grafana_client.get_team_by_name("Engineering")
         assert team is not None
         assert team["id"] == 1
 
-    @responses.activate
-    def test_create_team_success(self, grafana_client: GrafanaClient) -> None:
+    def test_create_team_success(
+        self, grafana_client: GrafanaClient, mocked_responses: responses.RequestsMock
+    ) -> None:
         """Test successful team creation."""
-        mock_response = {"teamId": 42, "message": "Team created"}
-
-        responses.add(
+        mocked_responses.add(
             responses.POST,
-            "https://grafana.example.com/api/teams",
-            json=mock_response,
+            TEAMS_URL,
+            json=TEAM_CREATED,
             status=200,
         )
 
@@ -127,27 +143,27 @@ class TestGrafanaClient:
         assert result["teamId"] == 42
         assert result["message"] == "Team created"
 
-    @responses.activate
-    def test_create_team_without_email(self, grafana_client: GrafanaClient) -> None:
+    def test_create_team_without_email(
+        self, grafana_client: GrafanaClient, mocked_responses: responses.RequestsMock
+    ) -> None:
         """Test team creation without email."""
-        mock_response = {"teamId": 42, "message": "Team created"}
-
-        responses.add(
+        mocked_responses.add(
             responses.POST,
-            "https://grafana.example.com/api/teams",
-            json=mock_response,
+            TEAMS_URL,
+            json=TEAM_CREATED,
             status=200,
         )
 
         result = grafana_client.create_team("NewTeam")
         assert result["teamId"] == 42
 
-    @responses.activate
-    def test_create_team_conflict(self, grafana_client: GrafanaClient) -> None:
+    def test_create_team_conflict(
+        self, grafana_client: GrafanaClient, mocked_responses: responses.RequestsMock
+    ) -> None:
         """Test team creation when team already exists."""
-        responses.add(
+        mocked_responses.add(
             responses.POST,
-            "https://grafana.example.com/api/teams",
+            TEAMS_URL,
             json={"message": "Team name taken"},
             status=409,
         )
@@ -155,83 +171,64 @@ class TestGrafanaClient:
         with pytest.raises(GrafanaConflictError, match="Resource already exists"):
             grafana_client.create_team("ExistingTeam")
 
-    @responses.activate
-    def test_get_or_create_team_existing(self, grafana_client: GrafanaClient) -> None:
-        """Test get_or_create_team when team exists."""
-        mock_response = {"teams": [{"id": 1, "name": "Engineering"}]}
-
-        responses.add(
-            responses.GET,
-            "https://grafana.example.com/api/teams/search",
-            json=mock_response,
-            status=200,
-        )
-
-        team = grafana_client.get_or_create_team("Engineering")
-        assert team["id"] == 1
-
-    @responses.activate
-    def test_get_or_create_team_new(self, grafana_client: GrafanaClient) -> None:
-        """Test get_or_create_team when team doesn't exist."""
-        # First call: team not found
-        responses.add(
-            responses.GET,
-            "https://grafana.example.com/api/teams/search",
-            json={"teams": []},
-            status=200,
-        )
-
-        # Second call: create team
-        responses.add(
+    def test_201_created_response(
+        self, grafana_client: GrafanaClient, mocked_responses: responses.RequestsMock
+    ) -> None:
+        """Test that 201 Created is handled as success."""
+        mocked_responses.add(
             responses.POST,
-            "https://grafana.example.com/api/teams",
-            json={"teamId": 42, "message": "Team created"},
-            status=200,
-        )
-
-        # Third call: get created team
-        responses.add(
-            responses.GET,
-            "https://grafana.example.com/api/teams/search",
-            json={"teams": [{"id": 42, "name": "NewTeam"}]},
-            status=200,
+            TEAMS_URL,
+            json=TEAM_CREATED,
+            status=201,
         )
 
-        team = grafana_client.get_or_create_team("NewTeam")
-        assert team["id"] == 42
-
-    @responses.activate
-    def test_get_or_create_team_creation_failed(self, grafana_client: GrafanaClient) -> None:
-        """Test get_or_create_team when creation succeeds but retrieval fails."""
-        # First call: team not found
-        responses.add(
-            responses.GET,
-            "https://grafana.example.com/api/teams/search",
-            json={"teams": []},
-            status=200,
-        )
+        result = grafana_client.create_team("NewTeam")
+        assert result["teamId"] == 42
 
-        # Second call: create team
-        responses.add(
+    @pytest.mark.parametrize(
+        "searches, created, expected_id",
+        [
+            pytest.param([{"teams": [_team(1, "Engineering")]}], False, 1, id="existing"),
+            pytest.param(
+                [{"teams": []}, {"teams": [_team(42, "Engineering")]}],
+                True,
+                42,
+                id="new",
+            ),
+            pytest.param([{"teams": []}, {"teams": []}], True, None, id="creation_failed"),
+        ],
+    )
+    def test_get_or_create_team(
+        self,
+        grafana_client: GrafanaClient,
+        mocked_responses: responses.RequestsMock,
+        searches: List[Dict[str, Any]],
+        created: bool,
+        expected_id: Optional[int],
+    ) -> None:
+        """Test get_or_create_team for existing, new and unretrievable teams."""
+        _add_json_sequence(mocked_responses, TEAM_SEARCH_URL, searches)
+        create = mocked_responses.add(
             responses.POST,
-            "https://grafana.example.com/api/teams",
-            json={"teamId": 42, "message": "Team created"},
+            TEAMS_URL,
+            json=TEAM_CREATED,
             status=200,
         )
 
-        # Third call: failed to retrieve created team
-        responses.add(
-            responses.GET,
-            "https://grafana.example.com/api/teams/search",
-            json={"teams": []},
-            status=200,
-        )
+        if expected_id is None:
+            with pytest.raises(GrafanaAPIError, match="Failed to retrieve created team"):
+                grafana_client.get_or_create_team("Engineering")
+        else:
+            assert grafana_client.get_or_create_team("Engineering")["id"] == expected_id
+        assert create.call_count == int(created)
+
 
-        with pytest.raises(GrafanaAPIError, match="Failed to retrieve created team"):
-            grafana_client.get_or_create_team("NewTeam")
+class TestMembership:
+    """Test team membership management."""
 
-    @responses.activate
-    def test_get_team_members_success(self, grafana_client: GrafanaClient) -> None:
+    def test_get_team_members_success(
+        self, grafana_client: GrafanaClient, mocked_responses: responses.RequestsMock
+    ) -> None:
         """Test successful retrieval of team members."""
         mock_response = [
             {
@@ -248,9 +245,9 @@ class TestGrafanaClient:
             },
         ]
 
-        responses.add(
+        mocked_responses.add(
             responses.GET,
-            "https://grafana.example.com/api/teams/1/members",
+            f"{TEAMS_URL}/1/members",
             json=mock_response,
             status=200,
         )
@@ -260,12 +257,13 @@ class TestGrafanaClient:
         assert members[0]["email"] == "user1@example.com"
         assert members[1]["email"] == "user2@example.com"
 
-    @responses.activate
-    def test_get_team_members_empty(self, grafana_client: GrafanaClient) -> None:
+    def test_get_team_members_empty(
+        self, grafana_client: GrafanaClient, mocked_responses: responses.RequestsMock
+    ) -> None:
         """Test retrieval of empty team."""
-        responses.add(
+        mocked_responses.add(
             responses.GET,
-            "https://grafana.example.com/api/teams/1/members",
+            f"{TEAMS_URL}/1/members",
             json=[],
             status=200,
         )
@@ -273,8 +271,58 @@ class TestGrafanaClient:
         members = grafana_client.get_team_members(1)
         assert len(members) == 0
 
-    @responses.activate
-    def test_get_user_by_email_success(self, grafana_client: GrafanaClient) -> None:
+    def test_add_user_to_team_success(
+        self, grafana_client: GrafanaClient, mocked_responses: responses.RequestsMock
+    ) -> None:
+        """Test adding user to team."""
+        mock_response = {"message": "Member added to Team"}
+
+        mocked_responses.add(
+            responses.POST,
+            f"{TEAMS_URL}/1/members",
+            json=mock_response,
+            status=200,
+        )
+
+        result = grafana_client.add_user_to_team(team_id=1, user_id=123)
+        assert result["message"] == "Member added to Team"
+
+    def test_remove_user_from_team_success(
+        self, grafana_client: GrafanaClient, mocked_responses: responses.RequestsMock
+    ) -> None:
+        """Test removing user from team."""
+        mock_response = {"message": "Team Member removed"}
+
+        mocked_responses.add(
+            responses.DELETE,
+            f"{TEAMS_URL}/1/members/123",
+            json=mock_response,
+            status=200,
+        )
+
+        result = grafana_client.remove_user_from_team(team_id=1, user_id=123)
+        assert result["message"] == "Team Member removed"
+
+
+class TestUsers:
+    """Test user lookup, creation and permissions."""
+
+    def test_get_org_users(
+        self, grafana_client: GrafanaClient, mocked_responses: responses.RequestsMock
+    ) -> None:
+        """Test fetching all organization users."""
+        mock_response = [
+            {"userId": 1, "email": "a@example.com", "login": "a", "role": "Viewer"},
+            {"userId": 2, "email": "b@example.com", "login": "b", "role": "Admin"},
+        ]
+        _add_org_users(mocked_responses, mock_response)
+
+        users = grafana_client.get_org_users()
+        assert users == mock_response
+
+    def test_get_user_by_email_success(
+        self, grafana_client: GrafanaClient, mocked_responses: responses.RequestsMock
+    ) -> None:
         """Test successful user lookup."""
         # Mock /api/org/users endpoint (returns list of org users)
         mock_response = [
@@ -288,41 +336,31 @@ class TestGrafanaClient:
             }
         ]
 
-        responses.add(
-            responses.GET,
-            "https://grafana.example.com/api/org/users",
-            json=mock_response,
-            status=200,
-        )
+        _add_org_users(mocked_responses, mock_response)
 
         user = grafana_client.get_user_by_email("user@example.com")
         assert user is not None
         assert user["id"] == 123  # Normalized from userId
         assert user["email"] == "user@example.com"
 
-    @responses.activate
-    def test_get_user_by_email_not_found(self, grafana_client: GrafanaClient) -> None:
+    def test_get_user_by_email_not_found(
+        self, grafana_client: GrafanaClient, mocked_responses: responses.RequestsMock
+    ) -> None:
         """Test user not found."""
         # Return empty list when user doesn't exist
-        responses.add(
-            responses.GET,
-            "https://grafana.example.com/api/org/users",
-            json=[],
-            status=200,
-        )
+        _add_org_users(mocked_responses, [])
 
         user = grafana_client.get_user_by_email("nonexistent@example.com")
         assert user is None
 
-    @responses.activate
-    def test_create_user_success(self, grafana_client: GrafanaClient) -> None:
+    def test_create_user_success(
+        self, grafana_client: GrafanaClient, mocked_responses: responses.RequestsMock
+    ) -> None:
         """Test successful user creation."""
-        mock_response = {"id": 456, "message": "User created"}
-
-        responses.add(
+        mocked_responses.add(
             responses.POST,
-            "https://grafana.example.com/api/admin/users",
-            json=mock_response,
+            ADMIN_USERS_URL,
+            json=USER_CREATED,
             status=200,
         )
 
@@ -331,27 +369,27 @@ class TestGrafanaClient:
         )
         assert result["id"] == 456
 
-    @responses.activate
-    def test_create_user_with_defaults(self, grafana_client: GrafanaClient) -> None:
+    def test_create_user_with_defaults(
+        self, grafana_client: GrafanaClient, mocked_responses: responses.RequestsMock
+    ) -> None:
         """Test user creation with default login and name."""
-        mock_response = {"id": 456, "message": "User created"}
-
-        responses.add(
+        mocked_responses.add(
             responses.POST,
-            "https://grafana.example.com/api/admin/users",
-            json=mock_response,
+            ADMIN_USERS_URL,
+            json=USER_CREATED,
             status=200,
         )
 
         result = grafana_client.create_user(email="newuser@example.com")
         assert result["id"] == 456
 
-    @responses.activate
-    def test_create_user_conflict(self, grafana_client: GrafanaClient) -> None:
+    def test_create_user_conflict(
+        self, grafana_client: GrafanaClient, mocked_responses: responses.RequestsMock
+    ) -> None:
         """Test user creation when user already exists."""
-        responses.add(
+        mocked_responses.add(
             responses.POST,
-            "https://grafana.example.com/api/admin/users",
+            ADMIN_USERS_URL,
             json={"message": "User already exists"},
             status=409,
         )
@@ -359,196 +397,57 @@ class TestGrafanaClient:
         with pytest.raises(GrafanaConflictError, match="Resource already exists"):
             grafana_client.create_user("existing@example.com")
 
-    @responses.activate
-    def test_get_or_create_user_existing(self, grafana_client: GrafanaClient) -> None:
-        """Test get_or_create_user when user exists."""
-        # Mock org/users endpoint
-        mock_response = [
-            {"userId": 123, "email": "user@example.com", "login": "user", "role": "Viewer"}
-        ]
-
-        responses.add(
-            responses.GET,
-            "https://grafana.example.com/api/org/users",
-            json=mock_response,
-            status=200,
-        )
-
-        user = grafana_client.get_or_create_user("user@example.com")
-        assert user["id"] == 123
-
-    @responses.activate
-    def test_get_or_create_user_new(self, grafana_client: GrafanaClient) -> None:
-        """Test get_or_create_user when user doesn't exist."""
-        # First call: user not found (empty list)
-        responses.add(
-            responses.GET,
-            "https://grafana.example.com/api/org/users",
-            json=[],
-            status=200,
-        )
-
-        # Second call: create user
-        responses.add(
-            responses.POST,
-            "https://grafana.example.com/api/admin/users",
-            json={"id": 456, "message": "User created"},
-            status=200,
-        )
-
-        # Third call: get created user (now exists)
-        responses.add(
-            responses.GET,
-            "https://grafana.example.com/api/org/users",
-            json=[
-                {
-                    "userId": 456,
-                    "email": "newuser@example.com",
-                    "login": "newuser",
-                    "role": "Viewer",
-                }
-            ],
-            status=200,
-        )
-
-        user = grafana_client.get_or_create_user("newuser@example.com")
-        assert user["id"] == 456
-
-    @responses.activate
-    def test_get_or_create_user_creation_failed(self, grafana_client: GrafanaClient) -> None:
-        """Test get_or_create_user when creation succeeds but retrieval fails."""
-        # First call: user not found (empty list)
-        responses.add(
-            responses.GET,
-            "https://grafana.example.com/api/org/users",
-            json=[],
-            status=200,
-        )
-
-        # Second call: create user
-        responses.add(
+    @pytest.mark.parametrize(
+        "searches, created, expected_id",
+        [
+            pytest.param(
+                [[{"userId": 123, "email": "user@example.com", "login": "user"}]],
+                False,
+                123,
+                id="existing",
+            ),
+            pytest.param(
+                [[], [{"userId": 456, "email": "user@example.com", "login": "user"}]],
+                True,
+                456,
+                id="new",
+            ),
+            pytest.param([[], []], True, None, id="creation_failed"),
+        ],
+    )
+    def test_get_or_create_user(
+        self,
+        grafana_client: GrafanaClient,
+        mocked_responses: responses.RequestsMock,
+        searches: List[List[Dict[str, Any]]],
+        created: bool,
+        expected_id: Optional[int],
+    ) -> None:
+        """Test get_or_create_user for existing, new and unretrievable users."""
+        _add_json_sequence(mocked_responses, ORG_USERS_URL, searches)
+        create = mocked_responses.add(
             responses.POST,
-            "https://grafana.example.com/api/admin/users",
-            json={"id": 456, "message": "User created"},
+            ADMIN_USERS_URL,
+            json=USER_CREATED,
             status=200,
         )
 
-        # Third call: failed to retrieve created user (still empty list)
-        responses.add(
-            responses.GET,
-            "https://grafana.example.com/api/org/users",
-            json=[],
-            status=200,
-        )
-
-        with pytest.raises(GrafanaAPIError, match="Failed to retrieve created user"):
-            grafana_client.get_or_create_user("newuser@example.com")
-
-    @responses.activate
-    def test_add_user_to_team_success(self, grafana_client: GrafanaClient) -> None:
-        """Test adding user to team."""
-        mock_response = {"message": "Member added to Team"}
-
-        responses.add(
-            responses.POST,
-            "https://grafana.example.com/api/teams/1/members",
-            json=mock_response,
-            status=200,
-        )
+        if expected_id is None:
+            with pytest.raises(GrafanaAPIError, match="Failed to retrieve created user"):
+                grafana_client.get_or_create_user("user@example.com")
+        else:
+            assert grafana_client.get_or_create_user("user@example.com")["id"] == expected_id
+        assert create.call_count == int(created)
 
-        result = grafana_client.add_user_to_team(team_id=1, user_id=123)
-        assert result["message"] == "Member added to Team"
-
-    @responses.activate
-    def test_remove_user_from_team_success(self, grafana_client: GrafanaClient) -> None:
-        """Test removing user from team."""
-        mock_response = {"message": "Team Member removed"}
-
-        responses.add(
-            responses.DELETE,
-            "https://grafana.example.com/api/teams/1/members/123",
-            json=mock_response,
-            status=200,
-        )
-
-        result = grafana_client.remove_user_from_team(team_id=1, user_id=123)
-        assert result["message"] == "Team Member removed"
-
-    @responses.activate
-    def test_authentication_error_401(self, grafana_client: GrafanaClient) -> None:
-        """Test authentication error handling (401)."""
-        responses.add(
-            responses.GET,
-            "https://grafana.example.com/api/teams/search",
-            json={"message": "Invalid API key"},
-            status=401,
-        )
-
-        with pytest.raises(GrafanaAuthenticationError, match="Authentication failed"):
-            grafana_client.get_team_by_name("Engineering")
-
-    @responses.activate
-    def test_authentication_error_403(self, grafana_client: GrafanaClient) -> None:
-        """Test authentication error handling (403)."""
-        responses.add(
-            responses.GET,
-            "https://grafana.example.com/api/teams/search",
-            json={"message": "Access denied"},
-            status=403,
-        )
-
-        with pytest.raises(GrafanaAuthenticationError, match="Authentication failed"):
-            grafana_client.get_team_by_name("Engineering")
-
-    @responses.activate
-    def test_404_error(self, grafana_client: GrafanaClient) -> None:
-        """Test 404 error handling."""
-        responses.add(
-            responses.GET,
-            "https://grafana.example.com/api/teams/999",
-            json={"message": "Team not found"},
-            status=404,
-        )
-
-        with pytest.raises(GrafanaNotFoundError, match="Resource not found"):
-            grafana_client._get("/api/teams/999")
-
-    @responses.activate
-    def test_generic_api_error(self, grafana_client: GrafanaClient) -> None:
-        """Test generic API error handling."""
-        responses.add(
-            responses.GET,
-            "https://grafana.example.com/api/teams/search",
-            json={"message": "Internal server error"},
-            status=500,
-        )
-
-        with pytest.raises(GrafanaAPIError, match="API error 500"):
-            grafana_client.get_team_by_name("Engineering")
-
-    @responses.activate
-    def test_201_created_response(self, grafana_client: GrafanaClient) -> None:
-        """Test that 201 Created is handled as success."""
-        mock_response = {"teamId": 42, "message": "Team created"}
-
-        responses.add(
-            responses.POST,
-            "https://grafana.example.com/api/teams",
-            json=mock_response,
-            status=201,
-        )
-
-        result = grafana_client.create_team("NewTeam")
-        assert result["teamId"] == 42
-
-    @responses.activate
-    def test_update_user_role_success(self, grafana_client: GrafanaClient) -> None:
+    def test_update_user_role_success(
+        self, grafana_client: GrafanaClient, mocked_responses: responses.RequestsMock
+    ) -> None:
         """Test successful user role update."""
         mock_response = {"message": "Organization user updated"}
 
-        responses.add(
+        mocked_responses.add(
             responses.PATCH,
-            "https://grafana.example.com/api/org/users/123",
+            f"{ORG_USERS_URL}/123",
             json=mock_response,
             status=200,
         )
@@ -561,32 +460,64 @@ class TestGrafanaClient:
         with pytest.raises(ValueError, match="Role must be one of"):
             grafana_client.update_user_role(user_id=123, role="InvalidRole")
 
-    @responses.activate
-    def test_set_user_admin_permission_grant(self, grafana_client: GrafanaClient) -> None:
+    def test_set_user_admin_permission_grant(
+        self, grafana_client: GrafanaClient, mocked_responses: responses.RequestsMock
+    ) -> None:
         """Test granting Grafana admin permission."""
-        mock_response = {"message": "User permissions updated"}
-
-        responses.add(
+        mocked_responses.add(
             responses.PUT,
-            "https://grafana.example.com/api/admin/users/123/permissions",
-            json=mock_response,
+            f"{ADMIN_USERS_URL}/123/permissions",
+            json=PERMISSIONS_UPDATED,
             status=200,
         )
 
         result = grafana_client.set_user_admin_permission(user_id=123, is_admin=True)
         assert result["message"] == "User permissions updated"
 
-    @responses.activate
-    def test_set_user_admin_permission_revoke(self, grafana_client: GrafanaClient) -> None:
+    def test_set_user_admin_permission_revoke(
+        self, grafana_client: GrafanaClient, mocked_responses: responses.RequestsMock
+    ) -> None:
         """Test revoking Grafana admin permission."""
-        mock_response = {"message": "User permissions updated"}
-
-        responses.add(
+        mocked_responses.add(
             responses.PUT,
-            "https://grafana.example.com/api/admin/users/123/permissions",
-            json=mock_response,
+            f"{ADMIN_USERS_URL}/123/permissions",
+            json=PERMISSIONS_UPDATED,
             status=200,
         )
 
         result = grafana_client.set_user_admin_permission(user_id=123, is_admin=False)
         assert result["message"] == "User permissions updated"
+
+
+class TestErrors:
+    """Test mapping of HTTP errors to client exceptions."""
+
+    @pytest.mark.parametrize(
+        "path, status, exc, match",
+        [
+            ("/api/teams/search", 401, GrafanaAuthenticationError, "Authentication failed"),
+            ("/api/teams/search", 403, GrafanaAuthenticationError, "Authentication failed"),
+            ("/api/teams/999", 404, GrafanaNotFoundError, "Resource not found"),
+            ("/api/teams/search", 500, GrafanaAPIError, "API error 500"),
+        ],
+        ids=["401", "403", "404", "500"],
+    )
+    def test_http_error_mapping(
+        self,
+        grafana_client: GrafanaClient,
+        mocked_responses: responses.RequestsMock,
+        path: str,
+        status: int,
+        exc: Type[Exception],
+        match: str,
+    ) -> None:
+        """Test that HTTP error statuses raise the matching client exception."""
+        mocked_responses.add(
+            responses.GET,
+            f"{GRAFANA_URL}{path}",
+            json={"message": "error"},
+            status=status,
+        )
+
+        with pytest.raises(exc, match=match):
+            grafana_client._get(path)
@@ -1,19 +1,33 @@
 """Tests for main application entry point."""
+import copy
 import json
 import logging
+import re
 import signal
+import sys
+from typing import Callable, Iterator, Optional, Type
 from unittest.mock import MagicMock, Mock, patch
 
 import pytest
 
+from src import main as main_module
 from src.config import Config, GrafanaConfig, GroupMapping, LoggingConfig, OktaConfig, SyncConfig
-from src.main import print_banner, run_sync, setup_logging, signal_handler
-from src.sync_service import SyncMetrics
-
-
-@pytest.fixture
-def mock_config() -> Config:
-    """Create mock configuration."""
+from src.grafana_client import GrafanaClient
+from src.main import main, print_banner, run_sync, signal_handler
+from src.okta_client import OktaClient
+from src.sync_service import SyncMetrics, SyncService
+
+_LEVELS = {
+    name: getattr(logging, name) for name in ("DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL")
+}
+_TEST_LOGGER = logging.getLogger("test")
+_JSON_MSG_RE = re.compile(r'"message":\s*"(?P<msg>[^"]+)"')
+_JSON_LEVEL_RE = re.compile(r'"level":\s*"(?P<level>[A-Z]+)"')
+
+
+@pytest.fixture(scope="session")
+def _base_config() -> Config:
+    """Build and validate the shared configuration once per session."""
     return Config(
         okta=OktaConfig(domain="test.okta.com", api_token="test-token"),
         grafana=GrafanaConfig(url="https://grafana.test", api_key="test-key"),
@@ -29,10 +43,24 @@ def mock_config() -> Config:
     )
 
 
+@pytest.fixture
+def mock_config(_base_config: Config) -> Config:
+    """Create mock configuration."""
+    return copy.copy(_base_config)
+
+
+@pytest.fixture(autouse=True)
+def _reset_shutdown() -> Iterator[None]:
+    """Start every test with the shutdown flag cleared and clear it again afterwards."""
+    main_module.shutdown_requested = False
+    yield
+    main_module.shutdown_requested = False
+
+
 @pytest.fixture
 def mock_sync_service() -> Mock:
     """Create mock sync service."""
-    service = MagicMock()
+    service = Mock(spec=SyncService)
     service.sync_group_to_team.return_value = SyncMetrics(
         users_added=5, users_removed=2, errors=0, duration_seconds=1.5
     )
@@ -42,13 +70,14 @@ def mock_sync_service() -> Mock:
 class TestSetupLogging:
     """Test setup_logging function."""
 
-    def test_setup_logging_text_format(self, caplog: pytest.LogCaptureFixture) -> None:
+    def test_setup_logging_text_format(
+        self, logging_setup: Callable[[str, str], None], caplog: pytest.LogCaptureFixture
+    ) -> None:
         """Test text format logging setup."""
-        setup_logging("INFO", "text")
+        logging_setup("INFO", "text")
 
         # Log a test message
-        logger = logging.getLogger("test")
-        logger.info("Test message")
+        _TEST_LOGGER.info("Test message")
 
         # Verify log level
         assert logging.root.level == logging.INFO
@@ -56,13 +85,14 @@ class TestSetupLogging:
         # Verify message was logged
         assert "Test message" in caplog.text
 
-    def test_setup_logging_json_format(self, capsys: pytest.CaptureFixture) -> None:
+    def test_setup_logging_json_format(
+        self, logging_setup: Callable[[str, str], None], capsys: pytest.CaptureFixture
+    ) -> None:
         """Test JSON format logging setup."""
-        setup_logging("DEBUG", "json")
+        logging_setup("DEBUG", "json")
 
         # Log a test message
-        logger = logging.getLogger("test")
-        logger.debug("Test JSON message")
+        _TEST_LOGGER.debug("Test JSON message")
 
         # Verify log level
         assert logging.root.level == logging.DEBUG
@@ -70,39 +100,68 @@ class TestSetupLogging:
         # Verify JSON format in stderr
         captured = capsys.readouterr()
         assert "Test JSON message" in captured.err
-        # Check it's valid JSON by attempting to parse a line
-        lines = [line for line in captured.err.strip().split("\n") if line]
-        if lines:
-            log_entry = json.loads(lines[-1])
-            assert log_entry["message"] == "Test JSON message"
-            assert log_entry["level"] == "DEBUG"
-
-    def test_setup_logging_different_levels(self) -> None:
+        # Screen the JSON fields with regexes instead of parsing every line
+        *_, message = _JSON_MSG_RE.finditer(captured.err)
+        *_, level = _JSON_LEVEL_RE.finditer(captured.err)
+        assert message["msg"] == "Test JSON message"
+        assert level["level"] == "DEBUG"
+
+    @pytest.mark.parametrize("level", list(_LEVELS))
+    def test_setup_logging_different_levels(
+        self, logging_setup: Callable[[str, str], None], level: str
+    ) -> None:
         """Test different log levels."""
-        for level in ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]:
-            setup_logging(level, "text")
-            assert logging.root.level == getattr(logging, level)
+        logging_setup(level, "text")
+        assert logging.root.level == _LEVELS[level]
 
-    def test_json_formatter_with_exception(self, capsys: pytest.CaptureFixture) -> None:
+    def test_json_formatter_with_exception(
+        self, logging_setup: Callable[[str, str], None], capsys: pytest.CaptureFixture
+    ) -> None:
         """Test JSON formatter handles exceptions."""
-        setup_logging("ERROR", "json")
+        logging_setup("ERROR", "json")
 
-        logger = logging.getLogger("test")
         try:
             raise ValueError("Test error")
         except ValueError:
-            logger.error("Error occurred", exc_info=True)
+            _TEST_LOGGER.error("Error occurred", exc_info=True)
 
         # Verify exception was logged in JSON format
         captured = capsys.readouterr()
         assert "Error occurred" in captured.err
-        # Check exception is in JSON
-        lines = [line for line in captured.err.strip().split("\n") if line]
-        if lines:
-            log_entry = json.loads(lines[-1])
-            assert log_entry["message"] == "Error occurred"
-            assert "exception" in log_entry
-            assert "ValueError: Test error" in log_entry["exception"]
+        # Only the line carrying the exception needs a full JSON parse
+        *_, message = _JSON_MSG_RE.finditer(captured.err)
+        assert message["msg"] == "Error occurred"
+        *_, line = (line for line in captured.err.splitlines() if '"exception"' in line)
+        log_entry = json.loads(line)
+        assert log_entry["message"] == "Error occurred"
+        assert "ValueError: Test error" in log_entry["exception"]
+
+    @pytest.mark.parametrize(
+        "text",
+        ['Bad "quote" é', "Lone surrogate \ud800"],
+        ids=["quote_and_non_ascii", "lone_surrogate"],
+    )
+    def test_json_formatter_encoding(self, text: str) -> None:
+        """Test JSON formatter output matches compact, ASCII-escaped json.dumps output."""
+        formatter = main_module.JsonFormatter()
+        try:
+            raise ValueError(text)
+        except ValueError:
+            record = _TEST_LOGGER.makeRecord(
+                "test", logging.ERROR, __file__, 1, "Hello %s", (text,), sys.exc_info()
+            )
+
+        output = formatter.format(record)
+
+        expected = {
+            "timestamp": formatter.formatTime(record),
+            "level": "ERROR",
+            "logger": "test",
+            "message": f"Hello {text}",
+            "exception": formatter.formatException(record.exc_info),  # type: ignore[arg-type]
+        }
+        assert output == json.dumps(expected, separators=(",", ":"))
+        assert output.isascii()
 
 
 class TestSignalHandler:
@@ -110,23 +169,16 @@ class TestSignalHandler:
 
     def test_signal_handler_first_call(self) -> None:
         """Test signal handler on first call raises KeyboardInterrupt."""
-        # Import shutdown_requested
-        import src.main  # pylint: disable=import-outside-toplevel
-
-        src.main.shutdown_requested = False
-
         # Call signal handler and expect KeyboardInterrupt
         with pytest.raises(KeyboardInterrupt):
             signal_handler(signal.SIGINT, None)
 
         # Verify shutdown was requested
-        assert src.main.shutdown_requested is True
+        assert main_module.shutdown_requested is True
 
     def test_signal_handler_second_call(self) -> None:
         """Test signal handler on second call forces exit."""
-        import src.main  # pylint: disable=import-outside-toplevel
-
-        src.main.shutdown_requested = True
+        main_module.shutdown_requested = True
 
         # Call signal handler and expect sys.exit
         with pytest.raises(SystemExit) as exc_info:
@@ -137,10 +189,6 @@ class TestSignalHandler:
 
     def test_signal_handler_logs_signal_name(self, caplog: pytest.LogCaptureFixture) -> None:
         """Test signal handler logs signal name."""
-        import src.main  # pylint: disable=import-outside-toplevel
-
-        src.main.shutdown_requested = False
-
         with caplog.at_level(logging.INFO):
             with pytest.raises(KeyboardInterrupt):
                 signal_handler(signal.SIGTERM, None)
@@ -173,50 +221,46 @@ class TestPrintBanner:
 class TestRunSync:
     """Test run_sync function."""
 
-    def test_run_sync_success(
-        self, mock_sync_service: Mock, caplog: pytest.LogCaptureFixture
+    @pytest.mark.parametrize(
+        "side_effect,expected_log,raises",
+        [
+            (
+                SyncMetrics(users_added=5, users_removed=2, errors=0, duration_seconds=1.5),
+                "Sync completed: +5 users, -2 users, 0 errors",
+                None,
+            ),
+            (KeyboardInterrupt(), "Sync interrupted by user", KeyboardInterrupt),
+            (Exception("API error"), "Sync failed for TestGroup -> TestTeam: API error", None),
+        ],
+        ids=["success", "keyboard_interrupt", "error"],
+    )
+    def test_run_sync(
+        self,
+        mock_sync_service: Mock,
+        caplog: pytest.LogCaptureFixture,
+        side_effect: object,
+        expected_log: str,
+        raises: Optional[Type[BaseException]],
     ) -> None:
-        """Test successful sync operation."""
+        """Test run_sync outcome logging for success, interruption and errors."""
+        if isinstance(side_effect, SyncMetrics):
+            mock_sync_service.sync_group_to_team.return_value = side_effect
+        else:
+            mock_sync_service.sync_group_to_team.side_effect = side_effect
         desired_roles: dict = {}  # type: ignore[type-arg]
+
         with caplog.at_level(logging.INFO):
-            run_sync(mock_sync_service, "TestGroup", "TestTeam", "Viewer", desired_roles)
+            if raises is None:
+                run_sync(mock_sync_service, "TestGroup", "TestTeam", "Viewer", desired_roles)
+            else:
+                with pytest.raises(raises):
+                    run_sync(mock_sync_service, "TestGroup", "TestTeam", "Viewer", desired_roles)
 
-        # Verify sync was called
         mock_sync_service.sync_group_to_team.assert_called_once_with(
             "TestGroup", "TestTeam", "Viewer", desired_roles
         )
-
-        # Verify logging
         assert "Starting sync: TestGroup -> TestTeam (role: Viewer)" in caplog.text
-        assert "Sync completed: +5 users, -2 users, 0 errors" in caplog.text
-
-    def test_run_sync_keyboard_interrupt(
-        self, mock_sync_service: Mock, caplog: pytest.LogCaptureFixture
-    ) -> None:
-        """Test sync interrupted by user."""
-        mock_sync_service.sync_group_to_team.side_effect = KeyboardInterrupt()
-        desired_roles: dict = {}  # type: ignore[type-arg]
-
-        with caplog.at_level(logging.INFO):
-            with pytest.raises(KeyboardInterrupt):
-                run_sync(mock_sync_service, "TestGroup", "TestTeam", "Viewer", desired_roles)
-
-        # Verify interrupt was logged
-        assert "Sync interrupted by user" in caplog.text
-
-    def test_run_sync_error(
-        self, mock_sync_service: Mock, caplog: pytest.LogCaptureFixture
-    ) -> None:
-        """Test sync with error."""
-        mock_sync_service.sync_group_to_team.side_effect = Exception("API error")
-        desired_roles: dict = {}  # type: ignore[type-arg]
-
-        with caplog.at_level(logging.ERROR):
-            run_sync(mock_sync_service, "TestGroup", "TestTeam", "Viewer", desired_roles)
-
-        # Verify error was logged
-        assert "Sync failed for TestGroup -> TestTeam" in caplog.text
-        assert "API error" in caplog.text
+        assert expected_log in caplog.text
 
 
 class TestMain:
@@ -241,16 +285,11 @@ class TestMain:
         mock_config: Config,
     ) -> None:
         """Test main function successful run."""
-        # Reset shutdown flag from previous tests
-        import src.main  # pylint: disable=import-outside-toplevel
-
-        src.main.shutdown_requested = False
-
         # Setup mocks
         mock_config_load.return_value = mock_config
-        mock_okta_client = MagicMock()
-        mock_grafana_client = MagicMock()
-        mock_sync_service = MagicMock()
+        mock_okta_client = Mock(spec=OktaClient)
+        mock_grafana_client = Mock(spec=GrafanaClient)
+        mock_sync_service = Mock(spec=SyncService)
 
         mock_okta_client_class.return_value = mock_okta_client
         mock_grafana_client_class.return_value = mock_grafana_client
@@ -270,8 +309,6 @@ class TestMain:
 
         # Run main
         with pytest.raises(SystemExit) as exc_info:
-            from src.main import main  # pylint: disable=import-outside-toplevel
-
             main()
 
         # Verify exit code
@@ -281,7 +318,9 @@ class TestMain:
         mock_okta_client_class.assert_called_once_with(
             domain="test.okta.com", api_token="test-token"
         )
-        mock_grafana_client_class.assert_called_once_with("https://grafana.test", "test-key")
+        mock_grafana_client_class.assert_called_once_with(
+            "https://grafana.test", "test-key", pool_maxsize=8
+        )
 
         # Verify sync service was created
         mock_sync_service_class.assert_called_once_with(
@@ -289,6 +328,7 @@ class TestMain:
             grafana_client=mock_grafana_client,
             dry_run=True,
             metrics_collector=None,
+            max_workers=8,
         )
 
         # Verify signal handlers were registered
@@ -297,52 +337,32 @@ class TestMain:
         # Verify initial sync was run (2 mappings)
         assert mock_sync_service.sync_group_to_team.call_count >= 2
 
+    @pytest.mark.parametrize(
+        "exc,expected_log",
+        [
+            (FileNotFoundError("Config not found"), "Configuration file not found"),
+            (ValueError("Invalid config"), "Configuration error"),
+            (Exception("Connection failed"), "Fatal error"),
+        ],
+        ids=["file_not_found", "validation_error", "fatal_error"],
+    )
     @patch("src.main.ConfigLoader.load")
-    def test_main_config_file_not_found(self, mock_config_load: Mock) -> None:
-        """Test main with missing config file."""
-        mock_config_load.side_effect = FileNotFoundError("Config not found")
-
-        with pytest.raises(SystemExit) as exc_info:
-            from src.main import main  # pylint: disable=import-outside-toplevel
-
-            main()
-
-        assert exc_info.value.code == 1
-
-    @patch("src.main.ConfigLoader.load")
-    def test_main_config_validation_error(self, mock_config_load: Mock) -> None:
-        """Test main with invalid configuration."""
-        mock_config_load.side_effect = ValueError("Invalid config")
-
-        with pytest.raises(SystemExit) as exc_info:
-            from src.main import main  # pylint: disable=import-outside-toplevel
-
-            main()
-
-        assert exc_info.value.code == 1
-
-    @patch("src.main.SyncService")
-    @patch("src.main.GrafanaClient")
-    @patch("src.main.OktaClient")
-    @patch("src.main.ConfigLoader.load")
-    def test_main_fatal_error(  # pylint: disable=too-many-arguments
+    def test_main_fatal(
         self,
         mock_config_load: Mock,
-        mock_okta_client_class: Mock,
-        _mock_grafana_client_class: Mock,
-        _mock_sync_service_class: Mock,
-        mock_config: Config,
+        caplog: pytest.LogCaptureFixture,
+        exc: Exception,
+        expected_log: str,
     ) -> None:
-        """Test main with fatal error during execution."""
-        mock_config_load.return_value = mock_config
-        mock_okta_client_class.side_effect = Exception("Connection failed")
+        """Test main exits with code 1 on configuration and fatal errors."""
+        mock_config_load.side_effect = exc
 
-        with pytest.raises(SystemExit) as exc_info:
-            from src.main import main  # pylint: disable=import-outside-toplevel
-
-            main()
+        with caplog.at_level(logging.ERROR):
+            with pytest.raises(SystemExit) as exc_info:
+                main()
 
         assert exc_info.value.code == 1
+        assert expected_log in caplog.text
 
     @patch("src.main.SyncService")
     @patch("src.main.GrafanaClient")
@@ -363,11 +383,9 @@ class TestMain:
         mock_config: Config,
     ) -> None:
         """Test main respects shutdown_requested flag during sync."""
-        import src.main  # pylint: disable=import-outside-toplevel
-
         # Setup mocks
         mock_config_load.return_value = mock_config
-        mock_sync_service = MagicMock()
+        mock_sync_service = Mock(spec=SyncService)
         mock_sync_service_class.return_value = mock_sync_service
 
         # Setup schedule
@@ -376,15 +394,13 @@ class TestMain:
 
         # Simulate shutdown requested during initial sync
         def set_shutdown(*_args: object, **_kwargs: object) -> SyncMetrics:
-            src.main.shutdown_requested = True
+            main_module.shutdown_requested = True
             return SyncMetrics()
 
         mock_sync_service.sync_group_to_team.side_effect = set_shutdown
 
         # Run main
         with pytest.raises(SystemExit) as exc_info:
-            from src.main import main  # pylint: disable=import-outside-toplevel
-
             main()
 
         # Verify graceful shutdown
@@ -397,8 +413,6 @@ class TestMain:
         mock_config_load.side_effect = FileNotFoundError()
 
         with pytest.raises(SystemExit):
-            from src.main import main  # pylint: disable=import-outside-toplevel
-
             main()
 
         # Verify custom config path was used
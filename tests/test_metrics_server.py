@@ -1,11 +1,14 @@
 """Tests for metrics server module."""
 
-import time
+import io
+import threading
 from http.client import HTTPConnection
+from typing import Dict, Iterator, Tuple
 
 import pytest
 
 from src.metrics_server import (
+    HealthCheckHandler,
     MetricsCollector,
     MetricsServer,
     last_sync_success,
@@ -17,6 +20,42 @@ from src.metrics_server import (
 )
 
 
+def _parse_response(raw: bytes) -> Tuple[int, Dict[str, str], bytes]:
+    """Split raw HTTP response bytes into status code, headers and body."""
+    head, _, body = raw.partition(b"\r\n\r\n")
+    status_line, *header_lines = head.decode("latin-1").split("\r\n")
+    headers = dict(line.split(": ", 1) for line in header_lines)
+    return int(status_line.split()[1]), headers, body
+
+
+def _request(collector: MetricsCollector, path: str) -> Tuple[int, Dict[str, str], bytes]:
+    """Call HealthCheckHandler.do_GET for path in-process and return the parsed response."""
+    handler_cls = type("Handler", (HealthCheckHandler,), {"metrics_collector": collector})
+    # Bypass __init__, which would read a request from a socket
+    handler = handler_cls.__new__(handler_cls)
+    handler.path = path
+    handler.command = "GET"
+    handler.request_version = "HTTP/1.1"
+    handler.requestline = f"GET {path} HTTP/1.1"
+    handler.client_address = ("127.0.0.1", 0)
+    handler.wfile = io.BytesIO()
+    handler.do_GET()
+    return _parse_response(handler.wfile.getvalue())
+
+
+@pytest.fixture
+def running_server() -> Iterator[Tuple[MetricsServer, int]]:
+    """Start a MetricsServer on an OS-assigned port and yield it with the bound port."""
+    server = MetricsServer(MetricsCollector(), port=0, host="127.0.0.1")
+    server.start()
+    assert server._ready.wait(2.0)
+    assert server.server is not None
+    try:
+        yield server, server.server.server_address[1]
+    finally:
+        server.stop()
+
+
 class TestMetricsCollector:
     """Test MetricsCollector class."""
 
@@ -132,22 +171,25 @@ class TestMetricsServer:
         assert server.server is None
         assert server.thread is None
 
-    def test_start_and_stop(self) -> None:
+    @pytest.mark.slow
+    def test_start_and_stop(self, running_server: Tuple[MetricsServer, int]) -> None:
         """Test starting and stopping metrics server."""
-        collector = MetricsCollector()
-        server = MetricsServer(collector, port=9001, host="127.0.0.1")
-
-        # Start server
-        server.start()
-        time.sleep(0.5)  # Give server time to start
+        server, port = running_server
 
         assert server.server is not None
         assert server.thread is not None
         assert server.thread.is_alive()
 
+        conn = HTTPConnection("127.0.0.1", port, timeout=5)
+        try:
+            conn.request("GET", "/health")
+            assert conn.getresponse().status == 200
+        finally:
+            conn.close()
+
         # Stop server
         server.stop()
-        time.sleep(0.5)  # Give server time to stop
+        server.thread.join(timeout=2.0)
 
         assert not server.thread.is_alive()
 
@@ -157,85 +199,43 @@ class TestMetricsServer:
         collector.record_sync_start("Group1", "Team1")
         collector.record_sync_complete("Group1", "Team1", 1.0, 1, 0, 0)
 
-        server = MetricsServer(collector, port=9002, host="127.0.0.1")
-        server.start()
-        time.sleep(0.5)  # Give server time to start
-
-        try:
-            # Make request to health endpoint
-            conn = HTTPConnection("127.0.0.1", 9002, timeout=5)
-            conn.request("GET", "/health")
-            response = conn.getresponse()
-
-            assert response.status == 200
-            assert "application/json" in response.getheader("Content-Type", "")
+        status, headers, raw_body = _request(collector, "/health")
 
-            body = response.read().decode("utf-8")
-            assert "healthy" in body
-            assert "sync_status" in body
-            assert "Group1->Team1" in body
+        assert status == 200
+        assert "application/json" in headers["Content-Type"]
 
-            conn.close()
-        finally:
-            server.stop()
-            time.sleep(0.2)
+        body = raw_body.decode("utf-8")
+        assert "healthy" in body
+        assert "sync_status" in body
+        assert "Group1->Team1" in body
 
     def test_metrics_endpoint(self) -> None:
         """Test /metrics endpoint returns Prometheus format."""
         collector = MetricsCollector()
         collector.record_sync_complete("Group1", "Team1", 2.5, 5, 3, 0)
 
-        server = MetricsServer(collector, port=9003, host="127.0.0.1")
-        server.start()
-        time.sleep(0.5)  # Give server time to start
+        status, headers, raw_body = _request(collector, "/metrics")
 
-        try:
-            # Make request to metrics endpoint
-            conn = HTTPConnection("127.0.0.1", 9003, timeout=5)
-            conn.request("GET", "/metrics")
-            response = conn.getresponse()
-
-            assert response.status == 200
-            content_type = response.getheader("Content-Type", "")
-            assert "text/plain" in content_type
-
-            body = response.read().decode("utf-8")
-            # Check for our custom metrics
-            assert "gots_sync_duration_seconds" in body
-            assert "gots_users_added_total" in body
-            assert "gots_users_removed_total" in body
-            assert "gots_last_sync_timestamp" in body
+        assert status == 200
+        assert "text/plain" in headers["Content-Type"]
 
-            conn.close()
-        finally:
-            server.stop()
-            time.sleep(0.2)
+        body = raw_body.decode("utf-8")
+        # Check for our custom metrics
+        assert "gots_sync_duration_seconds" in body
+        assert "gots_users_added_total" in body
+        assert "gots_users_removed_total" in body
+        assert "gots_last_sync_timestamp" in body
 
     def test_not_found_endpoint(self) -> None:
         """Test that unknown endpoints return 404."""
-        collector = MetricsCollector()
-        server = MetricsServer(collector, port=9004, host="127.0.0.1")
-        server.start()
-        time.sleep(0.5)  # Give server time to start
+        status, _, body = _request(MetricsCollector(), "/unknown")
 
-        try:
-            conn = HTTPConnection("127.0.0.1", 9004, timeout=5)
-            conn.request("GET", "/unknown")
-            response = conn.getresponse()
-
-            assert response.status == 404
-            body = response.read().decode("utf-8")
-            assert "Not Found" in body
-
-            conn.close()
-        finally:
-            server.stop()
-            time.sleep(0.2)
+        assert status == 404
+        assert body == b"Not Found"
 
+    @pytest.mark.slow
     def test_thread_safety(self) -> None:
         """Test that metrics collector is thread-safe."""
-        import threading
-
         collector = MetricsCollector()
 
         def record_sync(group_name: str, team_name: str) -> None:
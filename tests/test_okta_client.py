@@ -1,10 +1,15 @@
 """Tests for Okta API client."""
+import json
 import time
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+from typing import Any, Dict, List, Optional, Type
 from unittest import mock
 
 import pytest
 import responses
-from tenacity import RetryError
+from responses.registries import OrderedRegistry
+from tenacity import RetryError, wait_none
 
 from src.okta_client import (
     OktaAPIError,
@@ -15,70 +20,146 @@ from src.okta_client import (
     OktaRateLimitError,
 )
 
+OKTA_URL = "https://example.okta.com"
+GROUPS_URL = f"{OKTA_URL}/api/v1/groups"
+GROUP_USERS_URL = f"{GROUPS_URL}/00g123/users"
+
+# Response bodies shared by several tests
+ENGINEERING_GROUP = {
+    "id": "00g123",
+    "profile": {"name": "Engineering", "description": "Engineering team"},
+}
+GROUP_MEMBERS = [
+    {
+        "id": "00u1234567890abcdef",
+        "profile": {"email": "user1@example.com", "firstName": "John", "lastName": "Doe"},
+    },
+    {
+        "id": "00u0987654321fedcba",
+        "profile": {"email": "user2@example.com", "firstName": "Jane", "lastName": "Smith"},
+    },
+]
+MEMBER_PAGES = [
+    [{"id": f"user{n}", "profile": {"email": f"user{n}@example.com"}}] for n in (1, 2, 3)
+]
+# Serialized once at import; the pagination tests register these as raw bodies
+MEMBER_PAGE_BODIES = [json.dumps(page) for page in MEMBER_PAGES]
+
+
+def _add_groups(
+    rsps: responses.RequestsMock,
+    body: Any,
+    status: int = 200,
+    headers: Optional[Dict[str, str]] = None,
+) -> None:
+    """Register a response for the group search endpoint."""
+    rsps.add(responses.GET, GROUPS_URL, json=body, status=status, headers=headers)
+
+
+def _add_group_users(rsps: responses.RequestsMock, body: Any, link: Optional[str] = None) -> None:
+    """Register a page of the group members endpoint, optionally linking to the next page."""
+    rsps.add(responses.GET, GROUP_USERS_URL, json=body, headers={"Link": link} if link else None)
+
+
+def _add_member_pages(rsps: responses.RequestsMock, bodies: List[str]) -> None:
+    """Register consecutive pre-serialized member pages, each linking to the next page."""
+    for n, body in enumerate(bodies, start=1):
+        link = f'<{GROUP_USERS_URL}?after=cursor{n}>; rel="next"' if n < len(bodies) else None
+        rsps.add(
+            responses.GET,
+            GROUP_USERS_URL,
+            body=body,
+            content_type="application/json",
+            headers={"Link": link} if link else None,
+        )
 
-@pytest.fixture
+
+@pytest.fixture(scope="module")
 def okta_client() -> OktaClient:
-    """Create Okta client fixture."""
+    """Create an Okta client shared by all tests in this module."""
     return OktaClient(domain="example.okta.com", api_token="test-token")
 
 
+@pytest.fixture(autouse=True)
+def clear_members_cache(okta_client: OktaClient) -> None:
+    """Drop Okta group members cached on the shared client by earlier tests."""
+    okta_client._members_cache.clear()
+
+
+@pytest.fixture
+def fast_session(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Replace requests.Session with a bare stand-in for constructor-only tests."""
+    monkeypatch.setattr("src.okta_client.requests.Session", lambda: SimpleNamespace(headers={}))
+
+
+@pytest.fixture
+def ordered_responses(mocked_responses: responses.RequestsMock) -> responses.RequestsMock:
+    """Serve this test's registered responses strictly in insertion order.
+
+    The autouse mocked_responses fixture restores the default registry on teardown.
+    """
+    mocked_responses._set_registry(OrderedRegistry)
+    return mocked_responses
+
+
+@pytest.fixture
+def no_retry_wait(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Drop the exponential backoff between OktaClient._get retries for one test."""
+    monkeypatch.setattr(OktaClient._get.retry, "wait", wait_none())  # type: ignore[attr-defined]
+
+
 class TestOktaClient:
     """Test OktaClient class."""
 
+    @pytest.mark.usefixtures("fast_session")
     def test_init_strips_protocol(self) -> None:
         """Test that protocol is stripped from domain."""
         client = OktaClient(domain="https://example.okta.com", api_token="token")
         assert client.domain == "example.okta.com"
         assert client.base_url == "https://example.okta.com"
 
+    @pytest.mark.usefixtures("fast_session")
     def test_init_strips_http_protocol(self) -> None:
         """Test that http:// protocol is stripped from domain."""
         client = OktaClient(domain="http://example.okta.com", api_token="token")
         assert client.domain == "example.okta.com"
         assert client.base_url == "https://example.okta.com"
 
+    def test_retry_policy_shared_across_instances(self, okta_client: OktaClient) -> None:
+        """Test that _get's retry policy is built once at class level, not per client."""
+        other = OktaClient(domain="other.okta.com", api_token="token")
+        retrying = OktaClient._get.retry  # type: ignore[attr-defined]
+        assert okta_client._get.retry is retrying  # type: ignore[attr-defined]
+        assert other._get.retry is retrying  # type: ignore[attr-defined]
+
     def test_session_headers(self, okta_client: OktaClient) -> None:
         """Test that session has correct headers."""
         # Authorization header is now set dynamically, not in session
         assert okta_client.session.headers["Accept"] == "application/json"
         assert okta_client.session.headers["Content-Type"] == "application/json"
 
-    @responses.activate
-    def test_get_group_by_name_success(self, okta_client: OktaClient) -> None:
+    def test_get_group_by_name_success(
+        self, okta_client: OktaClient, mocked_responses: responses.RequestsMock
+    ) -> None:
         """Test successful group lookup."""
-        mock_response = [
-            {
-                "id": "00g1234567890abcdef",
-                "profile": {"name": "Engineering", "description": "Engineering team"},
-            }
-        ]
-
-        responses.add(
-            responses.GET,
-            "https://example.okta.com/api/v1/groups",
-            json=mock_response,
-            status=200,
-        )
+        _add_groups(mocked_responses, [ENGINEERING_GROUP])
 
         group = okta_client.get_group_by_name("Engineering")
-        assert group["id"] == "00g1234567890abcdef"
+        assert group["id"] == "00g123"
         assert group["profile"]["name"] == "Engineering"
 
-    @responses.activate
-    def test_get_group_by_name_not_found(self, okta_client: OktaClient) -> None:
+    def test_get_group_by_name_not_found(
+        self, okta_client: OktaClient, mocked_responses: responses.RequestsMock
+    ) -> None:
         """Test group not found error."""
-        responses.add(
-            responses.GET,
-            "https://example.okta.com/api/v1/groups",
-            json=[],
-            status=200,
-        )
+        _add_groups(mocked_responses, [])
 
         with pytest.raises(OktaNotFoundError, match="Group not found: NonExistent"):
             okta_client.get_group_by_name("NonExistent")
 
-    @responses.activate
-    def test_get_group_by_name_exact_match(self, okta_client: OktaClient) -> None:
+    def test_get_group_by_name_exact_match(
+        self, okta_client: OktaClient, mocked_responses: responses.RequestsMock
+    ) -> None:
         """Test that exact match is returned when multiple partial matches exist."""
         mock_response = [
             {"id": "1", "profile": {"name": "Engineering"}},
@@ -86,200 +167,187 @@ class TestOktaClient:
             {"id": "3", "profile": {"name": "Engineering-QA"}},
         ]
 
-        responses.add(
-            responses.GET,
-            "https://example.okta.com/api/v1/groups",
-            json=mock_response,
-            status=200,
-        )
+        _add_groups(mocked_responses, mock_response)
 
         group = okta_client.get_group_by_name("Engineering")
         assert group["id"] == "1"
 
-    @responses.activate
-    def test_get_group_members_success(self, okta_client: OktaClient) -> None:
+    def test_get_group_members_success(
+        self, okta_client: OktaClient, mocked_responses: responses.RequestsMock
+    ) -> None:
         """Test successful retrieval of group members."""
-        mock_response = [
-            {
-                "id": "00u1234567890abcdef",
-                "profile": {
-                    "email": "user1@example.com",
-                    "firstName": "John",
-                    "lastName": "Doe",
-                },
-            },
-            {
-                "id": "00u0987654321fedcba",
-                "profile": {
-                    "email": "user2@example.com",
-                    "firstName": "Jane",
-                    "lastName": "Smith",
-                },
-            },
-        ]
-
-        responses.add(
-            responses.GET,
-            "https://example.okta.com/api/v1/groups/00g123/users",
-            json=mock_response,
-            status=200,
-        )
+        _add_group_users(mocked_responses, GROUP_MEMBERS)
 
         members = okta_client.get_group_members("00g123")
         assert len(members) == 2
         assert members[0]["profile"]["email"] == "user1@example.com"
 
-    @responses.activate
-    def test_get_group_members_pagination(self, okta_client: OktaClient) -> None:
+    def test_get_group_members_pagination(
+        self, okta_client: OktaClient, ordered_responses: responses.RequestsMock
+    ) -> None:
         """Test pagination when retrieving group members."""
-        page1_response = [{"id": "user1", "profile": {"email": "user1@example.com"}}]
-        page2_response = [{"id": "user2", "profile": {"email": "user2@example.com"}}]
-
-        responses.add(
-            responses.GET,
-            "https://example.okta.com/api/v1/groups/00g123/users",
-            json=page1_response,
-            status=200,
-            headers={
-                "Link": '<https://example.okta.com/api/v1/groups/00g123/users?after=cursor1>; rel="next"'
-            },
-        )
-
-        responses.add(
-            responses.GET,
-            "https://example.okta.com/api/v1/groups/00g123/users",
-            json=page2_response,
-            status=200,
-        )
+        _add_member_pages(ordered_responses, MEMBER_PAGE_BODIES[:2])
 
         members = okta_client.get_group_members("00g123")
         assert len(members) == 2
         assert members[0]["id"] == "user1"
         assert members[1]["id"] == "user2"
 
-    @responses.activate
-    def test_get_group_members_empty(self, okta_client: OktaClient) -> None:
+    def test_get_group_members_empty(
+        self, okta_client: OktaClient, mocked_responses: responses.RequestsMock
+    ) -> None:
         """Test retrieval of empty group."""
-        responses.add(
-            responses.GET,
-            "https://example.okta.com/api/v1/groups/00g123/users",
-            json=[],
-            status=200,
-        )
+        _add_group_users(mocked_responses, [])
 
         members = okta_client.get_group_members("00g123")
         assert len(members) == 0
 
-    @responses.activate
-    def test_authentication_error(self, okta_client: OktaClient) -> None:
-        """Test authentication error handling."""
-        responses.add(
-            responses.GET,
-            "https://example.okta.com/api/v1/groups",
-            json={
-                "errorCode": "E0000011",
-                "errorSummary": "Invalid token provided",
-            },
-            status=401,
-        )
-
-        with pytest.raises(OktaAuthenticationError, match="Authentication failed"):
-            okta_client.get_group_by_name("Engineering")
-
-    @responses.activate
-    def test_rate_limit_error(self, okta_client: OktaClient) -> None:
+    @pytest.mark.usefixtures("no_retry_wait")
+    def test_rate_limit_error(
+        self, okta_client: OktaClient, mocked_responses: responses.RequestsMock
+    ) -> None:
         """Test rate limit error handling."""
-        # Add multiple 429 responses for retry attempts
-        for _ in range(5):
-            responses.add(
-                responses.GET,
-                "https://example.okta.com/api/v1/groups",
-                json={"errorCode": "E0000047", "errorSummary": "Rate limit exceeded"},
-                status=429,
-                headers={"X-Rate-Limit-Reset": "1234567890"},
-            )
+        # A single registration keeps answering every retry attempt with 429
+        _add_groups(
+            mocked_responses,
+            {"errorCode": "E0000047", "errorSummary": "Rate limit exceeded"},
+            status=429,
+            headers={"X-Rate-Limit-Reset": "1234567890"},
+        )
 
         # After all retries are exhausted, tenacity wraps it in RetryError
-        with pytest.raises(RetryError):
+        with pytest.raises(RetryError) as exc_info:
             okta_client.get_group_by_name("Engineering")
+        assert isinstance(exc_info.value.last_attempt.exception(), OktaRateLimitError)
+        assert len(mocked_responses.calls) == 5
+
+    @pytest.mark.parametrize(
+        "path, status, body, exc, match",
+        [
+            (
+                "/api/v1/groups",
+                401,
+                {"errorCode": "E0000011", "errorSummary": "Invalid token provided"},
+                OktaAuthenticationError,
+                "Authentication failed",
+            ),
+            (
+                "/api/v1/groups/invalid",
+                404,
+                {"errorCode": "E0000007", "errorSummary": "Not found"},
+                OktaNotFoundError,
+                "Resource not found",
+            ),
+            (
+                "/api/v1/groups",
+                400,
+                {"errorCode": "E0000001", "errorSummary": "API validation failed"},
+                OktaAPIError,
+                "API error 400",
+            ),
+        ],
+        ids=["401", "404", "400"],
+    )
+    def test_http_error_mapping(
+        self,
+        okta_client: OktaClient,
+        mocked_responses: responses.RequestsMock,
+        path: str,
+        status: int,
+        body: Dict[str, str],
+        exc: Type[Exception],
+        match: str,
+    ) -> None:
+        """Test that HTTP error statuses raise the matching client exception."""
+        mocked_responses.add(responses.GET, f"{OKTA_URL}{path}", json=body, status=status)
 
-    @responses.activate
-    def test_404_error(self, okta_client: OktaClient) -> None:
-        """Test 404 error handling."""
-        responses.add(
-            responses.GET,
-            "https://example.okta.com/api/v1/groups/invalid",
-            json={"errorCode": "E0000007", "errorSummary": "Not found"},
-            status=404,
-        )
-
-        with pytest.raises(OktaNotFoundError, match="Resource not found"):
-            okta_client._get("/api/v1/groups/invalid")
-
-    @responses.activate
-    def test_generic_api_error(self, okta_client: OktaClient) -> None:
-        """Test generic API error handling."""
-        responses.add(
-            responses.GET,
-            "https://example.okta.com/api/v1/groups",
-            json={
-                "errorCode": "E0000001",
-                "errorSummary": "API validation failed",
-            },
-            status=400,
-        )
-
-        with pytest.raises(OktaAPIError, match="API error 400"):
-            okta_client.get_group_by_name("Engineering")
+        with pytest.raises(exc, match=match):
+            okta_client._get(path)
 
-    @responses.activate
-    def test_get_group_members_by_name(self, okta_client: OktaClient) -> None:
+    def test_get_group_members_by_name(
+        self, okta_client: OktaClient, mocked_responses: responses.RequestsMock
+    ) -> None:
         """Test convenience method to get members by group name."""
         # Mock group search
-        responses.add(
-            responses.GET,
-            "https://example.okta.com/api/v1/groups",
-            json=[{"id": "00g123", "profile": {"name": "Engineering"}}],
-            status=200,
-        )
+        _add_groups(mocked_responses, [ENGINEERING_GROUP])
 
         # Mock members retrieval
-        responses.add(
-            responses.GET,
-            "https://example.okta.com/api/v1/groups/00g123/users",
-            json=[{"id": "user1", "profile": {"email": "user1@example.com"}}],
-            status=200,
-        )
+        _add_group_users(mocked_responses, MEMBER_PAGES[0])
 
         members = okta_client.get_group_members_by_name("Engineering")
         assert len(members) == 1
         assert members[0]["id"] == "user1"
 
-    def test_parse_next_link(self) -> None:
-        """Test parsing of Link header."""
-        link_header = '<https://example.okta.com/api/v1/groups?after=cursor>; rel="next", <https://example.okta.com/api/v1/groups>; rel="self"'
-        next_link = OktaClient._parse_next_link(link_header)
-        assert next_link == "https://example.okta.com/api/v1/groups?after=cursor"
-
-    def test_parse_next_link_no_next(self) -> None:
-        """Test parsing Link header with no next link."""
-        link_header = '<https://example.okta.com/api/v1/groups>; rel="self"'
-        next_link = OktaClient._parse_next_link(link_header)
-        assert next_link is None
-
-    def test_parse_next_link_empty(self) -> None:
-        """Test parsing empty Link header."""
-        next_link = OktaClient._parse_next_link("")
-        assert next_link is None
-
-    @responses.activate
-    def test_rate_limit_logging(self, okta_client: OktaClient) -> None:
+    def test_get_group_members_by_name_reuses_unchanged_members(
+        self, mocked_responses: responses.RequestsMock
+    ) -> None:
+        """Test that members are not refetched while lastMembershipUpdated is unchanged."""
+        client = OktaClient(domain="example.okta.com", api_token="test-token")
+        _add_groups(mocked_responses, [{**ENGINEERING_GROUP, "lastMembershipUpdated": "t1"}])
+        _add_group_users(mocked_responses, GROUP_MEMBERS)
+
+        assert client.get_group_members_by_name("Engineering") == GROUP_MEMBERS
+        assert client.get_group_members_by_name("Engineering") == GROUP_MEMBERS
+
+        urls = [call.request.url.split("?")[0] for call in mocked_responses.calls]
+        assert urls == [GROUPS_URL, GROUP_USERS_URL, GROUPS_URL]
+
+    def test_get_group_members_by_name_returns_copies(
+        self, mocked_responses: responses.RequestsMock
+    ) -> None:
+        """Test that modifying a returned member list does not change the cached members."""
+        client = OktaClient(domain="example.okta.com", api_token="test-token")
+        _add_groups(mocked_responses, [{**ENGINEERING_GROUP, "lastMembershipUpdated": "t1"}])
+        _add_group_users(mocked_responses, GROUP_MEMBERS)
+
+        client.get_group_members_by_name("Engineering").clear()
+        reused = client.get_group_members_by_name("Engineering")
+        assert reused == GROUP_MEMBERS
+        reused.clear()
+        assert client.get_group_members_by_name("Engineering") == GROUP_MEMBERS
+
+    def test_get_group_members_by_name_refetches_stale_members(
+        self, ordered_responses: responses.RequestsMock
+    ) -> None:
+        """Test that unchanged members are refetched once the cached list exceeds its max age."""
+        client = OktaClient(
+            domain="example.okta.com", api_token="test-token", members_cache_max_age=600.0
+        )
+        group = {**ENGINEERING_GROUP, "lastMembershipUpdated": "t1"}
+        _add_groups(ordered_responses, [group])
+        _add_group_users(ordered_responses, MEMBER_PAGES[0])
+        _add_groups(ordered_responses, [group])
+        _add_groups(ordered_responses, [group])
+        _add_group_users(ordered_responses, MEMBER_PAGES[1])
+
+        with mock.patch("src.okta_client.time.monotonic", return_value=1000.0) as monotonic:
+            assert client.get_group_members_by_name("Engineering") == MEMBER_PAGES[0]
+            monotonic.return_value = 1599.0
+            assert client.get_group_members_by_name("Engineering") == MEMBER_PAGES[0]
+            # lastMembershipUpdated is unchanged, but a member's profile may have changed
+            monotonic.return_value = 1600.0
+            assert client.get_group_members_by_name("Engineering") == MEMBER_PAGES[1]
+
+    def test_get_group_members_by_name_refetches_changed_members(
+        self, ordered_responses: responses.RequestsMock
+    ) -> None:
+        """Test that members are refetched once lastMembershipUpdated advances."""
+        client = OktaClient(domain="example.okta.com", api_token="test-token")
+        _add_groups(ordered_responses, [{**ENGINEERING_GROUP, "lastMembershipUpdated": "t1"}])
+        _add_group_users(ordered_responses, MEMBER_PAGES[0])
+        _add_groups(ordered_responses, [{**ENGINEERING_GROUP, "lastMembershipUpdated": "t2"}])
+        _add_group_users(ordered_responses, MEMBER_PAGES[1])
+
+        assert client.get_group_members_by_name("Engineering") == MEMBER_PAGES[0]
+        assert client.get_group_members_by_name("Engineering") == MEMBER_PAGES[1]
+
+    def test_rate_limit_logging(
+        self, okta_client: OktaClient, mocked_responses: responses.RequestsMock
+    ) -> None:
         """Test that rate limit info is logged."""
-        responses.add(
-            responses.GET,
-            "https://example.okta.com/api/v1/groups",
-            json=[{"id": "00g123", "profile": {"name": "Engineering"}}],
-            status=200,
+        _add_groups(
+            mocked_responses,
+            [ENGINEERING_GROUP],
             headers={"X-Rate-Limit-Limit": "1000", "X-Rate-Limit-Remaining": "999"},
         )
 
@@ -287,39 +355,11 @@ class TestOktaClient:
         # If this doesn't raise an exception, the logging worked
         assert True
 
-    @responses.activate
-    def test_multiple_pages_pagination(self, okta_client: OktaClient) -> None:
+    def test_multiple_pages_pagination(
+        self, okta_client: OktaClient, ordered_responses: responses.RequestsMock
+    ) -> None:
         """Test pagination with multiple pages."""
-        page1 = [{"id": "user1"}]
-        page2 = [{"id": "user2"}]
-        page3 = [{"id": "user3"}]
-
-        responses.add(
-            responses.GET,
-            "https://example.okta.com/api/v1/groups/00g123/users",
-            json=page1,
-            status=200,
-            headers={
-                "Link": '<https://example.okta.com/api/v1/groups/00g123/users?after=cursor1>; rel="next"'
-            },
-        )
-
-        responses.add(
-            responses.GET,
-            "https://example.okta.com/api/v1/groups/00g123/users",
-            json=page2,
-            status=200,
-            headers={
-                "Link": '<https://example.okta.com/api/v1/groups/00g123/users?after=cursor2>; rel="next"'
-            },
-        )
-
-        responses.add(
-            responses.GET,
-            "https://example.okta.com/api/v1/groups/00g123/users",
-            json=page3,
-            status=200,
-        )
+        _add_member_pages(ordered_responses, MEMBER_PAGE_BODIES)
 
         members = okta_client.get_group_members("00g123")
         assert len(members) == 3
@@ -328,6 +368,26 @@ class TestOktaClient:
         assert members[2]["id"] == "user3"
 
 
+class TestParseNextLink:
+    """Test OktaClient._parse_next_link Link header parsing."""
+
+    @pytest.mark.parametrize(
+        "link_header,expected",
+        [
+            (
+                f'<{GROUPS_URL}?after=cursor>; rel="next", <{GROUPS_URL}>; rel="self"',
+                f"{GROUPS_URL}?after=cursor",
+            ),
+            (f'<{GROUPS_URL}>; rel="self"', None),
+            ("", None),
+        ],
+        ids=["next", "no_next", "empty"],
+    )
+    def test_parse_next_link(self, link_header: str, expected: Optional[str]) -> None:
+        """Test parsing of Link header."""
+        assert OktaClient._parse_next_link(link_header) == expected
+
+
 class TestOktaOAuthTokenManager:
     """Test OktaOAuthTokenManager class."""
 
@@ -352,8 +412,9 @@ class TestOktaOAuthTokenManager:
         assert manager.domain == "example.okta.com"
         assert manager.token_url == "https://example.okta.com/oauth2/v1/token"
 
-    @responses.activate
-    def test_get_access_token_success(self, oauth_manager: OktaOAuthTokenManager) -> None:
+    def test_get_access_token_success(
+        self, oauth_manager: OktaOAuthTokenManager, mocked_responses: responses.RequestsMock
+    ) -> None:
         """Test successful token acquisition."""
         mock_response = {
             "access_token": "test-access-token",
@@ -361,7 +422,7 @@ class TestOktaOAuthTokenManager:
             "expires_in": 3600,
         }
 
-        responses.add(
+        mocked_responses.add(
             responses.POST,
             "https://example.okta.com/oauth2/v1/token",
             json=mock_response,
@@ -371,12 +432,13 @@ class TestOktaOAuthTokenManager:
         token = oauth_manager.get_access_token()
         assert token == "test-access-token"
 
-    @responses.activate
-    def test_token_caching(self, oauth_manager: OktaOAuthTokenManager) -> None:
+    def test_token_caching(
+        self, oauth_manager: OktaOAuthTokenManager, mocked_responses: responses.RequestsMock
+    ) -> None:
         """Test that tokens are cached and reused."""
         mock_response = {"access_token": "cached-token", "token_type": "Bearer", "expires_in": 3600}
 
-        responses.add(
+        mocked_responses.add(
             responses.POST,
             "https://example.okta.com/oauth2/v1/token",
             json=mock_response,
@@ -386,20 +448,25 @@ class TestOktaOAuthTokenManager:
         # First call should fetch token
         token1 = oauth_manager.get_access_token()
         assert token1 == "cached-token"
-        assert len(responses.calls) == 1
+        assert len(mocked_responses.calls) == 1
 
         # Second call should use cached token
         token2 = oauth_manager.get_access_token()
         assert token2 == "cached-token"
-        assert len(responses.calls) == 1  # No additional API call
-
-    @responses.activate
-    def test_token_refresh_on_expiry(self, oauth_manager: OktaOAuthTokenManager) -> None:
+        assert len(mocked_responses.calls) == 1  # No additional API call
+
+    @mock.patch("src.okta_client.time.time")
+    def test_token_refresh_on_expiry(
+        self,
+        mock_time: mock.Mock,
+        oauth_manager: OktaOAuthTokenManager,
+        mocked_responses: responses.RequestsMock,
+    ) -> None:
         """Test that expired tokens are refreshed."""
         first_response = {
             "access_token": "first-token",
             "token_type": "Bearer",
-            "expires_in": 1,  # Expire in 1 second
+            "expires_in": 3600,
         }
         second_response = {
             "access_token": "second-token",
@@ -407,13 +474,13 @@ class TestOktaOAuthTokenManager:
             "expires_in": 3600,
         }
 
-        responses.add(
+        mocked_responses.add(
             responses.POST,
             "https://example.okta.com/oauth2/v1/token",
             json=first_response,
             status=200,
         )
-        responses.add(
+        mocked_responses.add(
             responses.POST,
             "https://example.okta.com/oauth2/v1/token",
             json=second_response,
@@ -421,41 +488,54 @@ class TestOktaOAuthTokenManager:
         )
 
         # Get initial token
+        mock_time.return_value = 1000.0
         token1 = oauth_manager.get_access_token()
         assert token1 == "first-token"
 
-        # Wait for token to expire (with 60s safety margin, it expires immediately)
-        time.sleep(0.1)
+        # Advance the clock past expiry instead of sleeping
+        mock_time.return_value = 1000.0 + 3600
 
         # Should get new token
         token2 = oauth_manager.get_access_token()
         assert token2 == "second-token"
-        assert len(responses.calls) == 2
-
-    @responses.activate
-    def test_authentication_error(self, oauth_manager: OktaOAuthTokenManager) -> None:
-        """Test OAuth authentication error handling."""
-        responses.add(
-            responses.POST,
-            "https://example.okta.com/oauth2/v1/token",
-            json={"error": "invalid_client", "error_description": "Invalid client credentials"},
-            status=401,
-        )
-
-        with pytest.raises(OktaAuthenticationError, match="OAuth authentication failed"):
-            oauth_manager.get_access_token()
-
-    @responses.activate
-    def test_api_error(self, oauth_manager: OktaOAuthTokenManager) -> None:
-        """Test generic OAuth API error handling."""
-        responses.add(
+        assert len(mocked_responses.calls) == 2
+
+    @pytest.mark.parametrize(
+        "status, body, exc, match",
+        [
+            (
+                401,
+                {"error": "invalid_client", "error_description": "Invalid client credentials"},
+                OktaAuthenticationError,
+                "OAuth authentication failed",
+            ),
+            (
+                500,
+                {"error": "server_error", "error_description": "Internal server error"},
+                OktaAPIError,
+                "OAuth token request failed 500",
+            ),
+        ],
+        ids=["401", "500"],
+    )
+    def test_token_error_mapping(
+        self,
+        oauth_manager: OktaOAuthTokenManager,
+        mocked_responses: responses.RequestsMock,
+        status: int,
+        body: Dict[str, str],
+        exc: Type[Exception],
+        match: str,
+    ) -> None:
+        """Test that token endpoint error statuses raise the matching exception."""
+        mocked_responses.add(
             responses.POST,
             "https://example.okta.com/oauth2/v1/token",
-            json={"error": "server_error", "error_description": "Internal server error"},
-            status=500,
+            json=body,
+            status=status,
         )
 
-        with pytest.raises(OktaAPIError, match="OAuth token request failed 500"):
+        with pytest.raises(exc, match=match):
             oauth_manager.get_access_token()
 
     def test_token_expiry_calculation(self, oauth_manager: OktaOAuthTokenManager) -> None:
@@ -471,8 +551,9 @@ class TestOktaOAuthTokenManager:
         oauth_manager._token_expiry = time.time() + 30
         assert oauth_manager._is_token_expired() is True  # Should refresh within 60s
 
-    @responses.activate
-    def test_thread_safety(self, oauth_manager: OktaOAuthTokenManager) -> None:
+    def test_thread_safety(
+        self, oauth_manager: OktaOAuthTokenManager, mocked_responses: responses.RequestsMock
+    ) -> None:
         """Test that token manager is thread-safe."""
         mock_response = {
             "access_token": "thread-safe-token",
@@ -480,7 +561,7 @@ class TestOktaOAuthTokenManager:
             "expires_in": 3600,
         }
 
-        responses.add(
+        mocked_responses.add(
             responses.POST,
             "https://example.okta.com/oauth2/v1/token",
             json=mock_response,
@@ -488,45 +569,29 @@ class TestOktaOAuthTokenManager:
         )
 
         # Simulate multiple threads requesting token simultaneously
-        import threading
-
-        results = []
-
-        def get_token() -> None:
-            results.append(oauth_manager.get_access_token())
-
-        threads = [threading.Thread(target=get_token) for _ in range(5)]
-        for thread in threads:
-            thread.start()
-        for thread in threads:
-            thread.join()
+        with ThreadPoolExecutor(max_workers=5) as executor:
+            futures = [executor.submit(oauth_manager.get_access_token) for _ in range(5)]
+            results = [future.result() for future in futures]
 
         # All threads should get the same token
         assert len(results) == 5
         assert all(token == "thread-safe-token" for token in results)
         # Should only have made one API call despite multiple threads
-        assert len(responses.calls) == 1
+        assert len(mocked_responses.calls) == 1
 
 
 class TestOktaClientWithOAuth:
     """Test OktaClient with OAuth authentication."""
 
     @pytest.fixture
-    def oauth_manager(self) -> OktaOAuthTokenManager:
-        """Create OAuth token manager fixture."""
-        manager = OktaOAuthTokenManager(
-            domain="example.okta.com",
-            client_id="test-client-id",
-            client_secret="test-client-secret",
-            scopes=["okta.groups.read", "okta.users.read"],
-        )
-        # Pre-set token to avoid actual OAuth calls in most tests
-        manager._access_token = "test-oauth-token"
-        manager._token_expiry = time.time() + 3600
+    def oauth_manager(self) -> mock.Mock:
+        """Create a stub OAuth token manager that always returns a valid token."""
+        manager = mock.Mock(spec=OktaOAuthTokenManager)
+        manager.get_access_token.return_value = "test-oauth-token"
         return manager
 
     @pytest.fixture
-    def oauth_client(self, oauth_manager: OktaOAuthTokenManager) -> OktaClient:
+    def oauth_client(self, oauth_manager: mock.Mock) -> OktaClient:
         """Create OktaClient with OAuth authentication."""
         return OktaClient(domain="example.okta.com", oauth_token_manager=oauth_manager)
 
@@ -542,62 +607,61 @@ class TestOktaClientWithOAuth:
         ):
             OktaClient(domain="example.okta.com")
 
-    def test_init_rejects_both_auth_methods(self) -> None:
+    def test_init_rejects_both_auth_methods(self, oauth_manager: mock.Mock) -> None:
         """Test that client rejects both auth methods."""
-        manager = OktaOAuthTokenManager(
-            domain="example.okta.com",
-            client_id="id",
-            client_secret="secret",
-            scopes=["okta.groups.read"],
-        )
         with pytest.raises(ValueError, match="Only one of api_token or oauth_token_manager"):
-            OktaClient(domain="example.okta.com", api_token="token", oauth_token_manager=manager)
+            OktaClient(
+                domain="example.okta.com", api_token="token", oauth_token_manager=oauth_manager
+            )
 
     def test_get_auth_header_with_oauth(self, oauth_client: OktaClient) -> None:
         """Test that OAuth client uses Bearer token."""
         header = oauth_client._get_auth_header()
         assert header == "Bearer test-oauth-token"
 
+    @pytest.mark.usefixtures("fast_session")
     def test_get_auth_header_with_api_token(self) -> None:
         """Test that API token client uses SSWS token."""
         client = OktaClient(domain="example.okta.com", api_token="test-api-token")
         header = client._get_auth_header()
         assert header == "SSWS test-api-token"
 
-    @responses.activate
-    def test_api_call_with_oauth(self, oauth_client: OktaClient) -> None:
+    def test_api_call_with_oauth(
+        self, oauth_client: OktaClient, mocked_responses: responses.RequestsMock
+    ) -> None:
         """Test that API calls use OAuth Bearer token."""
-        mock_response = [{"id": "00g123", "profile": {"name": "Engineering"}}]
-
-        responses.add(
-            responses.GET,
-            "https://example.okta.com/api/v1/groups",
-            json=mock_response,
-            status=200,
-        )
+        _add_groups(mocked_responses, [ENGINEERING_GROUP])
 
         group = oauth_client.get_group_by_name("Engineering")
         assert group["id"] == "00g123"
 
         # Verify Authorization header
-        assert len(responses.calls) == 1
-        assert responses.calls[0].request.headers["Authorization"] == "Bearer test-oauth-token"
+        assert len(mocked_responses.calls) == 1
+        assert (
+            mocked_responses.calls[0].request.headers["Authorization"] == "Bearer test-oauth-token"
+        )
 
-    @responses.activate
     @mock.patch("time.time")
     def test_token_refresh_during_api_call(
-        self, mock_time: mock.Mock, oauth_manager: OktaOAuthTokenManager
+        self, mock_time: mock.Mock, mocked_responses: responses.RequestsMock
     ) -> None:
         """Test that expired tokens are refreshed during API calls."""
-        # Create client with OAuth manager
+        # Exercise the real refresh path rather than the stubbed manager
+        oauth_manager = OktaOAuthTokenManager(
+            domain="example.okta.com",
+            client_id="test-client-id",
+            client_secret="test-client-secret",
+            scopes=["okta.groups.read", "okta.users.read"],
+        )
         client = OktaClient(domain="example.okta.com", oauth_token_manager=oauth_manager)
 
         # Set token as expired
+        oauth_manager._access_token = "test-oauth-token"
         oauth_manager._token_expiry = 1000.0  # Old timestamp
         mock_time.return_value = 2000.0  # Current time
 
         # Mock OAuth token refresh
-        responses.add(
+        mocked_responses.add(
             responses.POST,
             "https://example.okta.com/oauth2/v1/token",
             json={"access_token": "refreshed-token", "token_type": "Bearer", "expires_in": 3600},
@@ -605,17 +669,14 @@ class TestOktaClientWithOAuth:
         )
 
         # Mock API call
-        responses.add(
-            responses.GET,
-            "https://example.okta.com/api/v1/groups",
-            json=[{"id": "00g123", "profile": {"name": "Test"}}],
-            status=200,
-        )
+        _add_groups(mocked_responses, [{"id": "00g123", "profile": {"name": "Test"}}])
 
         # Make API call - should trigger token refresh
         client.get_group_by_name("Test")
 
         # Should have refreshed token and used it
-        assert len(responses.calls) == 2  # Token refresh + API call
-        assert responses.calls[0].request.url.endswith("/oauth2/v1/token")
-        assert responses.calls[1].request.headers["Authorization"] == "Bearer refreshed-token"
+        assert len(mocked_responses.calls) == 2  # Token refresh + API call
+        assert mocked_responses.calls[0].request.url.endswith("/oauth2/v1/token")
+        assert (
+            mocked_responses.calls[1].request.headers["Authorization"] == "Bearer refreshed-token"
+        )
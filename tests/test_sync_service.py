@@ -1,23 +1,28 @@
 """Tests for sync service."""
-from unittest.mock import MagicMock, Mock
+import logging
+from typing import List
+from unittest.mock import Mock, patch
 
 import pytest
 
-from src.grafana_client import GrafanaAPIError
-from src.okta_client import OktaAPIError
-from src.sync_service import SyncMetrics, SyncService
+from src.grafana_client import GrafanaAPIError, GrafanaClient
+from src.okta_client import OktaAPIError, OktaClient
+from src.sync_service import SyncMetrics, SyncService, get_highest_role
 
 
 @pytest.fixture
 def mock_okta_client() -> Mock:
-    """Create mock Okta client."""
-    return MagicMock()
+    """Create mock Okta client limited to the OktaClient interface."""
+    return Mock(spec=OktaClient)
 
 
 @pytest.fixture
 def mock_grafana_client() -> Mock:
-    """Create mock Grafana client."""
-    return MagicMock()
+    """Create mock Grafana client limited to the GrafanaClient interface."""
+    client = Mock(spec=GrafanaClient)
+    # No org users unless a test provides them
+    client.get_org_users.return_value = []
+    return client
 
 
 @pytest.fixture
@@ -40,6 +45,26 @@ def sync_service_dry_run(mock_okta_client: Mock, mock_grafana_client: Mock) -> S
     )
 
 
+class TestGetHighestRole:
+    """Test get_highest_role function."""
+
+    @pytest.mark.parametrize(
+        "role1, role2, expected",
+        [
+            ("Admin", "Viewer", "Admin"),
+            ("Viewer", "Admin", "Admin"),
+            ("Editor", "Viewer", "Editor"),
+            ("Viewer", "Editor", "Editor"),
+            ("Editor", "Editor", "Editor"),
+            ("Unknown", "Viewer", "Viewer"),
+            ("Editor", "Unknown", "Editor"),
+        ],
+    )
+    def test_highest_role(self, role1: str, role2: str, expected: str) -> None:
+        """Test role comparison for known and unknown roles."""
+        assert get_highest_role(role1, role2) == expected
+
+
 class TestSyncMetrics:
     """Test SyncMetrics dataclass."""
 
@@ -59,6 +84,13 @@ class TestSyncMetrics:
         assert metrics.errors == 1
         assert metrics.duration_seconds == 10.5
 
+    def test_uses_slots(self) -> None:
+        """Test that SyncMetrics instances have no per-instance __dict__."""
+        metrics = SyncMetrics()
+        assert not hasattr(metrics, "__dict__")
+        with pytest.raises(AttributeError):
+            metrics.unknown_counter = 1  # type: ignore[attr-defined]
+
 
 class TestSyncService:
     """Test SyncService class."""
@@ -70,165 +102,155 @@ class TestSyncService:
         assert service.grafana_client == mock_grafana_client
         assert service.dry_run is True
 
-    def test_sync_with_users_to_add(
+    @pytest.mark.parametrize(
+        "okta_users, grafana_users, expected_added, expected_removed",
+        [
+            pytest.param([1, 2], [], [1, 2], [], id="add"),
+            pytest.param([], [1, 2], [], [1, 2], id="remove"),
+            pytest.param([1, 2], [3], [1, 2], [3], id="add_and_remove"),
+            pytest.param([1, 2], [1, 2], [], [], id="no_changes"),
+            pytest.param([], [], [], [], id="empty"),
+        ],
+    )
+    def test_sync_diff(
         self,
         sync_service: SyncService,
         mock_okta_client: Mock,
         mock_grafana_client: Mock,
+        okta_users: List[int],
+        grafana_users: List[int],
+        expected_added: List[int],
+        expected_removed: List[int],
     ) -> None:
-        """Test sync when users need to be added."""
-        # Setup Okta members
+        """Test that the Okta/Grafana membership diff adds and removes the right users."""
+        # User n has email user<n>@example.com and Grafana user ID 100 + n
         mock_okta_client.get_group_members_by_name.return_value = [
-            {"profile": {"email": "user1@example.com"}},
-            {"profile": {"email": "user2@example.com"}},
+            {"profile": {"email": f"user{n}@example.com"}} for n in okta_users
         ]
-
-        # Setup Grafana team
-        mock_grafana_client.get_or_create_team.return_value = {
-            "id": 1,
-            "name": "Engineers",
-        }
-
-        # Setup Grafana members (empty team)
-        mock_grafana_client.get_team_members.return_value = []
-
-        # Setup user lookup (users already exist from Okta auto-provisioning)
-        mock_grafana_client.get_user_by_email.side_effect = [
-            {"id": 101, "email": "user1@example.com"},
-            {"id": 102, "email": "user2@example.com"},
+        mock_grafana_client.get_or_create_team.return_value = {"id": 1, "name": "Engineers"}
+        mock_grafana_client.get_team_members.return_value = [
+            {"userId": 100 + n, "email": f"user{n}@example.com"} for n in grafana_users
+        ]
+        # Users already exist in Grafana from Okta auto-provisioning
+        mock_grafana_client.get_org_users.return_value = [
+            {"userId": 100 + n, "email": f"user{n}@example.com", "role": "Viewer"}
+            for n in range(1, 4)
         ]
 
-        # Execute sync
         metrics = sync_service.sync_group_to_team("Engineering", "Engineers")
 
-        # Verify metrics
-        assert metrics.users_added == 2
-        assert metrics.users_removed == 0
+        assert metrics.users_added == len(expected_added)
+        assert metrics.users_removed == len(expected_removed)
         assert metrics.errors == 0
-        assert metrics.duration_seconds > 0
 
-        # Verify API calls
         mock_okta_client.get_group_members_by_name.assert_called_once_with("Engineering")
         mock_grafana_client.get_or_create_team.assert_called_once_with("Engineers")
-        assert mock_grafana_client.get_user_by_email.call_count == 2
-        assert mock_grafana_client.add_user_to_team.call_count == 2
+        added = sorted(c.args for c in mock_grafana_client.add_user_to_team.call_args_list)
+        removed = sorted(c.args for c in mock_grafana_client.remove_user_from_team.call_args_list)
+        assert added == [(1, 100 + n) for n in expected_added]
+        assert removed == [(1, 100 + n) for n in expected_removed]
+        mock_grafana_client.get_user_by_email.assert_not_called()
 
-    def test_sync_with_users_to_remove(
+    def test_sync_add_skips_users_missing_from_org_list(
         self,
         sync_service: SyncService,
         mock_okta_client: Mock,
         mock_grafana_client: Mock,
     ) -> None:
-        """Test sync when users need to be removed."""
-        # Setup Okta members (empty group)
-        mock_okta_client.get_group_members_by_name.return_value = []
-
-        # Setup Grafana team
-        mock_grafana_client.get_or_create_team.return_value = {
-            "id": 1,
-            "name": "Engineers",
-        }
-
-        # Setup Grafana members
-        mock_grafana_client.get_team_members.return_value = [
-            {"userId": 101, "email": "user1@example.com"},
-            {"userId": 102, "email": "user2@example.com"},
+        """Test that new members resolve from one org user fetch and misses are skipped."""
+        mock_okta_client.get_group_members_by_name.return_value = [
+            {"profile": {"email": f"user{i}@example.com"}} for i in range(4)
+        ]
+        mock_grafana_client.get_or_create_team.return_value = {"id": 1, "name": "Engineers"}
+        mock_grafana_client.get_team_members.return_value = []
+        # user3 has never logged in to Grafana
+        mock_grafana_client.get_org_users.return_value = [
+            {"userId": 100 + i, "email": f"USER{i}@example.com"} for i in range(3)
         ]
 
-        # Execute sync
         metrics = sync_service.sync_group_to_team("Engineering", "Engineers")
 
-        # Verify metrics
-        assert metrics.users_added == 0
-        assert metrics.users_removed == 2
+        assert metrics.users_added == 3
         assert metrics.errors == 0
-        assert metrics.duration_seconds > 0
+        mock_grafana_client.get_org_users.assert_called_once()
+        mock_grafana_client.get_user_by_email.assert_not_called()
+        added = sorted(c.args for c in mock_grafana_client.add_user_to_team.call_args_list)
+        assert added == [(1, 100), (1, 101), (1, 102)]
 
-        # Verify API calls
-        assert mock_grafana_client.remove_user_from_team.call_count == 2
-        mock_grafana_client.remove_user_from_team.assert_any_call(1, 101)
-        mock_grafana_client.remove_user_from_team.assert_any_call(1, 102)
-
-    def test_sync_with_both_add_and_remove(
+    def test_sync_add_looks_up_users_when_org_fetch_fails(
         self,
         sync_service: SyncService,
         mock_okta_client: Mock,
         mock_grafana_client: Mock,
     ) -> None:
-        """Test sync with both additions and removals."""
-        # Setup Okta members
+        """Test that new members are looked up one by one when the org user fetch fails."""
         mock_okta_client.get_group_members_by_name.return_value = [
-            {"profile": {"email": "user1@example.com"}},
-            {"profile": {"email": "user2@example.com"}},
+            {"profile": {"email": f"user{i}@example.com"}} for i in range(2)
         ]
+        mock_grafana_client.get_or_create_team.return_value = {"id": 1, "name": "Engineers"}
+        mock_grafana_client.get_team_members.return_value = []
+        mock_grafana_client.get_org_users.side_effect = GrafanaAPIError("boom")
+        mock_grafana_client.get_user_by_email.side_effect = lambda email: (
+            {"id": 101, "email": email} if email == "user1@example.com" else None
+        )
 
-        # Setup Grafana team
-        mock_grafana_client.get_or_create_team.return_value = {
-            "id": 1,
-            "name": "Engineers",
-        }
+        metrics = sync_service.sync_group_to_team("Engineering", "Engineers")
 
-        # Setup Grafana members (user3 should be removed)
+        assert metrics.users_added == 1
+        assert metrics.errors == 0
+        assert mock_grafana_client.get_user_by_email.call_count == 2
+        mock_grafana_client.add_user_to_team.assert_called_once_with(1, 101)
+
+    def test_sync_concurrent_workers(
+        self,
+        mock_okta_client: Mock,
+        mock_grafana_client: Mock,
+    ) -> None:
+        """Test that add/remove operations produce the same results with a thread pool."""
+        service = SyncService(mock_okta_client, mock_grafana_client, max_workers=4)
+        mock_okta_client.get_group_members_by_name.return_value = [
+            {"profile": {"email": f"user{i}@example.com"}} for i in range(10)
+        ]
+        mock_grafana_client.get_or_create_team.return_value = {"id": 1, "name": "Engineers"}
         mock_grafana_client.get_team_members.return_value = [
-            {"userId": 103, "email": "user3@example.com"},
+            {"userId": 200 + i, "email": f"old{i}@example.com"} for i in range(5)
         ]
-
-        # Setup user creation
-        mock_grafana_client.get_or_create_user.side_effect = [
-            {"id": 101, "email": "user1@example.com"},
-            {"id": 102, "email": "user2@example.com"},
+        mock_grafana_client.get_org_users.return_value = [
+            {"userId": i, "email": f"user{i}@example.com"} for i in range(10)
         ]
 
-        # Execute sync
-        metrics = sync_service.sync_group_to_team("Engineering", "Engineers")
+        metrics = service.sync_group_to_team("Engineering", "Engineers")
 
-        # Verify metrics
-        assert metrics.users_added == 2
-        assert metrics.users_removed == 1
+        assert metrics.users_added == 10
+        assert metrics.users_removed == 5
         assert metrics.errors == 0
+        assert mock_grafana_client.add_user_to_team.call_count == 10
+        assert mock_grafana_client.remove_user_from_team.call_count == 5
 
-        # Verify add operations
-        assert mock_grafana_client.add_user_to_team.call_count == 2
-
-        # Verify remove operations
-        mock_grafana_client.remove_user_from_team.assert_called_once_with(1, 103)
-
-    def test_sync_no_changes_idempotent(
+    def test_sync_logs_single_summary(
         self,
         sync_service: SyncService,
         mock_okta_client: Mock,
         mock_grafana_client: Mock,
+        caplog: pytest.LogCaptureFixture,
     ) -> None:
-        """Test sync with no changes (idempotent)."""
-        # Setup Okta members
+        """Test that added users are reported in one summary line, not per user."""
         mock_okta_client.get_group_members_by_name.return_value = [
-            {"profile": {"email": "user1@example.com"}},
-            {"profile": {"email": "user2@example.com"}},
+            {"profile": {"email": f"user{i:02d}@example.com"}} for i in range(25)
         ]
-
-        # Setup Grafana team
-        mock_grafana_client.get_or_create_team.return_value = {
-            "id": 1,
-            "name": "Engineers",
-        }
-
-        # Setup Grafana members (already in sync)
-        mock_grafana_client.get_team_members.return_value = [
-            {"userId": 101, "email": "user1@example.com"},
-            {"userId": 102, "email": "user2@example.com"},
+        mock_grafana_client.get_or_create_team.return_value = {"id": 1, "name": "Engineers"}
+        mock_grafana_client.get_team_members.return_value = []
+        mock_grafana_client.get_org_users.return_value = [
+            {"userId": 100 + i, "email": f"user{i:02d}@example.com"} for i in range(25)
         ]
 
-        # Execute sync
-        metrics = sync_service.sync_group_to_team("Engineering", "Engineers")
-
-        # Verify metrics
-        assert metrics.users_added == 0
-        assert metrics.users_removed == 0
-        assert metrics.errors == 0
+        with caplog.at_level(logging.INFO, logger="src.sync_service"):
+            sync_service.sync_group_to_team("Engineering", "Engineers")
 
-        # Verify no modifications
-        mock_grafana_client.add_user_to_team.assert_not_called()
-        mock_grafana_client.remove_user_from_team.assert_not_called()
+        added_lines = [r.getMessage() for r in caplog.records if "Added" in r.getMessage()]
+        assert len(added_lines) == 1
+        assert added_lines[0].startswith("Added users to team Engineers (25 users): user00@")
+        assert added_lines[0].endswith("and 5 more")
 
     def test_sync_dry_run_mode(
         self,
@@ -252,6 +274,9 @@ class TestSyncService:
         mock_grafana_client.get_team_members.return_value = [
             {"userId": 102, "email": "user2@example.com"},
         ]
+        mock_grafana_client.get_org_users.return_value = [
+            {"userId": 101, "email": "user1@example.com"},
+        ]
 
         # Execute sync in dry-run mode
         metrics = sync_service_dry_run.sync_group_to_team("Engineering", "Engineers")
@@ -266,6 +291,23 @@ class TestSyncService:
         mock_grafana_client.add_user_to_team.assert_not_called()
         mock_grafana_client.remove_user_from_team.assert_not_called()
 
+    def test_sync_dry_run_skips_thread_pool_for_local_steps(
+        self, mock_okta_client: Mock, mock_grafana_client: Mock
+    ) -> None:
+        """Test that dry-run removals, which make no API calls, run without worker threads."""
+        service = SyncService(mock_okta_client, mock_grafana_client, dry_run=True, max_workers=4)
+        mock_okta_client.get_group_members_by_name.return_value = []
+        mock_grafana_client.get_or_create_team.return_value = {"id": 1, "name": "Engineers"}
+        mock_grafana_client.get_team_members.return_value = [
+            {"userId": 100 + i, "email": f"user{i}@example.com"} for i in range(5)
+        ]
+
+        with patch("src.sync_service.ThreadPoolExecutor") as executor:
+            metrics = service.sync_group_to_team("Engineering", "Engineers")
+
+        assert metrics.users_removed == 5
+        executor.assert_not_called()
+
     def test_sync_case_insensitive_email_matching(
         self,
         sync_service: SyncService,
@@ -352,13 +394,16 @@ class TestSyncService:
         # Setup Grafana members (empty)
         mock_grafana_client.get_team_members.return_value = []
 
-        # Setup user lookup (user2 fails)
-        def get_user_side_effect(email: str):
-            if email == "user2@example.com":
-                raise GrafanaAPIError("User lookup failed")
-            return {"id": 101, "email": email}
+        mock_grafana_client.get_org_users.return_value = [
+            {"userId": 100 + i, "email": f"user{i}@example.com"} for i in range(1, 4)
+        ]
+
+        # Setup team add (user2 fails)
+        def add_user_side_effect(team_id: int, user_id: int) -> None:
+            if user_id == 102:
+                raise GrafanaAPIError("Add to team failed")
 
-        mock_grafana_client.get_user_by_email.side_effect = get_user_side_effect
+        mock_grafana_client.add_user_to_team.side_effect = add_user_side_effect
 
         # Execute sync
         metrics = sync_service.sync_group_to_team("Engineering", "Engineers")
@@ -368,8 +413,8 @@ class TestSyncService:
         assert metrics.users_removed == 0
         assert metrics.errors == 1  # user2 failed
 
-        # Verify add_user_to_team was called only for successful users
-        assert mock_grafana_client.add_user_to_team.call_count == 2
+        # Verify add_user_to_team was attempted for every user
+        assert mock_grafana_client.add_user_to_team.call_count == 3
 
     def test_sync_partial_failure_remove_users(
         self,
@@ -427,30 +472,6 @@ class TestSyncService:
         # Verify duration is tracked
         assert metrics.duration_seconds > 0
 
-    def test_sync_empty_okta_group(
-        self,
-        sync_service: SyncService,
-        mock_okta_client: Mock,
-        mock_grafana_client: Mock,
-    ) -> None:
-        """Test sync with empty Okta group."""
-        # Setup empty Okta group
-        mock_okta_client.get_group_members_by_name.return_value = []
-
-        # Setup Grafana team
-        mock_grafana_client.get_or_create_team.return_value = {"id": 1, "name": "Engineers"}
-
-        # Setup empty Grafana team
-        mock_grafana_client.get_team_members.return_value = []
-
-        # Execute sync
-        metrics = sync_service.sync_group_to_team("Engineering", "Engineers")
-
-        # Verify no operations
-        assert metrics.users_added == 0
-        assert metrics.users_removed == 0
-        assert metrics.errors == 0
-
     def test_sync_creates_team_if_not_exists(
         self,
         sync_service: SyncService,
@@ -476,6 +497,55 @@ class TestSyncService:
         # Verify team creation was called
         mock_grafana_client.get_or_create_team.assert_called_once_with("NewTeam")
 
+    def test_update_user_roles(
+        self,
+        sync_service: SyncService,
+        mock_grafana_client: Mock,
+    ) -> None:
+        """Test that only changed roles are updated, from a single user list fetch."""
+        mock_grafana_client.get_org_users.return_value = [
+            {"userId": 1, "email": "User1@example.com", "role": "Viewer"},
+            {"userId": 2, "email": "user2@example.com", "role": "Editor"},
+        ]
+
+        roles_updated = sync_service.update_user_roles(
+            {
+                "user1@example.com": "Admin",
+                "user2@example.com": "Editor",
+                "missing@example.com": "Viewer",
+            }
+        )
+
+        assert roles_updated == 1
+        mock_grafana_client.get_org_users.assert_called_once()
+        mock_grafana_client.update_user_role.assert_called_once_with(1, "Admin")
+
+    def test_update_user_roles_dry_run(
+        self,
+        sync_service_dry_run: SyncService,
+        mock_grafana_client: Mock,
+    ) -> None:
+        """Test role updates in dry-run mode."""
+        mock_grafana_client.get_org_users.return_value = [
+            {"userId": 1, "email": "user1@example.com", "role": "Viewer"},
+        ]
+
+        roles_updated = sync_service_dry_run.update_user_roles({"user1@example.com": "Editor"})
+
+        assert roles_updated == 1
+        mock_grafana_client.update_user_role.assert_not_called()
+
+    def test_update_user_roles_fetch_error(
+        self,
+        sync_service: SyncService,
+        mock_grafana_client: Mock,
+    ) -> None:
+        """Test role updates are skipped when Grafana users cannot be fetched."""
+        mock_grafana_client.get_org_users.side_effect = GrafanaAPIError("boom")
+
+        assert sync_service.update_user_roles({"user1@example.com": "Editor"}) == 0
+        mock_grafana_client.update_user_role.assert_not_called()
+
     def test_sync_admin_privileges_grant_and_revoke(
         self,
         sync_service: SyncService,
@@ -489,28 +559,24 @@ class TestSyncService:
             {"profile": {"email": "admin2@example.com"}},
         ]
 
-        # Mock the _get method to return all Grafana users
-        class MockResponse:
-            def json(self):
-                return [
-                    {
-                        "userId": 1,
-                        "email": "admin1@example.com",
-                        "isGrafanaAdmin": False,  # Needs to be granted
-                    },
-                    {
-                        "userId": 2,
-                        "email": "admin2@example.com",
-                        "isGrafanaAdmin": True,  # Already admin
-                    },
-                    {
-                        "userId": 3,
-                        "email": "user@example.com",
-                        "isGrafanaAdmin": True,  # Needs to be revoked
-                    },
-                ]
-
-        mock_grafana_client._get.return_value = MockResponse()
+        # Setup all Grafana org users
+        mock_grafana_client.get_org_users.return_value = [
+            {
+                "userId": 1,
+                "email": "admin1@example.com",
+                "isGrafanaAdmin": False,  # Needs to be granted
+            },
+            {
+                "userId": 2,
+                "email": "admin2@example.com",
+                "isGrafanaAdmin": True,  # Already admin
+            },
+            {
+                "userId": 3,
+                "email": "user@example.com",
+                "isGrafanaAdmin": True,  # Needs to be revoked
+            },
+        ]
 
         # Execute admin sync
         admins_updated = sync_service.sync_admin_privileges(["Grafana-Admins"])
@@ -538,7 +604,7 @@ class TestSyncService:
         # Verify no API calls made
         assert admins_updated == 0
         mock_okta_client.get_group_members_by_name.assert_not_called()
-        mock_grafana_client._get.assert_not_called()
+        mock_grafana_client.get_org_users.assert_not_called()
 
     def test_sync_admin_privileges_multiple_groups(
         self,
@@ -562,14 +628,10 @@ class TestSyncService:
         mock_okta_client.get_group_members_by_name.side_effect = get_group_members_side_effect
 
         # Mock Grafana users
-        class MockResponse:
-            def json(self):
-                return [
-                    {"userId": 1, "email": "admin1@example.com", "isGrafanaAdmin": False},
-                    {"userId": 2, "email": "admin2@example.com", "isGrafanaAdmin": False},
-                ]
-
-        mock_grafana_client._get.return_value = MockResponse()
+        mock_grafana_client.get_org_users.return_value = [
+            {"userId": 1, "email": "admin1@example.com", "isGrafanaAdmin": False},
+            {"userId": 2, "email": "admin2@example.com", "isGrafanaAdmin": False},
+        ]
 
         # Execute admin sync with multiple groups
         admins_updated = sync_service.sync_admin_privileges(["Grafana-Admins", "Platform-Team"])
@@ -581,6 +643,88 @@ class TestSyncService:
         assert admins_updated == 2
         assert mock_grafana_client.set_user_admin_permission.call_count == 2
 
+    def test_sync_admin_privileges_dedupes_duplicate_groups(
+        self,
+        sync_service: SyncService,
+        mock_okta_client: Mock,
+        mock_grafana_client: Mock,
+    ) -> None:
+        """Test that a user in several admin groups gets a single permission update."""
+        mock_okta_client.get_group_members_by_name.return_value = [
+            {"profile": {"email": "Admin1@example.com"}}
+        ]
+        mock_grafana_client.get_org_users.return_value = [
+            {"userId": 1, "email": "admin1@example.com", "isGrafanaAdmin": False}
+        ]
+
+        admins_updated = sync_service.sync_admin_privileges(["Admins", "Platform", "SRE"])
+
+        assert admins_updated == 1
+        mock_grafana_client.set_user_admin_permission.assert_called_once_with(1, True)
+
+    def test_sync_admin_privileges_group_fetch_error(
+        self, mock_okta_client: Mock, mock_grafana_client: Mock
+    ) -> None:
+        """Test that one failing admin group does not block the others when fetched concurrently."""
+        service = SyncService(mock_okta_client, mock_grafana_client, max_workers=4)
+
+        def get_group_members_side_effect(group_name: str):
+            if group_name == "Broken-Group":
+                raise OktaAPIError("boom")
+            return [{"profile": {"email": f"{group_name.lower()}@example.com"}}]
+
+        mock_okta_client.get_group_members_by_name.side_effect = get_group_members_side_effect
+        mock_grafana_client.get_org_users.return_value = [
+            {"userId": 1, "email": "admins@example.com", "isGrafanaAdmin": False},
+            {"userId": 2, "email": "platform@example.com", "isGrafanaAdmin": False},
+        ]
+
+        admins_updated = service.sync_admin_privileges(["Admins", "Broken-Group", "Platform"])
+
+        assert admins_updated == 2
+        assert mock_okta_client.get_group_members_by_name.call_count == 3
+        mock_grafana_client.set_user_admin_permission.assert_any_call(1, True)
+        mock_grafana_client.set_user_admin_permission.assert_any_call(2, True)
+
+    def test_sync_admin_privileges_concurrent_updates(
+        self, mock_okta_client: Mock, mock_grafana_client: Mock
+    ) -> None:
+        """Test that admin changes run on the thread pool and failures are not counted."""
+        service = SyncService(mock_okta_client, mock_grafana_client, max_workers=4)
+        mock_okta_client.get_group_members_by_name.return_value = [
+            {"profile": {"email": f"admin{i}@example.com"}} for i in range(6)
+        ]
+        mock_grafana_client.get_org_users.return_value = [
+            {"userId": i, "email": f"admin{i}@example.com", "isGrafanaAdmin": False}
+            for i in range(6)
+        ] + [{"userId": 99, "email": "former@example.com", "isGrafanaAdmin": True}]
+
+        def set_admin_side_effect(user_id: int, is_admin: bool) -> dict:
+            if user_id == 3:
+                raise GrafanaAPIError("boom")
+            return {"message": "ok"}
+
+        mock_grafana_client.set_user_admin_permission.side_effect = set_admin_side_effect
+
+        admins_updated = service.sync_admin_privileges(["Grafana-Admins"])
+
+        assert admins_updated == 6  # 5 grants + 1 revoke; user 3 failed
+        assert mock_grafana_client.set_user_admin_permission.call_count == 7
+        mock_grafana_client.set_user_admin_permission.assert_any_call(99, False)
+
+    def test_sync_admin_privileges_skips_user_scan_when_okta_unavailable(
+        self,
+        sync_service: SyncService,
+        mock_okta_client: Mock,
+        mock_grafana_client: Mock,
+    ) -> None:
+        """Test that no Grafana users are fetched or revoked when every admin group fails."""
+        mock_okta_client.get_group_members_by_name.side_effect = OktaAPIError("down")
+
+        assert sync_service.sync_admin_privileges(["Grafana-Admins", "Platform-Team"]) == 0
+        mock_grafana_client.get_org_users.assert_not_called()
+        mock_grafana_client.set_user_admin_permission.assert_not_called()
+
     def test_sync_admin_privileges_dry_run(
         self,
         sync_service_dry_run: SyncService,
@@ -594,11 +738,9 @@ class TestSyncService:
         ]
 
         # Mock Grafana users
-        class MockResponse:
-            def json(self):
-                return [{"userId": 1, "email": "admin@example.com", "isGrafanaAdmin": False}]
-
-        mock_grafana_client._get.return_value = MockResponse()
+        mock_grafana_client.get_org_users.return_value = [
+            {"userId": 1, "email": "admin@example.com", "isGrafanaAdmin": False}
+        ]
 
         # Execute admin sync in dry-run mode
         admins_updated = sync_service_dry_run.sync_admin_privileges(["Grafana-Admins"])
@@ -606,3 +748,38 @@ class TestSyncService:
         # Verify result counted but no actual changes made
         assert admins_updated == 1
         mock_grafana_client.set_user_admin_permission.assert_not_called()
+
+    def test_sync_admin_privileges_reuses_cached_users(
+        self,
+        sync_service: SyncService,
+        mock_okta_client: Mock,
+        mock_grafana_client: Mock,
+    ) -> None:
+        """Test that org users fetched within the TTL are reused with applied changes."""
+        mock_okta_client.get_group_members_by_name.return_value = [
+            {"profile": {"email": "admin@example.com"}}
+        ]
+        mock_grafana_client.get_org_users.return_value = [
+            {"userId": 1, "email": "admin@example.com", "role": "Viewer", "isGrafanaAdmin": False}
+        ]
+
+        assert sync_service.update_user_roles({"admin@example.com": "Editor"}) == 1
+        assert sync_service.sync_admin_privileges(["Grafana-Admins"]) == 1
+        # The cached list already reflects the grant, so nothing is left to change
+        assert sync_service.sync_admin_privileges(["Grafana-Admins"]) == 0
+
+        mock_grafana_client.get_org_users.assert_called_once()
+        mock_grafana_client.set_user_admin_permission.assert_called_once_with(1, True)
+
+    def test_sync_admin_privileges_refetches_after_ttl(
+        self, mock_okta_client: Mock, mock_grafana_client: Mock
+    ) -> None:
+        """Test that org users are fetched again once the cache TTL has passed."""
+        service = SyncService(mock_okta_client, mock_grafana_client, org_users_ttl=0)
+        mock_okta_client.get_group_members_by_name.return_value = []
+        mock_grafana_client.get_org_users.return_value = []
+
+        service.sync_admin_privileges(["Grafana-Admins"])
+        service.sync_admin_privileges(["Grafana-Admins"])
+
+        assert mock_grafana_client.get_org_users.call_count == 2